@@ -1,22 +1,48 @@
- 
-from .conversions import to_ec, to_gc
- 
-from .bahire_hasab import get_bahire_hasab
- 
-from .constants import HolidayTags, MONTH_NAMES
-
-__all__ = [
-    'Kenat',
-    'to_ec',
-    'to_gc',
-    'to_arabic',
-    'to_geez',
-    'get_holidays_in_month',
-    'get_holidays_for_year',
-    'get_bahire_hasab',
-    'MonthGrid',
-    'Time',
-    'get_holiday',
-    'HolidayTags',
-    'MONTH_NAMES',
-]
+"""
+Ethiopian calendar toolkit: conversions, Bahire Hasab and holidays.
+
+Importing the package loads no submodules. Each public name is imported from
+its submodule the first time it is accessed, so `import` stays cheap for CLI
+and serverless cold starts and only the code actually used is loaded.
+"""
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'Kenat': 'kenat',
+    'to_ec': 'conversions',
+    'to_gc': 'conversions',
+    'get_bahire_hasab': 'bahire_hasab',
+    'get_holidays_in_month': 'holidays',
+    'get_holidays_for_year': 'holidays',
+    'get_holiday': 'holidays',
+    'MonthGrid': 'month_grid',
+    'to_geez': 'geez',
+    'to_arabic': 'geez',
+    'Time': 'ethiopian_time',
+    'HolidayTags': 'constants',
+    'MONTH_NAMES': 'constants',
+}
+
+_SUBMODULES = frozenset({
+    'bahire_hasab', 'bulk_convert', 'cache', 'columnar', 'constants', 'conversions',
+    'day_arithmetic', 'ethiopian_time', 'exceptions', 'geez', 'holidays', 'kenat', 'month_grid', 'utils',
+})
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
@@ -1,13 +1,20 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
+from typing import Optional
+import hashlib
+import json
 import os
 
-# --- Internal Imports (Assuming these files exist in your directory) ---
-from bahire_hasab import get_bahire_hasab
-from conversions import to_gc
-from constants import *
+# --- Package Imports (run with: uvicorn <package>.app:app) ---
+from .bahire_hasab import get_bahire_hasab, bahire_hasab_cache_info
+from .kenat import Kenat
+from .month_grid import MonthGrid, month_grid_cache_info
+from .holidays import holiday_cache_info
+from .cache import LRUCache
+from .constants import *
 
 app = FastAPI(title="Ethiopian Calendar API (Full Bahire Hasab)")
 
@@ -21,84 +28,140 @@ app.add_middleware(
 )
 
 # --- 2. MOUNT STATIC FILES ---
-# This allows the browser to load images from your "assest" folder
+# This allows the browser to load images from the package's "assest" folder
 # Example: http://127.0.0.1:8000/assest/meskel.png
-if not os.path.exists("assest"):
-    os.makedirs("assest")
-app.mount("/assest", StaticFiles(directory="assest"), name="assest")
+ASSET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assest")
+if not os.path.exists(ASSET_DIR):
+    os.makedirs(ASSET_DIR)
+app.mount("/assest", StaticFiles(directory=ASSET_DIR), name="assest")
 
 # Pydantic models for input
 class EthiopianDate(BaseModel):
     year: int
     month: int
     day: int
+    include: Optional[str] = None  # Comma-separated CONVERT_FIELDS, see below
 
 class MonthRequest(BaseModel):
     year: int
     month_idx: int  # 0-based index for month (0 = Meskerem)
 
-# Endpoint: Convert Ethiopian date to Gregorian and weekday
-@app.post("/convert")
-async def convert_date(date_in: EthiopianDate):
+# --- 3. RESPONSE CACHE ---
+# /convert and /month are pure functions of their inputs, so each response is
+# serialized once and kept as bytes with a strong ETag. GET requests can then be
+# cached by browsers and proxies, and revalidated with If-None-Match (304).
+RESPONSE_CACHE_SIZE = 2048
+CACHE_CONTROL = "public, max-age=604800"
+
+_response_cache = LRUCache(RESPONSE_CACHE_SIZE)
+
+def _serialize(build, *args):
+    """Builds a payload and returns (body bytes, strong ETag), encoded as FastAPI's JSONResponse does."""
+    body = json.dumps(jsonable_encoder(build(*args)), ensure_ascii=False, allow_nan=False,
+                      separators=(",", ":")).encode("utf-8")
+    return body, '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+def _etag_matches(if_none_match, etag):
+    """If-None-Match uses the weak comparison: any listed tag (W/ ignored) or '*' matches."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+def _cached_response(request, key, build, *args):
+    """
+    Serves a payload from the response cache. Build errors are not cached and
+    become a 400, as before. Only GET responses carry caching headers.
+    """
     try:
-        gc_date = to_gc(date_in.year, date_in.month, date_in.day)
-        bahir = get_bahire_hasab(date_in.year)
-        weekday = DAYS_OF_WEEK["english"][gc_date.weekday()]
-        return {
-            "ethiopian": f"{date_in.day} {MONTH_NAMES['english'][date_in.month-1]} {date_in.year}",
-            "gregorian": gc_date.strftime("%B %d, %Y"), # Matches Tkinter date format
-            "weekday": weekday,
-            "movableFeasts": bahir.get("movableFeasts", {})
-        }
+        body, etag = _response_cache.get_or_compute(key, _serialize, build, *args)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
+    if request.method != "GET":
+        return Response(body, media_type="application/json")
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+# /convert always returns "ethiopian" and "gregorian"; the parts below are only
+# computed when asked for with include=, e.g. include=weekday,movableFeasts.
+CONVERT_FIELDS = ("weekday", "geez", "holidays", "movableFeasts")
+DEFAULT_CONVERT_FIELDS = ("weekday",)
+
+def _parse_include(include):
+    """Turns include= into a tuple of field names in CONVERT_FIELDS order."""
+    if include is None:
+        return DEFAULT_CONVERT_FIELDS
+    requested = {name.strip() for name in include.split(",") if name.strip()}
+    unknown = requested.difference(CONVERT_FIELDS)
+    if unknown:
+        raise HTTPException(status_code=400, detail=(
+            f"Unknown include field(s): {', '.join(sorted(unknown))}. Expected any of {', '.join(CONVERT_FIELDS)}"))
+    return tuple(name for name in CONVERT_FIELDS if name in requested)
+
+def _convert_payload(year, month, day, fields):
+    date = Kenat({"year": year, "month": month, "day": day})
+    payload = {
+        "ethiopian": date.format("english"),
+        "gregorian": date.gregorian.strftime("%B %d, %Y"), # Matches Tkinter date format
+    }
+    if "weekday" in fields:
+        payload["weekday"] = date.weekday_name("english")  # Sunday-first, as in DAYS_OF_WEEK
+    if "geez" in fields:
+        payload["geez"] = date.format_geez()
+    if "holidays" in fields:
+        payload["holidays"] = list(date.holidays)
+    if "movableFeasts" in fields:
+        payload["movableFeasts"] = get_bahire_hasab(year).get("movableFeasts", {})
+    return payload
+
+def _month_payload(year, month_idx):
+    # The grid (Pagume length, weekday alignment, holidays) is built once per month and cached
+    grid = MonthGrid.create(year, month_idx + 1, weekday_lang="english")
+    return {
+        "month_name": grid['monthName']['english'],
+        "year": grid['year'],
+        "grid": [
+            {"day": cell['day'], "weekday": cell['weekdayName'], "holidays": list(cell['holidays'])}
+            for cell in grid['days']
+        ],
+        "start_col": grid['startColumn'] # Added for easier frontend alignment
+    }
+
+# Endpoint: Convert Ethiopian date to Gregorian and weekday
+@app.post("/convert")
+async def convert_date(date_in: EthiopianDate, request: Request):
+    args = (date_in.year, date_in.month, date_in.day, _parse_include(date_in.include))
+    return _cached_response(request, ("convert",) + args, _convert_payload, *args)
+
+# Same as POST /convert, cacheable: /convert?year=2017&month=1&day=1&include=weekday,geez
+@app.get("/convert")
+async def convert_date_get(year: int, month: int, day: int, request: Request, include: Optional[str] = None):
+    args = (year, month, day, _parse_include(include))
+    return _cached_response(request, ("convert",) + args, _convert_payload, *args)
 
 # Endpoint: Get month grid with holidays
 @app.post("/month")
-async def get_month(req: MonthRequest):
-    try:
-        year = req.year
-        month_idx = req.month_idx
-        # Leap year logic for Pagume (Month 13)
-        num_days = 30 if month_idx < 12 else (6 if (year % 4 == 3) else 5)
-        
-        # Bahire Hasab data
-        bahir = get_bahire_hasab(year)
-        movable = bahir.get('movableFeasts', {})
-
-        # Map holidays to days
-        hols_map = {}
-        for k, info in FIXED_HOLIDAYS.items():
-            if info['month'] == month_idx + 1:
-                hols_map.setdefault(info['day'], []).append(k)
-        for k, info in movable.items():
-            if info.get('ethiopian', {}).get('month') == month_idx + 1:
-                hols_map.setdefault(info['ethiopian']['day'], []).append(k)
-
-        # Calculate weekday alignment (Start column)
-        first_day_gc = to_gc(year, month_idx + 1, 1)
-        start_col = (first_day_gc.weekday() + 1) % 7
-
-        # Build month grid
-        month_grid = []
-        for day in range(1, num_days + 1):
-            idx = (day - 1) + start_col
-            holidays = hols_map.get(day, [])
-            month_grid.append({
-                "day": day,
-                "weekday": DAYS_OF_WEEK["english"][idx % 7],
-                "holidays": holidays
-            })
-
-        return {
-            "month_name": MONTH_NAMES['english'][month_idx], 
-            "year": year, 
-            "grid": month_grid,
-            "start_col": start_col # Added for easier frontend alignment
-        }
-
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+async def get_month(req: MonthRequest, request: Request):
+    key = ("month", req.year, req.month_idx)
+    return _cached_response(request, key, _month_payload, req.year, req.month_idx)
+
+# Same as POST /month, cacheable: /month?year=2017&month_idx=0
+@app.get("/month")
+async def get_month_get(year: int, month_idx: int, request: Request):
+    return _cached_response(request, ("month", year, month_idx), _month_payload, year, month_idx)
+
+# Endpoint: Hit/miss counters of the response cache and the library caches behind it
+@app.get("/cache")
+async def cache_stats(response: Response):
+    response.headers["Cache-Control"] = "no-store"
+    return {
+        "responses": _response_cache.info(),
+        "monthGrid": month_grid_cache_info(),
+        "holidays": holiday_cache_info(),
+        "bahireHasab": bahire_hasab_cache_info(),
+    }
 
 # Endpoint: Get holiday details (Matches open_holiday_detail)
 @app.get("/holiday/{holiday_key}")
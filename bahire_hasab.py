@@ -1,22 +1,29 @@
-from utils import validate_numeric_inputs, get_weekday
-from day_arithmetic import add_days
-from conversions import to_gc
-from exceptions import UnknownHolidayError
-from constants import (
+from array import array
+from types import MappingProxyType
+
+from .utils import validate_numeric_inputs, _get_weekday_unchecked, ethiopian_to_jdn, EthiopianDate
+from .conversions import _to_gc_unchecked, DATE_PARTS_DTYPE
+from .exceptions import KenatError, UnknownHolidayError
+from .cache import LRUCache
+from .constants import (
     DAYS_OF_WEEK,
     EVANGELIST_NAMES,
     TEWSAK_MAP,
     MOVABLE_HOLIDAY_TEWSAK,
     KEY_TO_TEWSAK_MAP,
     HOLIDAY_INFO,
-    MOVABLE_HOLIDAYS
+    MOVABLE_HOLIDAYS,
+    UNIX_EPOCH_JDN
 )
 
 
-def _calculate_bahire_hasab_base(ethiopian_year):
+def _calculate_bahire_hasab_base(ethiopian_year, beale_metqi_weekday_index=None):
     """
     Calculates and returns all base values for the Bahire Hasab system. 
     This internal helper is the single source of truth for the core computational logic. 
+
+    The weekday of Beale Metqi (0=Sunday) is looked up from the calendar unless it is
+    passed in, as the paschal-cycle table does once it has been built.
     """
     amete_alem = 5500 + ethiopian_year
     metene_rabiet = amete_alem // 4
@@ -24,13 +31,16 @@ def _calculate_bahire_hasab_base(ethiopian_year):
 
     wenber = 18 if medeb == 0 else medeb - 1
     abektie = (wenber * 11) % 30
-    metqi = (wenber * 19) % 30
+    metqi = (wenber * 19) % 30 or 30  # A metqi of 0 is counted as 30
 
     beale_metqi_month = 1 if metqi > 14 else 2
     beale_metqi_day = metqi
-    beale_metqi_date = {'year': ethiopian_year, 'month': beale_metqi_month, 'day': beale_metqi_day}
+    beale_metqi_date = EthiopianDate._trusted(ethiopian_year, beale_metqi_month, beale_metqi_day)
 
-    beale_metqi_weekday = DAYS_OF_WEEK['english'][get_weekday(beale_metqi_date)]
+    if beale_metqi_weekday_index is None:
+        # The date is valid by construction, so the trusted internal helper is used.
+        beale_metqi_weekday_index = _get_weekday_unchecked(ethiopian_year, beale_metqi_month, beale_metqi_day)
+    beale_metqi_weekday = DAYS_OF_WEEK['english'][beale_metqi_weekday_index]
     tewsak = TEWSAK_MAP[beale_metqi_weekday]
 
     mebaja_hamer_sum = beale_metqi_day + tewsak
@@ -40,7 +50,7 @@ def _calculate_bahire_hasab_base(ethiopian_year):
     if mebaja_hamer_sum > 30:
         nineveh_month += 1
 
-    nineveh_date = {'year': ethiopian_year, 'month': nineveh_month, 'day': mebaja_hamer}
+    nineveh_date = EthiopianDate._trusted(ethiopian_year, nineveh_month, mebaja_hamer)
 
     return {
         'amete_alem': amete_alem,
@@ -56,62 +66,150 @@ def _calculate_bahire_hasab_base(ethiopian_year):
     }
 
 
-def get_bahire_hasab(ethiopian_year, lang='amharic'):
-    """
-    Calculates all Bahire Hasab values for a given Ethiopian year. 
+# --- Paschal Cycle Table ---
+# Every Bahire Hasab result depends only on the year's place in the 19-year Medeb
+# cycle and the 28-year weekday cycle, so the results repeat every 19 * 28 = 532
+# years. The Beale Metqi weekday and the day of year of Nineveh are tabulated once
+# per cycle position; each movable feast is a fixed tewsak offset from Nineveh.
 
-    Args:
-        ethiopian_year (int): The Ethiopian year to calculate for.
-        lang (str): The language for names ('amharic' or 'english'). 
+PASCHAL_CYCLE_YEARS = 532
 
-    Returns:
-        dict: An object containing all the calculated Bahire Hasab values. 
+_beale_metqi_weekdays = None  # array('B'): Beale Metqi weekday (0=Sunday) per cycle position
+_nineveh_offsets = None  # array('H'): 0-based day of year of Nineveh per cycle position
+
+
+def _paschal_cycle_tables():
+    """Returns the (weekday, Nineveh offset) tables, building them on first use."""
+    global _beale_metqi_weekdays, _nineveh_offsets
+    if _nineveh_offsets is None:
+        weekdays = array('B')
+        offsets = array('H')
+        for position in range(PASCHAL_CYCLE_YEARS):
+            # Any year at this position will do; use the first positive one.
+            year = (position - 5500) % PASCHAL_CYCLE_YEARS + PASCHAL_CYCLE_YEARS
+            base = _calculate_bahire_hasab_base(year)
+            nineveh = base['nineveh_date']
+            weekdays.append(DAYS_OF_WEEK['english'].index(base['beale_metqi_weekday']))
+            offsets.append((nineveh.month - 1) * 30 + nineveh.day - 1)
+        # Every feast must stay within the 30-day months for the offset arithmetic below.
+        if max(offsets) + max(MOVABLE_HOLIDAY_TEWSAK.values()) >= 360:
+            raise KenatError("Movable feast table extends past the 30-day months")
+        _beale_metqi_weekdays = weekdays
+        _nineveh_offsets = offsets
+    return _beale_metqi_weekdays, _nineveh_offsets
+
+
+def _movable_feast_date(ethiopian_year, tewsak_value):
+    """Returns the date `tewsak_value` days after Nineveh in the given year, by table lookup."""
+    _, offsets = _paschal_cycle_tables()
+    day_of_year = offsets[(5500 + ethiopian_year) % PASCHAL_CYCLE_YEARS] + tewsak_value
+    return EthiopianDate._trusted(ethiopian_year, day_of_year // 30 + 1, day_of_year % 30 + 1)
+
+
+# --- Caching ---
+# The numeric results depend only on the year and are cached once per year; the
+# localized views built from them are cached per (year, lang). Both caches are
+# bounded, and views are returned read-only so cached data cannot be corrupted.
+
+_TEWSAK_TO_KEY_MAP = {v: k for k, v in KEY_TO_TEWSAK_MAP.items()}
+
+_core_cache = LRUCache(512)
+_view_cache = LRUCache(256)
+
+
+def _calculate_bahire_hasab_core(ethiopian_year):
     """
-    validate_numeric_inputs('get_bahire_hasab', ethiopian_year=ethiopian_year)
+    Extends the base values with everything else that depends only on the year:
+    the evangelist remainder, Tinte Qemer and the dates of every movable feast.
+    """
+    weekdays, _ = _paschal_cycle_tables()
+    core = _calculate_bahire_hasab_base(ethiopian_year, weekdays[(5500 + ethiopian_year) % PASCHAL_CYCLE_YEARS])
+    core['evangelist_remainder'] = core['amete_alem'] % 4
+    core['tinte_qemer'] = (core['amete_alem'] + core['metene_rabiet']) % 7
 
-    base = _calculate_bahire_hasab_base(ethiopian_year)
+    # Dates built here are valid by construction, so the trusted internal helpers are used.
+    feasts = {}
+    for tewsak_key, tewsak_value in MOVABLE_HOLIDAY_TEWSAK.items():
+        date = _movable_feast_date(ethiopian_year, tewsak_value)
+        feasts[tewsak_key] = (date, _to_gc_unchecked(date.year, date.month, date.day))
+    core['feasts'] = feasts
+    return core
+
+
+def _get_bahire_hasab_core(ethiopian_year):
+    return _core_cache.get_or_compute(ethiopian_year, _calculate_bahire_hasab_core, ethiopian_year)
+
+
+def _localize_bahire_hasab(ethiopian_year, lang):
+    """Builds the read-only, localized get_bahire_hasab result from the cached core."""
+    core = _get_bahire_hasab_core(ethiopian_year)
 
-    evangelist_remainder = base['amete_alem'] % 4
+    evangelist_remainder = core['evangelist_remainder']
     evangelist_name = EVANGELIST_NAMES.get(lang, EVANGELIST_NAMES['english'])[evangelist_remainder]
 
-    tinte_qemer = (base['amete_alem'] + base['metene_rabiet']) % 7
+    tinte_qemer = core['tinte_qemer']
     weekday_index = (tinte_qemer + 1) % 7
     new_year_weekday = DAYS_OF_WEEK.get(lang, DAYS_OF_WEEK['english'])[weekday_index]
 
     movable_feasts = {}
-    tewsak_to_key_map = {v: k for k, v in KEY_TO_TEWSAK_MAP.items()}
-
-    for tewsak_key, tewsak_value in MOVABLE_HOLIDAY_TEWSAK.items():
-        holiday_key = tewsak_to_key_map.get(tewsak_key)
+    for tewsak_key, (date, gregorian) in core['feasts'].items():
+        holiday_key = _TEWSAK_TO_KEY_MAP.get(tewsak_key)
         if holiday_key:
-            date = add_days(base['nineveh_date'], tewsak_value)
             info = HOLIDAY_INFO.get(holiday_key, {})
             rules = MOVABLE_HOLIDAYS.get(holiday_key, {})
 
-            movable_feasts[holiday_key] = {
+            movable_feasts[holiday_key] = MappingProxyType({
                 'key': holiday_key,
-                'tags': rules.get('tags', []),
+                'tags': tuple(rules.get('tags', ())),
                 'movable': True,
                 'name': info.get('name', {}).get(lang) or info.get('name', {}).get('english'),
                 'description': info.get('description', {}).get(lang) or info.get('description', {}).get('english'),
                 'ethiopian': date,
-                'gregorian': to_gc(date['year'], date['month'], date['day'])
-            }
+                'gregorian': gregorian
+            })
+
+    # Built directly as read-only mappings; every leaf value is already immutable.
+    return MappingProxyType({
+        'ameteAlem': core['amete_alem'],
+        'meteneRabiet': core['metene_rabiet'],
+        'evangelist': MappingProxyType({'name': evangelist_name, 'remainder': evangelist_remainder}),
+        'newYear': MappingProxyType({'dayName': new_year_weekday, 'tinteQemer': tinte_qemer}),
+        'medeb': core['medeb'],
+        'wenber': core['wenber'],
+        'abektie': core['abektie'],
+        'metqi': core['metqi'],
+        'bealeMetqi': MappingProxyType({'date': core['beale_metqi_date'], 'weekday': core['beale_metqi_weekday']}),
+        'mebajaHamer': core['mebaja_hamer'],
+        'nineveh': core['nineveh_date'],
+        'movableFeasts': MappingProxyType(movable_feasts)
+    })
 
-    return {
-        'ameteAlem': base['amete_alem'],
-        'meteneRabiet': base['metene_rabiet'],
-        'evangelist': {'name': evangelist_name, 'remainder': evangelist_remainder},
-        'newYear': {'dayName': new_year_weekday, 'tinteQemer': tinte_qemer},
-        'medeb': base['medeb'],
-        'wenber': base['wenber'],
-        'abektie': base['abektie'],
-        'metqi': base['metqi'],
-        'bealeMetqi': {'date': base['beale_metqi_date'], 'weekday': base['beale_metqi_weekday']},
-        'mebajaHamer': base['mebaja_hamer'],
-        'nineveh': base['nineveh_date'],
-        'movableFeasts': movable_feasts
-    }
+
+def clear_bahire_hasab_cache():
+    """Empties the Bahire Hasab caches and resets their counters."""
+    _core_cache.clear()
+    _view_cache.clear()
+
+
+def bahire_hasab_cache_info():
+    """Returns the hit/miss/eviction counters of the per-year and per-(year, lang) caches."""
+    return {'core': _core_cache.info(), 'localized': _view_cache.info()}
+
+
+def get_bahire_hasab(ethiopian_year, lang='amharic'):
+    """
+    Calculates all Bahire Hasab values for a given Ethiopian year. 
+
+    Args:
+        ethiopian_year (int): The Ethiopian year to calculate for.
+        lang (str): The language for names ('amharic' or 'english'). 
+
+    Returns:
+        Mapping: A read-only object containing all the calculated Bahire Hasab values. 
+    """
+    validate_numeric_inputs('get_bahire_hasab', ethiopian_year=ethiopian_year)
+
+    return _view_cache.get_or_compute((ethiopian_year, lang), _localize_bahire_hasab, ethiopian_year, lang)
 
 
 def get_movable_holiday(holiday_key, ethiopian_year):
@@ -123,7 +221,7 @@ def get_movable_holiday(holiday_key, ethiopian_year):
         ethiopian_year (int): The Ethiopian year. 
 
     Returns:
-        dict: An Ethiopian date object {'year', 'month', 'day'}. 
+        EthiopianDate: The Ethiopian date of the holiday. 
     """
     validate_numeric_inputs('get_movable_holiday', ethiopian_year=ethiopian_year)
 
@@ -131,6 +229,101 @@ def get_movable_holiday(holiday_key, ethiopian_year):
     if tewsak is None:
         raise UnknownHolidayError(holiday_key)
 
-    base = _calculate_bahire_hasab_base(ethiopian_year)
+    return _movable_feast_date(ethiopian_year, tewsak)
+
+# --- Multi-year Queries ---
+# These only compute the requested feasts. Feast keys may be given either as
+# movableFeasts keys ('fasika', 'abiyTsome') or as tewsak keys ('TINSAYE', 'ABIY_TSOME').
+
+def _resolve_tewsak(holiday_key):
+    """Returns the tewsak offset for a movableFeasts or tewsak key."""
+    tewsak = MOVABLE_HOLIDAY_TEWSAK.get(KEY_TO_TEWSAK_MAP.get(holiday_key, holiday_key))
+    if tewsak is None:
+        raise UnknownHolidayError(holiday_key)
+    return tewsak
+
+
+def _resolve_keys(keys):
+    """Maps the requested feast keys (default: every movable feast) to tewsak offsets."""
+    if keys is None:
+        keys = list(KEY_TO_TEWSAK_MAP)
+    elif isinstance(keys, str):
+        keys = [keys]
+    return {key: _resolve_tewsak(key) for key in keys}
+
+
+def get_movable_holiday_many(holiday_key, ethiopian_years):
+    """
+    Vectorized get_movable_holiday: the date of one movable holiday in many years.
+
+    Args:
+        holiday_key (str): The key of the holiday (e.g., 'ABIY_TSOME', 'TINSAYE').
+        ethiopian_years (array-like): The Ethiopian years.
+
+    Returns:
+        numpy.ndarray: A structured year/month/day array (DATE_PARTS_DTYPE).
+    """
+    import numpy as np
+
+    tewsak = _resolve_tewsak(holiday_key)
+    years = np.asarray(ethiopian_years, dtype=np.int64)
+    _, offsets = _paschal_cycle_tables()
+    day_of_year = np.frombuffer(offsets, dtype=np.uint16)[(5500 + years) % PASCHAL_CYCLE_YEARS] + tewsak
+
+    out = np.empty(years.shape, dtype=DATE_PARTS_DTYPE)
+    out['year'] = years
+    out['month'] = day_of_year // 30 + 1
+    out['day'] = day_of_year % 30 + 1
+    return out
+
+
+def get_bahire_hasab_range(start_year, end_year, keys=None, gregorian=False):
+    """
+    Calculates movable feast dates for every year from `start_year` to `end_year` inclusive.
+
+    Args:
+        start_year (int): The first Ethiopian year.
+        end_year (int): The last Ethiopian year.
+        keys (list, optional): The feasts to compute (e.g., ['fasika', 'hosanna']);
+            all movable feasts by default.
+        gregorian (bool): Also return the Gregorian dates as datetime64[D] arrays.
+
+    Returns:
+        dict: Columnar arrays: 'year', 'ethiopian' (feast key -> structured
+        year/month/day array) and, if requested, 'gregorian' (feast key -> datetime64).
+    """
+    import numpy as np
+
+    validate_numeric_inputs('get_bahire_hasab_range', start_year=start_year, end_year=end_year)
+    tewsaks = _resolve_keys(keys)
+
+    years = np.arange(start_year, end_year + 1, dtype=np.int64)
+    result = {'year': years, 'ethiopian': {}}
+    if gregorian:
+        result['gregorian'] = {}
+    for key, tewsak in tewsaks.items():
+        dates = get_movable_holiday_many(KEY_TO_TEWSAK_MAP.get(key, key), years)
+        result['ethiopian'][key] = dates
+        if gregorian:
+            days = ethiopian_to_jdn(years, dates['month'].astype(np.int64), dates['day'].astype(np.int64))
+            result['gregorian'][key] = (days - UNIX_EPOCH_JDN).astype('datetime64[D]')
+    return result
+
+
+def iter_bahire_hasab_range(start_year, end_year, keys=None):
+    """
+    Lazily yields movable feast dates year by year, for ranges too large to hold as arrays.
+
+    Args:
+        start_year (int): The first Ethiopian year.
+        end_year (int): The last Ethiopian year (inclusive).
+        keys (list, optional): The feasts to compute; all movable feasts by default.
+
+    Yields:
+        tuple: (year, {feast key: EthiopianDate}) for each year in the range.
+    """
+    validate_numeric_inputs('iter_bahire_hasab_range', start_year=start_year, end_year=end_year)
+    tewsaks = _resolve_keys(keys)
 
-    return add_days(base['nineveh_date'], tewsak) 
\ No newline at end of file
+    for year in range(start_year, end_year + 1):
+        yield year, {key: _movable_feast_date(year, tewsak) for key, tewsak in tewsaks.items()}
@@ -0,0 +1,17 @@
+"""
+Registers the repository as the package ``kenat`` for the benchmark scripts,
+whatever the checkout directory is called, so they can use package imports
+(``from kenat.conversions import to_gc``) without installing anything.
+"""
+import importlib.util
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if 'kenat' not in sys.modules:
+    _spec = importlib.util.spec_from_file_location(
+        'kenat', os.path.join(ROOT, '__init__.py'), submodule_search_locations=[ROOT])
+    _module = importlib.util.module_from_spec(_spec)
+    sys.modules['kenat'] = _module
+    _spec.loader.exec_module(_module)
@@ -0,0 +1,47 @@
+"""
+Benchmarks the 532-year paschal-cycle table lookups against the direct Bahire
+Hasab algorithm kept below, and the multi-year range API against per-year calls.
+tests/test_bahire_hasab.py checks that they agree.
+
+Run with:  python benchmarks/bench_bahire_hasab.py
+"""
+import timeit
+
+import _package  # noqa: F401  Registers the repository as the package 'kenat'
+
+from kenat import bahire_hasab
+from kenat.bahire_hasab import (
+    get_movable_holiday, get_bahire_hasab_range, _calculate_bahire_hasab_base,
+)
+from kenat.constants import MOVABLE_HOLIDAY_TEWSAK
+from kenat.day_arithmetic import _add_days
+
+
+def _reference_movable_holiday(holiday_key, ethiopian_year):
+    """The direct algorithm: per-year weekday lookup, then an offset from Nineveh."""
+    nineveh = _calculate_bahire_hasab_base(ethiopian_year)['nineveh_date']
+    return _add_days(nineveh.year, nineveh.month, nineveh.day, MOVABLE_HOLIDAY_TEWSAK[holiday_key])
+
+
+def main():
+    number = 50_000
+    t_before = min(timeit.repeat(lambda: _reference_movable_holiday('TINSAYE', 2017), number=number, repeat=3))
+    t_after = min(timeit.repeat(lambda: get_movable_holiday('TINSAYE', 2017), number=number, repeat=3))
+    print(f"get_movable_holiday   before {t_before / number * 1e6:6.2f} us   after {t_after / number * 1e6:6.2f} us")
+
+    def cold_bahire_hasab():
+        bahire_hasab.clear_bahire_hasab_cache()
+        for year in range(1900, 2100):
+            bahire_hasab.get_bahire_hasab(year)
+    t_cold = min(timeit.repeat(cold_bahire_hasab, number=1, repeat=5)) / 200
+    print(f"get_bahire_hasab      {t_cold * 1e6:6.2f} us per uncached call")
+
+    t_loop = min(timeit.repeat(
+        lambda: [get_movable_holiday('TINSAYE', year) for year in range(1, 10_001)], number=1, repeat=3))
+    t_range = min(timeit.repeat(
+        lambda: get_bahire_hasab_range(1, 10_000, keys=['fasika']), number=1, repeat=3))
+    print(f"fasika, 10,000 years  loop {t_loop * 1e3:6.2f} ms   range {t_range * 1e3:6.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""
+Benchmarks the pandas .ethiopian accessor against a per-row loop over the
+scalar to_gc. Equivalence is checked in tests/test_columnar.py.
+
+Run with:  python benchmarks/bench_columnar.py
+"""
+import random
+import timeit
+
+import numpy as np
+import pandas as pd
+
+import _package  # noqa: F401  Registers the repository as the package 'kenat'
+
+import kenat.columnar  # noqa: F401  Registers Series.ethiopian
+from kenat.conversions import to_gc
+from kenat.exceptions import KenatError
+
+
+def _random_strings(count, seed=0):
+    rng = random.Random(seed)
+    return [f"{rng.randint(1890, 2110)}/{rng.randint(1, 13)}/{rng.randint(1, 30)}" for _ in range(count)]
+
+
+def _scalar_to_gc(value):
+    try:
+        return to_gc(*(int(part) for part in value.replace('-', '/').split('/')))
+    except (KenatError, ValueError):
+        return None
+
+
+def main():
+    for count in (20_000, 200_000):
+        strings = _random_strings(count)
+        series = pd.Series(strings)
+        t_loop = min(timeit.repeat(lambda: [_scalar_to_gc(s) for s in strings], number=1, repeat=3))
+        t_column = min(timeit.repeat(lambda: series.ethiopian.to_gc(), number=1, repeat=3))
+        print(f"{count:>7} strings to Gregorian   per-row to_gc {t_loop * 1e3:8.2f} ms   "
+              f"Series.ethiopian.to_gc {t_column * 1e3:7.2f} ms")
+
+    dates = pd.Series(np.arange('1900-01-01', '2100-01-01', 7, dtype='datetime64[D]'))
+    t_column = min(timeit.repeat(lambda: dates.ethiopian.to_ec(), number=1, repeat=3))
+    print(f"{len(dates):>7} dates to Ethiopian     Series.ethiopian.to_ec {t_column * 1e3:6.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Micro-benchmarks for the scalar conversion functions.
+
+The "before" numbers come from the date/timedelta based implementations that
+used to back ``to_gc``/``to_ec``; they are kept here as a reference point, and
+tests/test_conversions.py checks the current functions against them.
+
+Run with:  python benchmarks/bench_conversions.py
+"""
+import datetime
+import timeit
+
+import _package  # noqa: F401  Registers the repository as the package 'kenat'
+
+from kenat.conversions import to_gc, to_ec
+from kenat.utils import (
+    get_weekday,
+    get_ethiopian_days_in_month,
+    is_gregorian_leap_year,
+    validate_numeric_inputs
+)
+
+
+def _legacy_to_gc(eth_year, eth_month, eth_day):
+    validate_numeric_inputs('to_gc', eth_year=eth_year, eth_month=eth_month, eth_day=eth_day)
+    if not 1 <= eth_month <= 13 or not 1 <= eth_day <= get_ethiopian_days_in_month(eth_year, eth_month):
+        raise ValueError((eth_year, eth_month, eth_day))
+    gregorian_year = eth_year + 7
+    new_year_day = 12 if is_gregorian_leap_year(gregorian_year + 1) else 11
+    new_year_date = datetime.date(gregorian_year, 9, new_year_day)
+    return new_year_date + datetime.timedelta(days=(eth_month - 1) * 30 + (eth_day - 1))
+
+
+def _legacy_to_ec(greg_year, greg_month, greg_day):
+    validate_numeric_inputs('to_ec', g_year=greg_year, g_month=greg_month, g_day=greg_day)
+    greg_date = datetime.date(greg_year, greg_month, greg_day)
+    if not (datetime.date(1900, 1, 1) <= greg_date <= datetime.date(2100, 12, 31)):
+        raise ValueError(greg_date)
+    eth_year = greg_year - 8
+    if greg_date >= _legacy_to_gc(eth_year + 1, 1, 1):
+        eth_year += 1
+    days_diff = (greg_date - _legacy_to_gc(eth_year, 1, 1)).days
+    return {'year': eth_year, 'month': days_diff // 30 + 1, 'day': days_diff % 30 + 1}
+
+
+def _legacy_get_weekday(eth_date):
+    return _legacy_to_gc(eth_date['year'], eth_date['month'], eth_date['day']).isoweekday() % 7
+
+
+def _per_call_ns(func, *args, number=200_000):
+    best = min(timeit.repeat(lambda: func(*args), number=number, repeat=5))
+    return best / number * 1e9
+
+
+def main():
+    eth_date = {'year': 2017, 'month': 4, 'day': 29}
+    cases = [
+        ('to_gc', _legacy_to_gc, to_gc, (2017, 4, 29)),
+        ('to_ec', _legacy_to_ec, to_ec, (2025, 1, 7)),
+        ('get_weekday', _legacy_get_weekday, get_weekday, (eth_date,)),
+    ]
+    print(f"{'function':<14}{'before (ns)':>14}{'after (ns)':>14}{'speedup':>10}")
+    for name, before, after, args in cases:
+        t_before = _per_call_ns(before, *args)
+        t_after = _per_call_ns(after, *args)
+        print(f"{name:<14}{t_before:>14.0f}{t_after:>14.0f}{t_before / t_after:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmarks for the day_arithmetic functions.
+
+The "before" implementations are the original loop-based versions, kept here
+as the reference tests/test_day_arithmetic.py checks the constant-time and
+batch versions against.
+
+Run with:  python benchmarks/bench_day_arithmetic.py
+"""
+import timeit
+
+import _package  # noqa: F401  Registers the repository as the package 'kenat'
+
+from kenat import day_arithmetic
+from kenat.day_arithmetic import add_days, diff_in_days
+from kenat.utils import get_ethiopian_days_in_month, is_ethiopian_leap_year
+
+
+def _legacy_total_days(eth_date):
+    days = 0
+    for y in range(1, eth_date['year']):
+        days += 366 if is_ethiopian_leap_year(y) else 365
+    for m in range(1, eth_date['month']):
+        days += get_ethiopian_days_in_month(eth_date['year'], m)
+    return days + eth_date['day']
+
+
+def _legacy_diff_in_days(date_a, date_b):
+    return _legacy_total_days(date_a) - _legacy_total_days(date_b)
+
+
+def _legacy_add_days(ethiopian, days):
+    year, month, day = ethiopian['year'], ethiopian['month'], ethiopian['day'] + days
+    while day > get_ethiopian_days_in_month(year, month):
+        day -= get_ethiopian_days_in_month(year, month)
+        month += 1
+        if month > 13:
+            month = 1
+            year += 1
+    return {'year': year, 'month': month, 'day': day}
+
+
+def _every_date(first_year, last_year):
+    for year in range(first_year, last_year + 1):
+        for month in range(1, 14):
+            for day in range(1, get_ethiopian_days_in_month(year, month) + 1):
+                yield {'year': year, 'month': month, 'day': day}
+
+
+def _random_dates(size=50_000, seed=0):
+    """Two columns of random dates in 1990-2030, as DATE_PARTS_DTYPE arrays and as dicts."""
+    import numpy as np
+
+    from kenat.conversions import DATE_PARTS_DTYPE
+
+    rng = np.random.default_rng(seed)
+    all_dates = list(_every_date(1990, 2030))
+    picks = rng.integers(0, len(all_dates), size=(2, size))
+    columns = []
+    for row in picks:
+        dates = np.empty(size, dtype=DATE_PARTS_DTYPE)
+        for i, k in enumerate(row):
+            date = all_dates[k]
+            dates[i] = (date['year'], date['month'], date['day'])
+        columns.append(dates)
+    dates_a, dates_b = columns
+    scalar_a = [{'year': int(y), 'month': int(m), 'day': int(d)} for y, m, d in dates_a.tolist()]
+    scalar_b = [{'year': int(y), 'month': int(m), 'day': int(d)} for y, m, d in dates_b.tolist()]
+    return dates_a, dates_b, scalar_a, scalar_b
+
+
+def _per_call_us(func, *args, number=20_000):
+    return min(timeit.repeat(lambda: func(*args), number=number, repeat=3)) / number * 1e6
+
+
+def main():
+    dates_a, dates_b, scalar_a, scalar_b = _random_dates()
+
+    a = {'year': 2017, 'month': 4, 'day': 29}
+    b = {'year': 1985, 'month': 13, 'day': 6}
+    print(f"{'function':<16}{'before (us)':>14}{'after (us)':>14}{'speedup':>10}")
+    t_before = _per_call_us(_legacy_diff_in_days, a, b, number=500)
+    t_after = _per_call_us(diff_in_days, a, b)
+    print(f"{'diff_in_days':<16}{t_before:>14.2f}{t_after:>14.2f}{t_before / t_after:>9.0f}x")
+    t_before = _per_call_us(_legacy_add_days, a, 10_000, number=500)
+    t_after = _per_call_us(add_days, a, 10_000)
+    print(f"{'add_days(10000)':<16}{t_before:>14.2f}{t_after:>14.2f}{t_before / t_after:>9.0f}x")
+
+    rows = len(dates_a)
+    print(f"\n{'per row, ' + format(rows, ',') + ' rows':<28}{'scalar (ns)':>14}{'batch (ns)':>14}{'speedup':>10}")
+    for name in ('add_months', 'add_years', 'diff_in_months', 'diff_in_years'):
+        scalar = getattr(day_arithmetic, name)
+        batch = getattr(day_arithmetic, name + '_many')
+        if name.startswith('add'):
+            run_scalar = lambda: [scalar(date, 7) for date in scalar_a]
+            run_batch = lambda: batch(dates_a, 7)
+        else:
+            run_scalar = lambda: [scalar(a, b) for a, b in zip(scalar_a, scalar_b)]
+            run_batch = lambda: batch(dates_a, dates_b)
+        t_scalar = min(timeit.repeat(run_scalar, number=1, repeat=3)) / rows * 1e9
+        t_batch = min(timeit.repeat(run_batch, number=1, repeat=3)) / rows * 1e9
+        print(f"{name:<28}{t_scalar:>14.0f}{t_batch:>14.1f}{t_scalar / t_batch:>9.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+"""
+Benchmarks the batch timestamp conversion against the scalar (EthiopianDate,
+Time) path. tests/test_ethiopian_time.py checks that the two agree.
+
+Run with:  python benchmarks/bench_ethiopian_time.py
+"""
+import datetime
+import timeit
+
+import numpy as np
+
+import _package  # noqa: F401  Registers the repository as the package 'kenat'
+
+from kenat.ethiopian_time import to_ethiopian_datetime, to_ethiopian_datetime_many, to_timestamps_many
+
+_FIRST = int(datetime.datetime(1900, 1, 2, tzinfo=datetime.timezone.utc).timestamp())
+_LAST = int(datetime.datetime(2100, 12, 30, tzinfo=datetime.timezone.utc).timestamp())
+
+
+def main():
+    sample = np.random.default_rng(0).integers(_FIRST, _LAST, 20_000)
+    t_loop = min(timeit.repeat(lambda: [to_ethiopian_datetime(int(s)) for s in sample], number=1, repeat=3))
+    t_batch = min(timeit.repeat(lambda: to_ethiopian_datetime_many(sample), number=1, repeat=3))
+    print(f"{len(sample)} timestamps   per-row objects {t_loop * 1e3:7.2f} ms   "
+          f"to_ethiopian_datetime_many {t_batch * 1e3:6.2f} ms")
+    parts = to_ethiopian_datetime_many(sample)[0]
+    t_back = min(timeit.repeat(lambda: to_timestamps_many(parts), number=1, repeat=3))
+    print(f"{len(sample)} rows back to timestamps   to_timestamps_many {t_back * 1e3:6.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmarks the table-driven Ge'ez conversion, scalar and batch, against a direct
+reimplementation of the digit-by-digit algorithm. tests/test_geez.py checks
+that the two agree.
+
+Run with:  python benchmarks/bench_geez.py
+"""
+import timeit
+
+import _package  # noqa: F401  Registers the repository as the package 'kenat'
+
+from kenat.geez import to_geez, to_arabic, to_geez_many, GEEZ_ONES, GEEZ_TENS
+
+_HUNDRED = '፻'
+_TEN_THOUSAND = '፼'
+_REVERSE = {char: value for value, char in enumerate(GEEZ_ONES) if char}
+_REVERSE.update((char, value * 10) for value, char in enumerate(GEEZ_TENS) if char)
+
+
+def _reference_to_geez(num):
+    """Recursive conversion without tables."""
+    if num == 0:
+        return '0'
+
+    def below_100(n):
+        return GEEZ_TENS[n // 10] + GEEZ_ONES[n % 10] if n > 0 else ''
+
+    if num < 100:
+        return below_100(num)
+    if num < 10000:
+        hundreds, remainder = divmod(num, 100)
+        return (below_100(hundreds) if hundreds > 1 else '') + _HUNDRED + below_100(remainder)
+    upper, remainder = divmod(num, 10000)
+    return ((_reference_to_geez(upper) if upper > 1 else '') + _TEN_THOUSAND
+            + (_reference_to_geez(remainder) if remainder > 0 else ''))
+
+
+def _reference_to_arabic(geez):
+    """Left-to-right accumulation; only correct below 10**8, where ፼ never nests."""
+    if geez == '0':
+        return 0
+    total = current = 0
+    for char in geez:
+        if char in _REVERSE:
+            current += _REVERSE[char]
+        elif char == _HUNDRED:
+            current = (current or 1) * 100
+        else:
+            total += (current or 1) * 10000
+            current = 0
+    return total + current
+
+
+def main():
+    number = 200_000
+    for label, value in (('day 29', 29), ('year 2017', 2017)):
+        t_before = min(timeit.repeat(lambda: _reference_to_geez(value), number=number, repeat=3)) / number
+        t_after = min(timeit.repeat(lambda: to_geez(value), number=number, repeat=3)) / number
+        print(f"to_geez ({label:9})   algorithm {t_before * 1e9:6.0f} ns   table {t_after * 1e9:6.0f} ns")
+
+    geez_year = to_geez(2017)
+    t_before = min(timeit.repeat(lambda: _reference_to_arabic(geez_year), number=number, repeat=3)) / number
+    t_after = min(timeit.repeat(lambda: to_arabic(geez_year), number=number, repeat=3)) / number
+    print(f"to_arabic (year 2017)  char loop {t_before * 1e9:6.0f} ns   table {t_after * 1e9:6.0f} ns")
+
+    # One calendar page: 30 day cells and the year.
+    page = list(range(1, 31)) + [2017]
+    number = 20_000
+    t_loop = min(timeit.repeat(lambda: [_reference_to_geez(n) for n in page], number=number, repeat=3)) / number
+    t_batch = min(timeit.repeat(lambda: to_geez_many(page), number=number, repeat=3)) / number
+    print(f"calendar page (31 numerals)   algorithm {t_loop * 1e6:6.2f} us   to_geez_many {t_batch * 1e6:6.2f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark for the Hijri conversion.
+
+``hijri_to_gregorian`` used to scan up to 731 days, converting every candidate
+day with a float-based ``_jd_to_hijri``. That search is reproduced below and
+timed against the closed-form tabular conversion; tests/test_hijri.py checks
+that both agree. The cached per-year Islamic holiday listings built on top of
+it are timed as well.
+
+Run with:  python benchmarks/bench_hijri.py
+"""
+import datetime
+import math
+import timeit
+
+import _package  # noqa: F401  Registers the repository as the package 'kenat'
+
+from kenat.conversions import hijri_to_gregorian
+from kenat import holidays
+
+
+def _legacy_gregorian_to_jd(year, month, day):
+    if month < 3:
+        year -= 1
+        month += 12
+    a = year // 100
+    b = a // 4
+    c = 2 - a + b
+    e = int(365.25 * (year + 4716))
+    f = int(30.6001 * (month + 1))
+    return c + day + e + f - 1524
+
+
+def _legacy_jd_to_hijri(jd):
+    jd = math.floor(jd) + 0.5
+    jd = jd - 1948439.5
+    year = int((30 * jd + 10646) // 10631)
+    start_of_year = 354 * (year - 1) + math.floor((3 + 11 * year) / 30)
+    day_of_year = int(jd - start_of_year)
+    month = int((day_of_year) // 29.5) + 1
+    if month > 12:
+        month = 12
+    start_of_month = 29.5 * (month - 1)
+    day = int(jd - (start_of_year + start_of_month)) + 1
+    return {'year': year, 'month': month, 'day': day}
+
+
+def _legacy_hijri_to_gregorian(h_year, h_month, h_day, gregorian_year):
+    base_date = datetime.date(gregorian_year - 1, 1, 1)
+    for offset in range(731):
+        test_date = base_date + datetime.timedelta(days=offset)
+        jd = _legacy_gregorian_to_jd(test_date.year, test_date.month, test_date.day)
+        hijri_parts = _legacy_jd_to_hijri(jd)
+        if (
+            hijri_parts['year'] == h_year and
+            hijri_parts['month'] == h_month and
+            hijri_parts['day'] == h_day and
+            test_date.year == gregorian_year
+        ):
+            return test_date
+    return None
+
+
+def main():
+    args = (1446, 10, 1, 2025)
+    number = 200
+    t_before = min(timeit.repeat(lambda: _legacy_hijri_to_gregorian(*args), number=number, repeat=3)) / number
+    number = 100_000
+    t_after = min(timeit.repeat(lambda: hijri_to_gregorian(*args), number=number, repeat=3)) / number
+    print(f"hijri_to_gregorian  before {t_before * 1e6:10.1f} us   after {t_after * 1e6:8.2f} us"
+          f"   speedup {t_before / t_after:,.0f}x")
+
+    def cold_listing():
+        holidays.clear_islamic_holiday_cache()
+        holidays.get_islamic_holidays(2017)
+    number = 20_000
+    t_cold = min(timeit.repeat(cold_listing, number=number, repeat=3)) / number
+    t_warm = min(timeit.repeat(lambda: holidays.get_islamic_holidays(2017), number=number, repeat=3)) / number
+    print(f"get_islamic_holidays  uncached {t_cold * 1e6:6.2f} us   cached {t_warm * 1e6:6.2f} us")
+
+
+if __name__ == '__main__':
+    main()
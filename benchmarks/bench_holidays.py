@@ -0,0 +1,59 @@
+"""
+Benchmarks the holiday index queries against a plain scan of each year's
+holidays, and the per-year holiday listings. tests/test_holidays.py checks the
+index against the same scan.
+
+The scan mirrors what the month views did before: walk the fixed and movable
+holidays of every year until a match turns up.
+
+Run with:  python benchmarks/bench_holidays.py
+"""
+import timeit
+
+import _package  # noqa: F401  Registers the repository as the package 'kenat'
+
+from kenat import holidays
+from kenat.constants import HolidayTags
+from kenat.utils import ethiopian_to_jdn
+
+
+def _matches_tags(holiday_key, tags):
+    """Reference tag filter: list membership, as before the bitmasks."""
+    return not tags or any(tag in holidays._HOLIDAY_TAGS[holiday_key] for tag in tags)
+
+
+def _scan_next_holiday(date, tags=None):
+    """Reference: scan year by year from the date's year until a later holiday matches."""
+    day = ethiopian_to_jdn(date['year'], date['month'], date['day'])
+    for year in range(date['year'], holidays.DEFAULT_INDEX_YEARS[1] + 1):
+        for holiday_day, key in holidays._calculate_year_holiday_days(year):
+            if holiday_day > day and _matches_tags(key, tags):
+                return holiday_day, key
+    return None
+
+
+def main():
+    number = 5
+    def cold_build():
+        holidays.clear_holiday_cache()
+        holidays.HolidayIndex(*holidays.DEFAULT_INDEX_YEARS)
+    t_build = min(timeit.repeat(cold_build, number=number, repeat=3))
+    print(f"HolidayIndex {holidays.DEFAULT_INDEX_YEARS}  built in {t_build / number * 1e3:.1f} ms")
+
+    date = {'year': 2017, 'month': 10, 'day': 1}
+    number = 20_000
+    t_scan = min(timeit.repeat(lambda: _scan_next_holiday(date, [HolidayTags.MUSLIM]), number=number, repeat=3))
+    t_index = min(timeit.repeat(lambda: holidays.next_holiday(date, [HolidayTags.MUSLIM]), number=number, repeat=3))
+    print(f"next_holiday (muslim)  scan {t_scan / number * 1e6:6.2f} us   index {t_index / number * 1e6:6.2f} us")
+
+    start, end = {'year': 2017, 'month': 1, 'day': 1}, {'year': 2017, 'month': 13, 'day': 5}
+    t_between = min(timeit.repeat(lambda: holidays.holidays_between(start, end), number=number, repeat=3))
+    print(f"holidays_between (one year)  {t_between / number * 1e6:6.2f} us")
+
+    t_month = min(timeit.repeat(
+        lambda: holidays.get_holidays_in_month(2017, 8, filter=[HolidayTags.PUBLIC]), number=number, repeat=3))
+    print(f"get_holidays_in_month (cached year, public)  {t_month / number * 1e6:6.2f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+Import-time benchmark: `import` of the package must stay close to free.
+
+Each scenario runs in a fresh interpreter under ``python -X importtime``, with
+the package imported under its real directory name. The loaded submodules and
+wall time are read from the child itself, because imports made through
+importlib (as the package's lazy ``__getattr__`` does) are missing from the
+importtime log. The log is then used to list the outside modules a scenario
+pulls in. A bare import must load no submodule, each public name only the
+submodules it lives in, and none of them an optional heavy dependency.
+
+Run with:  python benchmarks/bench_import.py
+"""
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = os.path.basename(ROOT)
+
+HEAVY_DEPENDENCIES = ('numpy', 'pandas', 'pyarrow', 'fastapi')
+
+SCENARIOS = (
+    (f'import {PACKAGE}', set()),
+    (f'from {PACKAGE} import to_gc', {'exceptions', 'cache', 'constants', 'utils', 'conversions'}),
+    (f'from {PACKAGE} import get_holidays_for_year',
+     {'exceptions', 'cache', 'constants', 'utils', 'conversions', 'bahire_hasab', 'holidays'}),
+)
+
+_CHILD = '''
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'submodules': [m for m in sys.modules if m.startswith({prefix!r})]}}))
+'''
+
+
+def import_profile(statement):
+    """
+    Runs `statement` in a fresh interpreter. Returns (seconds, package submodules
+    loaded, outside modules imported by the statement).
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', _CHILD.format(statement=statement, prefix=PACKAGE + '.')],
+        cwd=os.path.dirname(ROOT), capture_output=True, text=True, check=True,
+    )
+    report = json.loads(result.stdout)
+    submodules = {name[len(PACKAGE) + 1:] for name in report['submodules']}
+
+    # Everything logged after the interpreter's own startup (`site`) came from the statement.
+    outside = set()
+    started = False
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or line.count('|') != 2:
+            continue
+        name = line.split('|')[2].strip()
+        if name == 'site':
+            started = True
+        elif started and name.split('.')[0] not in (PACKAGE, 'json', '_json', 'time'):
+            outside.add(name.split('.')[0])
+    return report['seconds'], submodules, outside
+
+
+def main():
+    failed = False
+    for statement, allowed in SCENARIOS:
+        samples = [import_profile(statement) for _ in range(5)]
+        best = min(seconds for seconds, _, _ in samples)
+        _, submodules, outside = samples[0]
+        problems = [f'also loaded {", ".join(sorted(submodules - allowed))}'] if submodules - allowed else []
+        heavy = sorted(outside.intersection(HEAVY_DEPENDENCIES))
+        if heavy:
+            problems.append(f'imported {", ".join(heavy)}')
+        failed = failed or bool(problems)
+        print(f"{statement:<50} {best * 1000:6.2f} ms   {len(submodules):2d} submodules   "
+              f"{'; '.join(problems) or 'ok'}")
+        if outside:
+            print(f"{'':<50} outside modules: {', '.join(sorted(outside))}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
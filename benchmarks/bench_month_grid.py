@@ -0,0 +1,55 @@
+"""
+Benchmarks cold and cached MonthGrid builds against the month-view logic the API
+and desktop app used to repeat; tests/test_month_grid.py checks that they agree.
+
+The old views hard-coded the Pagume length, took the first column from to_gc and
+scanned the fixed and Bahire Hasab holidays per month.
+
+Run with:  python benchmarks/bench_month_grid.py
+"""
+import timeit
+
+import _package  # noqa: F401  Registers the repository as the package 'kenat'
+
+from kenat import month_grid
+from kenat.month_grid import MonthGrid
+from kenat.bahire_hasab import get_bahire_hasab
+from kenat.conversions import to_gc
+from kenat.constants import DAYS_OF_WEEK, FIXED_HOLIDAYS
+
+
+def _legacy_month(year, month_idx):
+    """The body of the old /month endpoint."""
+    num_days = 30 if month_idx < 12 else (6 if (year % 4 == 3) else 5)
+    movable = get_bahire_hasab(year).get('movableFeasts', {})
+
+    hols_map = {}
+    for k, info in FIXED_HOLIDAYS.items():
+        if info['month'] == month_idx + 1:
+            hols_map.setdefault(info['day'], []).append(k)
+    for k, info in movable.items():
+        if info.get('ethiopian', {}).get('month') == month_idx + 1:
+            hols_map.setdefault(info['ethiopian']['day'], []).append(k)
+
+    start_col = (to_gc(year, month_idx + 1, 1).weekday() + 1) % 7
+    grid = [{"day": day, "weekday": DAYS_OF_WEEK["english"][(day - 1 + start_col) % 7],
+             "holidays": hols_map.get(day, [])} for day in range(1, num_days + 1)]
+    return grid, start_col
+
+
+def main():
+    number = 2_000
+    t_legacy = min(timeit.repeat(lambda: _legacy_month(2017, 7), number=number, repeat=3)) / number
+
+    def cold_grid():
+        month_grid.clear_month_grid_cache()
+        MonthGrid.create(2017, 8, weekday_lang='english')
+    t_cold = min(timeit.repeat(cold_grid, number=number, repeat=3)) / number
+    t_warm = min(timeit.repeat(lambda: MonthGrid.create(2017, 8, weekday_lang='english'),
+                               number=number * 10, repeat=3)) / (number * 10)
+    print(f"month view   old {t_legacy * 1e6:7.2f} us   MonthGrid cold {t_cold * 1e6:7.2f} us"
+          f"   cached {t_warm * 1e6:5.2f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+"""
+Profiles get_bahire_hasab and reports the share of its time spent in input validation.
+
+The "before" run profiles the implementation that computed every date through the
+public, validating get_weekday, add_days and to_gc; it is kept below as the
+reference. The "after" run profiles the current get_bahire_hasab, which validates
+the year once and uses the trusted internal helpers for the dates it builds.
+
+Run with:  python benchmarks/profile_bahire_hasab.py
+"""
+import cProfile
+import os
+import pstats
+import timeit
+
+import _package  # noqa: F401  Registers the repository as the package 'kenat'
+
+from kenat import utils
+from kenat.bahire_hasab import get_bahire_hasab, clear_bahire_hasab_cache
+from kenat.conversions import to_gc
+from kenat.day_arithmetic import add_days
+from kenat.utils import validate_numeric_inputs, get_weekday, EthiopianDate
+from kenat.constants import (
+    DAYS_OF_WEEK,
+    EVANGELIST_NAMES,
+    TEWSAK_MAP,
+    MOVABLE_HOLIDAY_TEWSAK,
+    KEY_TO_TEWSAK_MAP,
+    HOLIDAY_INFO,
+    MOVABLE_HOLIDAYS
+)
+
+VALIDATORS = ('validate_numeric_inputs', 'validate_ethiopian_date_object', 'is_valid_ethiopian_date')
+YEARS = range(1900, 2100)
+
+
+def _legacy_bahire_hasab_base(ethiopian_year):
+    amete_alem = 5500 + ethiopian_year
+    metene_rabiet = amete_alem // 4
+    medeb = amete_alem % 19
+
+    wenber = 18 if medeb == 0 else medeb - 1
+    abektie = (wenber * 11) % 30
+    metqi = (wenber * 19) % 30 or 30
+
+    beale_metqi_month = 1 if metqi > 14 else 2
+    beale_metqi_day = metqi
+    beale_metqi_date = EthiopianDate._trusted(ethiopian_year, beale_metqi_month, beale_metqi_day)
+
+    beale_metqi_weekday = DAYS_OF_WEEK['english'][get_weekday(beale_metqi_date)]
+    tewsak = TEWSAK_MAP[beale_metqi_weekday]
+
+    mebaja_hamer_sum = beale_metqi_day + tewsak
+    mebaja_hamer = mebaja_hamer_sum % 30 if mebaja_hamer_sum > 30 else mebaja_hamer_sum
+
+    nineveh_month = 5 if metqi > 14 else 6
+    if mebaja_hamer_sum > 30:
+        nineveh_month += 1
+
+    return {
+        'amete_alem': amete_alem,
+        'metene_rabiet': metene_rabiet,
+        'medeb': medeb,
+        'wenber': wenber,
+        'abektie': abektie,
+        'metqi': metqi,
+        'beale_metqi_date': beale_metqi_date,
+        'beale_metqi_weekday': beale_metqi_weekday,
+        'mebaja_hamer': mebaja_hamer,
+        'nineveh_date': EthiopianDate._trusted(ethiopian_year, nineveh_month, mebaja_hamer),
+    }
+
+
+def _legacy_get_bahire_hasab(ethiopian_year, lang='amharic'):
+    """get_bahire_hasab as it was before the trusted internal helpers: uncached, validating every date."""
+    validate_numeric_inputs('get_bahire_hasab', ethiopian_year=ethiopian_year)
+
+    base = _legacy_bahire_hasab_base(ethiopian_year)
+
+    evangelist_remainder = base['amete_alem'] % 4
+    evangelist_name = EVANGELIST_NAMES.get(lang, EVANGELIST_NAMES['english'])[evangelist_remainder]
+
+    tinte_qemer = (base['amete_alem'] + base['metene_rabiet']) % 7
+    weekday_index = (tinte_qemer + 1) % 7
+    new_year_weekday = DAYS_OF_WEEK.get(lang, DAYS_OF_WEEK['english'])[weekday_index]
+
+    movable_feasts = {}
+    tewsak_to_key_map = {v: k for k, v in KEY_TO_TEWSAK_MAP.items()}
+
+    for tewsak_key, tewsak_value in MOVABLE_HOLIDAY_TEWSAK.items():
+        holiday_key = tewsak_to_key_map.get(tewsak_key)
+        if holiday_key:
+            date = add_days(base['nineveh_date'], tewsak_value)
+            info = HOLIDAY_INFO.get(holiday_key, {})
+            rules = MOVABLE_HOLIDAYS.get(holiday_key, {})
+
+            movable_feasts[holiday_key] = {
+                'key': holiday_key,
+                'tags': tuple(rules.get('tags', ())),
+                'movable': True,
+                'name': info.get('name', {}).get(lang) or info.get('name', {}).get('english'),
+                'description': info.get('description', {}).get(lang) or info.get('description', {}).get('english'),
+                'ethiopian': date,
+                'gregorian': to_gc(date['year'], date['month'], date['day'])
+            }
+
+    return {
+        'ameteAlem': base['amete_alem'],
+        'meteneRabiet': base['metene_rabiet'],
+        'evangelist': {'name': evangelist_name, 'remainder': evangelist_remainder},
+        'newYear': {'dayName': new_year_weekday, 'tinteQemer': tinte_qemer},
+        'medeb': base['medeb'],
+        'wenber': base['wenber'],
+        'abektie': base['abektie'],
+        'metqi': base['metqi'],
+        'bealeMetqi': {'date': base['beale_metqi_date'], 'weekday': base['beale_metqi_weekday']},
+        'mebajaHamer': base['mebaja_hamer'],
+        'nineveh': base['nineveh_date'],
+        'movableFeasts': movable_feasts
+    }
+
+
+def _legacy_workload():
+    for year in YEARS:
+        _legacy_get_bahire_hasab(year)
+
+
+def _workload(cold=True):
+    if cold:
+        clear_bahire_hasab_cache()
+    for year in YEARS:
+        get_bahire_hasab(year)
+
+
+def _profile(label, workload):
+    """Profiles one run of `workload` and prints the calls and time spent in each validator."""
+    profiler = cProfile.Profile()
+    profiler.runcall(workload)
+    stats = pstats.Stats(profiler).stats
+
+    total = sum(tottime for (_, _, _, tottime, _) in stats.values())
+    print(f"{label}\n{'  validator':<34}{'calls':>10}{'cumulative (ms)':>18}")
+    validation = 0.0
+    for (filename, _, name), (_, ncalls, _, cumtime, _) in stats.items():
+        if name in VALIDATORS and os.path.samefile(filename, utils.__file__):
+            validation += cumtime
+            print(f"  {name:<32}{ncalls:>10}{cumtime * 1000:>18.1f}")
+    print(f"  validation share of profiled time: {validation / total:.1%}")
+
+
+def main():
+    _profile(f'before: validating helpers, {len(YEARS)} calls', _legacy_workload)
+    _profile(f'after: trusted helpers, {len(YEARS)} uncached calls', _workload)
+
+    before = min(timeit.repeat(_legacy_workload, number=1, repeat=5)) / len(YEARS)
+    cold = min(timeit.repeat(_workload, number=1, repeat=5)) / len(YEARS)
+    warm = min(timeit.repeat(lambda: _workload(cold=False), number=1, repeat=5)) / len(YEARS)
+    print(f"get_bahire_hasab (unprofiled): before {before * 1e6:.1f} us per call, "
+          f"after {cold * 1e6:.1f} us uncached, {warm * 1e6:.2f} us cached")
+
+
+if __name__ == '__main__':
+    main()
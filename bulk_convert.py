@@ -0,0 +1,260 @@
+"""
+Streaming bulk date conversion for CSV and NDJSON files.
+
+Converts the named date columns of a file (or stdin) between the Ethiopian and
+Gregorian calendars. Input is read and converted in fixed-size batches, batches
+are spread over a process pool, and at most a few batches per worker are held
+in memory at any time, so multi-gigabyte exports convert in bounded memory.
+
+Usage (from the directory containing the package):
+    python -m <package>.bulk_convert --to-ec -c hire_date,birth_date payroll.csv > out.csv
+    python -m <package>.bulk_convert --to-gc -c registered --format ndjson - < parcels.ndjson
+
+Dates are read as 'yyyy-mm-dd' or 'yyyy/mm/dd' and written as 'yyyy-mm-dd'.
+Throughput is reported on stderr when the run finishes.
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .conversions import to_ec, to_gc
+from .utils import parse_date_string
+from .exceptions import InvalidDateFormatError, KenatError
+
+ON_ERROR_CHOICES = ('fail', 'keep', 'empty')
+
+
+def convert_date_string(value, direction):
+    """
+    Converts a single 'yyyy-mm-dd' or 'yyyy/mm/dd' date string.
+
+    Args:
+        value (str): The date to convert.
+        direction (str): 'to_ec' (Gregorian input) or 'to_gc' (Ethiopian input).
+
+    Returns:
+        str: The converted date as 'yyyy-mm-dd'.
+    """
+    year, month, day = parse_date_string(value)
+    if direction == 'to_ec':
+        ec = to_ec(year, month, day)
+        year, month, day = ec['year'], ec['month'], ec['day']
+    else:
+        gc = to_gc(year, month, day)
+        year, month, day = gc.year, gc.month, gc.day
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
+def _convert_value(value, direction, on_error, row_number):
+    """Converts one cell, applying the --on-error policy to bad or empty values."""
+    if value is None or value == '':
+        return value
+    try:
+        if not isinstance(value, str):
+            raise InvalidDateFormatError(value)  # e.g. an NDJSON number, bool or object
+        return convert_date_string(value, direction)
+    except KenatError as e:
+        if on_error == 'keep':
+            return value
+        if on_error == 'empty':
+            return ''
+        raise KenatError(f"Row {row_number}: {e}") from e
+
+
+def convert_csv_batch(rows, first_row, column_indexes, direction, on_error):
+    """Converts the date columns of a batch of CSV rows; returns the rendered CSV text."""
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator='\n')
+    for offset, row in enumerate(rows):
+        for idx in column_indexes:
+            if idx < len(row):
+                row[idx] = _convert_value(row[idx], direction, on_error, first_row + offset)
+        writer.writerow(row)
+    return out.getvalue()
+
+
+def _load_record(line, row_number):
+    """Parses one NDJSON line, which must hold a JSON object."""
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        raise KenatError(f"Row {row_number}: invalid JSON ({e})") from e
+    if not isinstance(record, dict):
+        raise KenatError(f"Row {row_number}: expected a JSON object, got {type(record).__name__}")
+    return record
+
+
+def convert_ndjson_batch(lines, first_row, columns, direction, on_error):
+    """
+    Converts the date fields of a batch of NDJSON lines; returns the rendered lines.
+    Under --on-error, a line that is not a JSON object is kept as is or dropped ('empty').
+    """
+    out = []
+    for offset, line in enumerate(lines):
+        if not line.strip():
+            continue
+        try:
+            record = _load_record(line, first_row + offset)
+        except KenatError:
+            if on_error == 'keep':
+                out.append(line.rstrip('\r\n'))
+                out.append('\n')
+            if on_error != 'fail':
+                continue
+            raise
+        for name in columns:
+            if name in record:
+                record[name] = _convert_value(record[name], direction, on_error, first_row + offset)
+        out.append(json.dumps(record, ensure_ascii=False))
+        out.append('\n')
+    return ''.join(out)
+
+
+def _batches(iterable, size):
+    """Groups an iterable into lists of at most `size` items."""
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _run_batches(func, batches, fixed_args, workers):
+    """
+    Applies `func` to each (batch, first_row) pair and yields results in input order.
+    With more than one worker, at most 2 * workers batches are in flight at once.
+    """
+    if workers <= 1:
+        for batch, first_row in batches:
+            yield len(batch), func(batch, first_row, *fixed_args)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for batch, first_row in batches:
+            pending.append((len(batch), pool.submit(func, batch, first_row, *fixed_args)))
+            if len(pending) >= 2 * workers:
+                size, future = pending.popleft()
+                yield size, future.result()
+        while pending:
+            size, future = pending.popleft()
+            yield size, future.result()
+
+
+def _numbered_batches(iterable, size, first_row):
+    """Yields (batch, number of the batch's first row) pairs."""
+    for batch in _batches(iterable, size):
+        yield batch, first_row
+        first_row += len(batch)
+
+
+def convert_stream(infile, outfile, columns, direction, fmt='csv', chunk_size=10000,
+                   workers=1, on_error='fail'):
+    """
+    Streams `infile` to `outfile`, converting the named date columns.
+
+    Args:
+        infile: A text file object to read from.
+        outfile: A text file object to write to.
+        columns (list): Names of the date columns (CSV header names or NDJSON keys).
+        direction (str): 'to_ec' or 'to_gc'.
+        fmt (str): 'csv' or 'ndjson'.
+        chunk_size (int): Number of rows per batch.
+        workers (int): Number of worker processes; 1 converts in-process.
+        on_error (str): 'fail' to stop, 'keep' to leave the value as is, or 'empty' to blank it
+            (for an NDJSON line that is not a JSON object, to drop the line).
+
+    Returns:
+        int: The number of data rows processed.
+    """
+    if fmt == 'csv':
+        reader = csv.reader(infile)
+        header = next(reader, None)
+        if header is None:
+            return 0
+        missing = [name for name in columns if name not in header]
+        if missing:
+            raise KenatError(f"Column(s) not found in CSV header: {', '.join(missing)}")
+        csv.writer(outfile, lineterminator='\n').writerow(header)
+        column_indexes = [header.index(name) for name in columns]
+        results = _run_batches(convert_csv_batch, _numbered_batches(reader, chunk_size, 2),
+                               (column_indexes, direction, on_error), workers)
+    else:
+        results = _run_batches(convert_ndjson_batch, _numbered_batches(infile, chunk_size, 1),
+                               (columns, direction, on_error), workers)
+
+    rows = 0
+    for size, text in results:
+        outfile.write(text)
+        rows += size
+    return rows
+
+
+def _detect_format(path):
+    """Guesses the input format from the file extension, defaulting to CSV."""
+    if path and os.path.splitext(path)[1].lower() in ('.ndjson', '.jsonl'):
+        return 'ndjson'
+    return 'csv'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog=f'python -m {__spec__.name if __spec__ else "bulk_convert"}',
+        description='Convert date columns of a CSV/NDJSON file between the Ethiopian and Gregorian calendars.',
+    )
+    parser.add_argument('input', nargs='?', default='-', help="input file, or '-' for stdin (default)")
+    direction = parser.add_mutually_exclusive_group(required=True)
+    direction.add_argument('--to-ec', dest='direction', action='store_const', const='to_ec',
+                           help='convert Gregorian dates to Ethiopian')
+    direction.add_argument('--to-gc', dest='direction', action='store_const', const='to_gc',
+                           help='convert Ethiopian dates to Gregorian')
+    parser.add_argument('-c', '--columns', required=True,
+                        help='comma-separated names of the date columns to convert')
+    parser.add_argument('-o', '--output', default='-', help="output file, or '-' for stdout (default)")
+    parser.add_argument('-f', '--format', choices=('csv', 'ndjson'),
+                        help='input format (default: from the file extension, else csv)')
+    parser.add_argument('--chunk-size', type=int, default=10000, help='rows per batch (default: 10000)')
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count() or 1,
+                        help='worker processes (default: number of CPUs)')
+    parser.add_argument('--on-error', choices=ON_ERROR_CHOICES, default='fail',
+                        help='what to do with invalid dates or NDJSON lines (default: fail)')
+    args = parser.parse_args(argv)
+
+    if args.chunk_size < 1 or args.workers < 1:
+        parser.error('--chunk-size and --workers must be at least 1')
+
+    columns = [name.strip() for name in args.columns.split(',') if name.strip()]
+    fmt = args.format or _detect_format(None if args.input == '-' else args.input)
+
+    infile = sys.stdin if args.input == '-' else open(args.input, newline='', encoding='utf-8')
+    outfile = sys.stdout if args.output == '-' else open(args.output, 'w', newline='', encoding='utf-8')
+    start = time.perf_counter()
+    try:
+        rows = convert_stream(infile, outfile, columns, args.direction, fmt,
+                              args.chunk_size, args.workers, args.on_error)
+    except (KenatError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if infile is not sys.stdin:
+            infile.close()
+        if outfile is not sys.stdout:
+            outfile.close()
+
+    elapsed = time.perf_counter() - start
+    rate = rows / elapsed if elapsed > 0 else float('inf')
+    print(f"Converted {rows:,} rows in {elapsed:.2f}s ({rate:,.0f} rows/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
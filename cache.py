@@ -0,0 +1,111 @@
+import threading
+from collections import OrderedDict
+
+from .exceptions import KenatError
+
+# --- Bounded LRU Cache ---
+
+class LRUCache:
+    """
+    A thread-safe, size-bounded least-recently-used cache with hit/miss/eviction counters.
+    """
+    def __init__(self, maxsize):
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise KenatError(f"Cache maxsize must be a positive integer, got {maxsize!r}")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key, compute, *args):
+        """
+        Returns the cached value for `key`, calling `compute(*args)` and storing
+        the result on a miss. Exceptions raised by `compute` are not cached.
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+            except TypeError:
+                # Unhashable arguments are left to `compute` to reject.
+                return compute(*args)
+            else:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value
+
+        value = compute(*args)
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self):
+        """Drops all entries and resets the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        """Returns the cache counters as a dict."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hitRate': self.hits / lookups if lookups else 0.0,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+            }
+
+# --- Conversion Cache ---
+# Opt-in memoization of to_gc, to_ec and get_weekday. While disabled, the wrapped
+# functions only pay for a single global lookup.
+
+CACHED_FUNCTIONS = ('to_gc', 'to_ec', 'get_weekday')
+
+_conversion_caches = None
+
+def get_conversion_cache(func_name):
+    """Returns the active LRUCache for `func_name`, or None when caching is disabled."""
+    if _conversion_caches is None:
+        return None
+    return _conversion_caches[func_name]
+
+def enable_conversion_cache(maxsize=4096):
+    """
+    Turns on memoization of to_gc, to_ec and get_weekday, each with its own LRU of
+    at most `maxsize` entries. Calling it again replaces the existing caches.
+    """
+    global _conversion_caches
+    _conversion_caches = {name: LRUCache(maxsize) for name in CACHED_FUNCTIONS}
+
+def disable_conversion_cache():
+    """Turns memoization off and releases all cached results."""
+    global _conversion_caches
+    _conversion_caches = None
+
+def clear_conversion_cache():
+    """Empties the conversion caches and resets their counters, keeping them enabled."""
+    if _conversion_caches is not None:
+        for cache in _conversion_caches.values():
+            cache.clear()
+
+def conversion_cache_info():
+    """
+    Returns the hit/miss/eviction counters of each conversion cache.
+
+    Returns:
+        dict: Function name -> counters, or an empty dict when caching is disabled.
+    """
+    if _conversion_caches is None:
+        return {}
+    return {name: cache.info() for name, cache in _conversion_caches.items()}
@@ -0,0 +1,218 @@
+"""
+Vectorized Ethiopian date support for pandas and pyarrow.
+
+Importing this module registers an ``.ethiopian`` accessor on pandas Series:
+
+    from <package> import columnar
+    s = pd.Series(pd.to_datetime(['2025-01-07', '2024-09-11']))
+    s.ethiopian.to_ec()          # DataFrame of Ethiopian year/month/day
+    s.ethiopian.month_name()     # Categorical of Ethiopian month names
+    s.ethiopian.is_holiday()     # bool Series flagging fixed, movable and Islamic holidays
+    pd.Series(['2017/4/29']).ethiopian.to_gc()   # datetime64 Series
+
+All paths run on whole columns through the batch conversion API; invalid or
+out-of-range rows come back as missing values instead of raising.
+"""
+import numpy as np
+import pandas as pd
+
+from .conversions import to_ec_many, to_gc_many
+from .utils import ethiopian_to_jdn, DATE_STRING_PATTERN
+from .holidays import _year_holiday_days, _HOLIDAY_MASKS, tags_to_mask
+from .constants import MONTH_NAMES, UNIX_EPOCH_JDN
+
+
+def _parse_date_strings(series):
+    """
+    Splits 'yyyy-mm-dd' / 'yyyy/mm/dd' strings into year, month and day arrays.
+
+    One regex pass flags the rows matching DATE_STRING_PATTERN. Those rows are
+    plain ASCII, so they are read as a byte matrix: the two separators split
+    each row, and the (at most four) digits before the end of each part are
+    summed by place value.
+
+    Returns:
+        tuple: (year, month, day, parsed); int64 arrays that are 0 where `parsed` is False.
+    """
+    text = series.astype('string').str.strip()
+    parsed = text.str.fullmatch(DATE_STRING_PATTERN.pattern).to_numpy(dtype=bool, na_value=False)
+    parts = np.zeros((3, len(series)), dtype=np.int64)
+    if not parsed.any():
+        return (*parts, parsed)
+
+    matched = text[parsed].to_numpy(dtype=object).astype('S')
+    codes = matched.view(np.uint8).reshape(len(matched), matched.itemsize)
+    is_separator = (codes == ord('-')) | (codes == ord('/'))
+    first = is_separator.argmax(axis=1)
+    second = codes.shape[1] - 1 - is_separator[:, ::-1].argmax(axis=1)
+    length = (codes != 0).sum(axis=1)  # Shorter rows are padded with NUL bytes
+    rows = np.arange(len(matched))
+    for k, (start, end) in enumerate(((0, first), (first + 1, second), (second + 1, length))):
+        value = np.zeros(len(matched), dtype=np.int64)
+        for place in range(4):
+            position = end - 1 - place
+            digit = codes[rows, np.maximum(position, 0)].astype(np.int64) - ord('0')
+            value += np.where(position >= start, digit, 0) * 10 ** place
+        parts[k, parsed] = value
+    return (*parts, parsed)
+
+
+def _holiday_day_numbers(ethiopian_years, tags=None):
+    """Returns the JDNs of all holidays (carrying any of `tags`) in the given Ethiopian years."""
+    mask = tags_to_mask(tags) if tags else -1  # -1 has every bit set
+    day_numbers = [day for year in ethiopian_years
+                   for day, key in _year_holiday_days(int(year)) if _HOLIDAY_MASKS[key] & mask]
+    return np.array(day_numbers, dtype=np.int64)
+
+
+@pd.api.extensions.register_series_accessor('ethiopian')
+class EthiopianAccessor:
+    """
+    Ethiopian calendar operations on a pandas Series.
+
+    `to_ec`, `year`, `month`, `day`, `month_name` and `is_holiday` expect Gregorian
+    dates (datetime64 values or anything `pd.to_datetime` accepts). `to_gc` expects
+    Ethiopian dates written as 'yyyy-mm-dd' or 'yyyy/mm/dd' strings.
+    """
+    def __init__(self, series):
+        self._series = series
+
+    def _gregorian_days(self):
+        """Returns the Series as a numpy datetime64[D] array."""
+        values = self._series
+        if not pd.api.types.is_datetime64_any_dtype(values):
+            values = pd.to_datetime(values, errors='coerce')
+        if getattr(values.dt, 'tz', None) is not None:
+            values = values.dt.tz_localize(None)
+        return values.to_numpy(dtype='datetime64[D]')
+
+    def _ethiopian_parts(self):
+        """
+        Converts the Series and returns (days, dates, valid). Nothing is kept between
+        calls: pandas may reuse one accessor per Series, which can be modified in place.
+        """
+        days = self._gregorian_days()
+        dates, valid = to_ec_many(days)
+        return days, dates, valid
+
+    def _int_series(self, values, valid, name):
+        return pd.Series(pd.arrays.IntegerArray(values.astype(np.int64), ~valid),
+                         index=self._series.index, name=name)
+
+    def to_ec(self):
+        """
+        Converts Gregorian dates to Ethiopian dates.
+
+        Returns:
+            pandas.DataFrame: Nullable integer `year`, `month` and `day` columns.
+        """
+        _, dates, valid = self._ethiopian_parts()
+        return pd.DataFrame({
+            field: pd.arrays.IntegerArray(dates[field].astype(np.int64), ~valid)
+            for field in ('year', 'month', 'day')
+        }, index=self._series.index)
+
+    @property
+    def year(self):
+        """The Ethiopian year of each Gregorian date."""
+        _, dates, valid = self._ethiopian_parts()
+        return self._int_series(dates['year'], valid, 'year')
+
+    @property
+    def month(self):
+        """The Ethiopian month (1-13) of each Gregorian date."""
+        _, dates, valid = self._ethiopian_parts()
+        return self._int_series(dates['month'], valid, 'month')
+
+    @property
+    def day(self):
+        """The Ethiopian day of month of each Gregorian date."""
+        _, dates, valid = self._ethiopian_parts()
+        return self._int_series(dates['day'], valid, 'day')
+
+    def month_name(self, lang='english'):
+        """
+        Returns the Ethiopian month name of each Gregorian date.
+
+        Args:
+            lang (str): 'english' or 'amharic'.
+
+        Returns:
+            pandas.Series: An ordered Categorical; invalid rows are missing.
+        """
+        _, dates, valid = self._ethiopian_parts()
+        codes = np.where(valid, dates['month'].astype(np.int64) - 1, -1)
+        names = MONTH_NAMES.get(lang, MONTH_NAMES['english'])
+        categorical = pd.Categorical.from_codes(codes, categories=names, ordered=True)
+        return pd.Series(categorical, index=self._series.index, name='month_name')
+
+    def is_holiday(self, tags=None):
+        """
+        Flags Gregorian dates that fall on a fixed, movable or Islamic holiday.
+
+        Args:
+            tags (list, optional): Only count holidays carrying any of these HolidayTags.
+
+        Returns:
+            pandas.Series: Booleans; invalid rows are False.
+        """
+        days, dates, valid = self._ethiopian_parts()
+        day_numbers = np.where(valid, days.astype(np.int64), 0) + UNIX_EPOCH_JDN
+        holidays = _holiday_day_numbers(np.unique(dates['year'][valid]), tags)
+        flags = valid & np.isin(day_numbers, holidays)
+        return pd.Series(flags, index=self._series.index, name='is_holiday')
+
+    def to_gc(self):
+        """
+        Converts Ethiopian 'yyyy-mm-dd' / 'yyyy/mm/dd' strings to Gregorian dates.
+
+        Returns:
+            pandas.Series: datetime64[s] values; unparseable or invalid rows are NaT.
+            Second resolution covers every year, unlike nanoseconds (1677-2262).
+        """
+        year, month, day, parsed = _parse_date_strings(self._series)
+        _, valid = to_gc_many(year, month, day)
+        valid &= parsed
+        days = ethiopian_to_jdn(year, month, day) - UNIX_EPOCH_JDN
+        values = np.where(valid, days, 0).astype('datetime64[D]')
+        values[~valid] = np.datetime64('NaT')
+        return pd.Series(values.astype('datetime64[s]'), index=self._series.index, name=self._series.name)
+
+
+# --- Arrow Kernels ---
+# pyarrow is optional; it is only imported when these functions are called.
+
+def arrow_to_ec(array):
+    """
+    Converts a pyarrow date/timestamp array to Ethiopian dates.
+
+    Returns:
+        pyarrow.StructArray: `year`, `month` and `day` fields; invalid rows are null.
+    """
+    import pyarrow as pa
+
+    days = array.cast(pa.date32()).to_numpy(zero_copy_only=False).astype('datetime64[D]')
+    dates, valid = to_ec_many(days)
+    return pa.StructArray.from_arrays(
+        [pa.array(dates[field], mask=~valid) for field in ('year', 'month', 'day')],
+        names=['year', 'month', 'day'],
+    )
+
+
+def arrow_to_gc(year, month, day):
+    """
+    Converts pyarrow integer arrays of Ethiopian year/month/day to Gregorian dates.
+
+    Returns:
+        pyarrow.Date32Array: The Gregorian dates; invalid or null rows are null.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    columns = [pc.fill_null(column, 0).to_numpy(zero_copy_only=False).astype(np.int64)
+               for column in (year, month, day)]
+    not_null = ~np.asarray(pc.or_(pc.or_(pc.is_null(year), pc.is_null(month)), pc.is_null(day)))
+    _, valid = to_gc_many(*columns)
+    valid &= not_null
+    days = ethiopian_to_jdn(*columns) - UNIX_EPOCH_JDN
+    return pa.array(np.where(valid, days, 0).astype(np.int32), type=pa.date32(), mask=~valid)
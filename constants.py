@@ -204,4 +204,32 @@ FIXED_HOLIDAYS = {
     'adwa': { 'month': 6, 'day': 23, 'tags': [HolidayTags.PUBLIC, HolidayTags.STATE] },
     'labour': { 'month': 8, 'day': 23, 'tags': [HolidayTags.PUBLIC, HolidayTags.STATE] },
     'patriots': { 'month': 8, 'day': 27, 'tags': [HolidayTags.PUBLIC, HolidayTags.STATE] },
-}
\ No newline at end of file
+}
+
+# Day-number anchors for the integer conversion core
+ETHIOPIAN_EPOCH_JDN = 1724221  # Julian Day Number of Meskerem 1, year 1 (E.C.)
+JDN_ORDINAL_OFFSET = 1721425  # JDN minus datetime.date.toordinal() for the same day
+UNIX_EPOCH_JDN = 2440588  # JDN of 1970-01-01, day zero of numpy.datetime64[D]
+HIJRI_EPOCH_JDN = 1948439  # JDN of 1 Muharram 1 AH in the tabular (astronomical epoch) Islamic calendar
+
+# Hijri (month, day) of the Islamic holidays; their dates move about 11 days earlier each year
+ISLAMIC_HOLIDAY_HIJRI_DATES = {
+    'moulid': (3, 12),   # 12 Rabi al-Awwal
+    'eidFitr': (10, 1),  # 1 Shawwal
+    'eidAdha': (12, 10), # 10 Dhu al-Hijja
+}
+
+# Bit assigned to each HolidayTags value, so a tag filter is a single AND on a holiday's tag mask
+HOLIDAY_TAG_BITS = {
+    HolidayTags.PUBLIC: 1 << 0,
+    HolidayTags.RELIGIOUS: 1 << 1,
+    HolidayTags.CHRISTIAN: 1 << 2,
+    HolidayTags.MUSLIM: 1 << 3,
+    HolidayTags.STATE: 1 << 4,
+    HolidayTags.CULTURAL: 1 << 5,
+    HolidayTags.OTHER: 1 << 6,
+}
+
+# Ethiopian clock: hour 12 of the day period is 06:00 on the civil (Gregorian) clock
+ETHIOPIAN_CLOCK_OFFSET_SECONDS = 6 * 3600
+EAT_UTC_OFFSET_SECONDS = 3 * 3600  # East Africa Time, the civil time zone of Ethiopia (UTC+3)
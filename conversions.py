@@ -1,12 +1,18 @@
 import datetime
-import math
-from utils import (
-    is_gregorian_leap_year,
+from .utils import (
     is_ethiopian_leap_year,
     get_ethiopian_days_in_month,
-    validate_numeric_inputs
+    get_gregorian_days_in_month,
+    validate_numeric_inputs,
+    EthiopianDate,
+    ethiopian_to_jdn,
+    jdn_to_ethiopian,
+    gregorian_to_jdn,
+    jdn_to_gregorian
 )
-from exceptions import InvalidEthiopianDateError, InvalidGregorianDateError, KenatError
+from .exceptions import InvalidEthiopianDateError, InvalidGregorianDateError, KenatError
+from . import cache
+from .constants import JDN_ORDINAL_OFFSET, UNIX_EPOCH_JDN, HIJRI_EPOCH_JDN
 
 
 
@@ -22,128 +28,175 @@ def to_gc(eth_year, eth_month, eth_day):
     Returns:
         datetime.date: The equivalent Gregorian date object.
     """
+    memo = cache.get_conversion_cache('to_gc')
+    if memo is not None:
+        return memo.get_or_compute((eth_year, eth_month, eth_day), _to_gc, eth_year, eth_month, eth_day)
+    return _to_gc(eth_year, eth_month, eth_day)
+
+def _to_gc(eth_year, eth_month, eth_day):
+    """Uncached implementation of to_gc."""
     # 1. Validate input types and date range 
     validate_numeric_inputs('to_gc', eth_year=eth_year, eth_month=eth_month, eth_day=eth_day)
     if not 1 <= eth_month <= 13 or not 1 <= eth_day <= get_ethiopian_days_in_month(eth_year, eth_month):
         raise InvalidEthiopianDateError(eth_year, eth_month, eth_day)
 
-    # 2. Determine the Gregorian date of the Ethiopian New Year 
-    gregorian_year = eth_year + 7
-    new_year_day = 12 if is_gregorian_leap_year(gregorian_year + 1) else 11
-    new_year_date = datetime.date(gregorian_year, 9, new_year_day)
+    # 2. Map the date onto its day number and back onto the Gregorian calendar
+    return _to_gc_unchecked(eth_year, eth_month, eth_day)
 
-    # 3. Calculate days elapsed since the Ethiopian new year and add to the new year date 
-    days_to_add = (eth_month - 1) * 30 + (eth_day - 1)
-    
-    return new_year_date + datetime.timedelta(days=days_to_add)
+def _to_gc_unchecked(eth_year, eth_month, eth_day):
+    """Trusted fast path of to_gc for internal callers holding known-valid dates: no validation or caching."""
+    return datetime.date.fromordinal(ethiopian_to_jdn(eth_year, eth_month, eth_day) - JDN_ORDINAL_OFFSET)
 
 def to_ec(greg_year, greg_month, greg_day):
     """
     Converts a Gregorian date to the Ethiopian calendar (EC) date.
+
+    Returns:
+        EthiopianDate: The equivalent Ethiopian date. It is immutable and also behaves
+        as a read-only {'year', 'month', 'day'} mapping.
     """
+    memo = cache.get_conversion_cache('to_ec')
+    if memo is not None:
+        return memo.get_or_compute((greg_year, greg_month, greg_day), _to_ec, greg_year, greg_month, greg_day)
+    return _to_ec(greg_year, greg_month, greg_day)
+
+def _to_ec(greg_year, greg_month, greg_day):
+    """Uncached implementation of to_ec."""
     # 1. Validate input types
     validate_numeric_inputs('to_ec', g_year=greg_year, g_month=greg_month, g_day=greg_day)
     
     # 2. Validate date validity and range (1900-2100) to match original library
-    try:
-        greg_date = datetime.date(greg_year, greg_month, greg_day)
-        if not (datetime.date(1900, 1, 1) <= greg_date <= datetime.date(2100, 12, 31)):
-             raise InvalidGregorianDateError(greg_year, greg_month, greg_day)
-    except (ValueError, InvalidGregorianDateError): # Catch both invalid dates and out-of-range
+    if not (1900 <= greg_year <= 2100 and 1 <= greg_month <= 12
+            and 1 <= greg_day <= get_gregorian_days_in_month(greg_year, greg_month)):
         raise InvalidGregorianDateError(greg_year, greg_month, greg_day)
 
-    # 3. Determine the corresponding Ethiopian year
-    eth_year = greg_year - 8
-    greg_of_eth_new_year = to_gc(eth_year + 1, 1, 1)
-    if greg_date >= greg_of_eth_new_year:
-        eth_year += 1
+    # 3. Convert through the day number shared by both calendars
+    eth_year, eth_month, eth_day = jdn_to_ethiopian(gregorian_to_jdn(greg_year, greg_month, greg_day))
 
-    # 4. Calculate the difference in days from that Ethiopian New Year
-    new_year_greg_date = to_gc(eth_year, 1, 1)
-    days_diff = (greg_date - new_year_greg_date).days
-    
-    # 5. Convert the day difference into Ethiopian month and day
-    eth_month = (days_diff // 30) + 1
-    eth_day = (days_diff % 30) + 1
-    
-    return {'year': eth_year, 'month': eth_month, 'day': eth_day}
+    return EthiopianDate._trusted(eth_year, eth_month, eth_day)
 
 def _gregorian_to_jd(year, month, day):
     """Converts a Gregorian date to Julian Day Number."""
-    if month < 3:
-        year -= 1
-        month += 12
-    a = year // 100
-    b = a // 4
-    c = 2 - a + b
-    e = int(365.25 * (year + 4716))
-    f = int(30.6001 * (month + 1))
-    return c + day + e + f - 1524
+    return gregorian_to_jdn(year, month, day)
 
 def _jd_to_gregorian(jd):
     """Converts a Julian Day Number to a Gregorian date."""
-    q = jd + 0.5
-    z = int(q)
-    w = (z - 1867216.25) / 36524.25
-    x = w // 4
-    a = z + 1 + w - x
-    b = a + 1524
-    c = (b - 122.1) / 365.25
-    d = int(c)
-    e = int(365.25 * d)
-    f = int((b - e) / 30.6001)
-    day = b - e - int(30.6001 * f)
-    month = f - 1 if f < 14 else f - 13
-    year = d - 4716 if month > 2 else d - 4715
-    return datetime.date(year, month, day)
+    return datetime.date(*jdn_to_gregorian(jd))
 
 def _hijri_to_jd(year, month, day):
-    """Converts a Hijri date to Julian Day Number."""
-    # This is the corrected formula for the Tabular Islamic Calendar.
-    return int((11 * year + 3) / 30) + 354 * year + 30 * month - int((month - 1) / 2) + day + 1948440 - 385
+    """Converts a Hijri date to Julian Day Number using the tabular Islamic calendar."""
+    # Months alternate 30/29 days; 11 leap days are spread over each 30-year cycle.
+    return HIJRI_EPOCH_JDN - 1 + 354 * (year - 1) + (3 + 11 * year) // 30 + (59 * (month - 1) + 1) // 2 + day
 
 def _jd_to_hijri(jd):
     """Converts a Julian Day Number to a Hijri date using the tabular Islamic calendar."""
-    jd = math.floor(jd) + 0.5  # Ensure it's at start of day
-    jd = jd - 1948439.5
-    year = int((30 * jd + 10646) // 10631)
-    start_of_year = 354 * (year - 1) + math.floor((3 + 11 * year) / 30)
-    day_of_year = int(jd - start_of_year)
-    month = int((day_of_year) // 29.5) + 1
-    if month > 12:
-        month = 12
-    start_of_month = 29.5 * (month - 1)
-    day = int(jd - (start_of_year + start_of_month)) + 1
+    year = (30 * (jd - HIJRI_EPOCH_JDN) + 10646) // 10631
+    day_of_year = jd - _hijri_to_jd(year, 1, 1)
+    month = min(12, 2 * day_of_year // 59 + 1)
+    day = jd - _hijri_to_jd(year, month, 1) + 1
     return {'year': year, 'month': month, 'day': day}
 
 def hijri_to_gregorian(h_year, h_month, h_day, gregorian_year):
     """
-    Converts a Hijri date to a Gregorian date by searching within a given Gregorian year.
-    This mimics the brute-force search methodology of the original JavaScript code.
+    Converts a Hijri date to a Gregorian date, provided it falls within the given Gregorian year.
+
+    Returns:
+        datetime.date: The matching Gregorian date, or None if the Hijri date does not
+        exist or does not fall within `gregorian_year`.
     """
-    # Start searching from the beginning of the previous Gregorian year to be safe.
-    base_date = datetime.date(gregorian_year - 1, 1, 1)
+    jd = _hijri_to_jd(h_year, h_month, h_day)
+    year, month, day = jdn_to_gregorian(jd)
+    if year != gregorian_year or _jd_to_hijri(jd) != {'year': h_year, 'month': h_month, 'day': h_day}:
+        return None
+    return datetime.date(year, month, day)
 
-    # Search for up to 730 days (2 years) to guarantee finding the date.
-    for offset in range(731):
-        test_date = base_date + datetime.timedelta(days=offset)
+def get_hijri_year(greg_date):
+    """Gets the Hijri year from a Gregorian date object."""
+    jd = _gregorian_to_jd(greg_date.year, greg_date.month, greg_date.day)
+    return _jd_to_hijri(jd)['year']
 
-        # For each day, find its corresponding Hijri date using our JDN functions.
-        jd = _gregorian_to_jd(test_date.year, test_date.month, test_date.day)
-        hijri_parts = _jd_to_hijri(jd)
+# --- Vectorized Batch Conversion ---
+# NumPy is only needed by the batch API, so it is imported on first use.
 
-        # Check if we have a match for the target date within the target year.
-        if (
-            hijri_parts['year'] == h_year and
-            hijri_parts['month'] == h_month and
-            hijri_parts['day'] == h_day and
-            test_date.year == gregorian_year
-        ):
-            return test_date  # Found it!
+DATE_PARTS_DTYPE = [('year', 'i4'), ('month', 'i1'), ('day', 'i1')]
 
-    return None
+_GREGORIAN_MONTH_LENGTHS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
 
-def get_hijri_year(greg_date):
-    """Gets the Hijri year from a Gregorian date object."""
-    jd = _gregorian_to_jd(greg_date.year, greg_date.month, greg_date.day)
-    return _jd_to_hijri(jd)['year']
\ No newline at end of file
+
+def _pack_date_parts(year, month, day, valid):
+    """Builds the structured year/month/day array returned by the batch API."""
+    import numpy as np
+
+    out = np.zeros(valid.shape, dtype=DATE_PARTS_DTYPE)
+    out['year'] = np.where(valid, year, 0)
+    out['month'] = np.where(valid, month, 0)
+    out['day'] = np.where(valid, day, 0)
+    return out
+
+
+def to_gc_many(eth_year, eth_month, eth_day):
+    """
+    Converts arrays of Ethiopian dates to the Gregorian calendar in one vectorized pass.
+
+    Args:
+        eth_year (array-like): Ethiopian years.
+        eth_month (array-like): Ethiopian months (1-13).
+        eth_day (array-like): Ethiopian days.
+
+    Returns:
+        tuple: ``(dates, valid)`` where ``dates`` is a structured array with ``year``,
+        ``month`` and ``day`` fields and ``valid`` is a boolean mask. Invalid rows are
+        flagged False in the mask and zero-filled instead of raising.
+    """
+    import numpy as np
+
+    year, month, day = np.broadcast_arrays(
+        np.asarray(eth_year, dtype=np.int64),
+        np.asarray(eth_month, dtype=np.int64),
+        np.asarray(eth_day, dtype=np.int64),
+    )
+    month_length = np.where(month == 13, 5 + (year % 4 == 3), 30)
+    valid = (year >= 1) & (month >= 1) & (month <= 13) & (day >= 1) & (day <= month_length)
+
+    g_year, g_month, g_day = jdn_to_gregorian(ethiopian_to_jdn(year, month, day))
+    return _pack_date_parts(g_year, g_month, g_day, valid), valid
+
+
+def to_ec_many(greg_year, greg_month=None, greg_day=None):
+    """
+    Converts arrays of Gregorian dates to the Ethiopian calendar in one vectorized pass.
+
+    Args:
+        greg_year (array-like): Gregorian years, or a ``datetime64`` array holding whole
+            dates, in which case ``greg_month`` and ``greg_day`` are omitted.
+        greg_month (array-like): Gregorian months (1-12).
+        greg_day (array-like): Gregorian days.
+
+    Returns:
+        tuple: ``(dates, valid)`` where ``dates`` is a structured array with ``year``,
+        ``month`` and ``day`` fields and ``valid`` is a boolean mask. Rows that are not
+        valid Gregorian dates within 1900-2100 (or are NaT) are flagged False and zero-filled.
+    """
+    import numpy as np
+
+    greg_year = np.asarray(greg_year)
+    if np.issubdtype(greg_year.dtype, np.datetime64):
+        days = greg_year.astype('datetime64[D]')
+        not_nat = ~np.isnat(days)
+        jdn = np.where(not_nat, days.astype(np.int64), 0) + UNIX_EPOCH_JDN
+        year, month, day = jdn_to_gregorian(jdn)
+        valid = not_nat & (year >= 1900) & (year <= 2100)
+    else:
+        year, month, day = np.broadcast_arrays(
+            greg_year.astype(np.int64),
+            np.asarray(greg_month, dtype=np.int64),
+            np.asarray(greg_day, dtype=np.int64),
+        )
+        leap = (year % 4 == 0) & (year % 100 != 0) | (year % 400 == 0)
+        lengths = np.asarray(_GREGORIAN_MONTH_LENGTHS)[np.clip(month, 1, 12) - 1] + (leap & (month == 2))
+        valid = ((year >= 1900) & (year <= 2100) & (month >= 1) & (month <= 12)
+                 & (day >= 1) & (day <= lengths))
+        jdn = gregorian_to_jdn(year, month, day)
+
+    e_year, e_month, e_day = jdn_to_ethiopian(jdn)
+    return _pack_date_parts(e_year, e_month, e_day, valid), valid
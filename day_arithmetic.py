@@ -1,8 +1,15 @@
-from utils import (
+from collections.abc import Sequence
+
+from .exceptions import KenatError, InvalidInputTypeError
+from .conversions import DATE_PARTS_DTYPE
+from .utils import (
     get_ethiopian_days_in_month,
     is_ethiopian_leap_year,
     validate_numeric_inputs,
-    validate_ethiopian_date_object
+    validate_ethiopian_date_object,
+    EthiopianDate,
+    ethiopian_to_jdn,
+    jdn_to_ethiopian
 )
 
 def add_days(ethiopian, days):
@@ -10,45 +17,40 @@ def add_days(ethiopian, days):
     Adds a specified number of days to an Ethiopian date.
 
     Args:
-        ethiopian (dict): The starting Ethiopian date {'year', 'month', 'day'}.
-        days (int): The number of days to add.
+        ethiopian (EthiopianDate or dict): The starting Ethiopian date {'year', 'month', 'day'}.
+        days (int): The number of days to add; negative values move backward.
 
     Returns:
-        dict: The resulting Ethiopian date.
+        EthiopianDate: The resulting Ethiopian date.
     """
     validate_ethiopian_date_object(ethiopian, 'add_days', 'ethiopian') # 
     validate_numeric_inputs('add_days', days=days) # 
     
-    # Create mutable copies
-    year, month, day = ethiopian['year'], ethiopian['month'], ethiopian['day']
-    day += days
-
-    # Roll over the days into months and years
-    while day > get_ethiopian_days_in_month(year, month): # 
-        day -= get_ethiopian_days_in_month(year, month) # 
-        month += 1 # 
-        if month > 13: # 
-            month = 1 # 
-            year += 1 # 
-            
-    return {'year': year, 'month': month, 'day': day}
+    return _add_days(ethiopian['year'], ethiopian['month'], ethiopian['day'], days)
+
+def _add_days(year, month, day, days):
+    """Unvalidated core of add_days, for internal callers holding known-valid dates."""
+    # Work on day numbers so any offset, forward or backward, costs the same.
+    return EthiopianDate._trusted(*jdn_to_ethiopian(ethiopian_to_jdn(year, month, day) + days))
 
 def add_months(ethiopian, months):
     """
     Adds a specified number of months to an Ethiopian date.
 
     Args:
-        ethiopian (dict): The starting Ethiopian date {'year', 'month', 'day'}.
-        months (int): The number of months to add.
+        ethiopian (EthiopianDate or dict): The starting Ethiopian date {'year', 'month', 'day'}.
+        months (int): The number of months to add; negative values move backward.
 
     Returns:
-        dict: The resulting Ethiopian date.
+        EthiopianDate: The resulting Ethiopian date.
     """
     validate_ethiopian_date_object(ethiopian, 'add_months', 'ethiopian') # 
     validate_numeric_inputs('add_months', months=months) # 
-    
-    year, month, day = ethiopian['year'], ethiopian['month'], ethiopian['day']
-    
+
+    return _add_months(ethiopian['year'], ethiopian['month'], ethiopian['day'], months)
+
+def _add_months(year, month, day, months):
+    """Unvalidated core of add_months, shared with the date ranges."""
     total_months = month + months # 
     year += (total_months - 1) // 13 # 
     month = ((total_months - 1) % 13) + 1 # 
@@ -59,40 +61,42 @@ def add_months(ethiopian, months):
     if day > days_in_target_month: # 
         day = days_in_target_month # 
         
-    return {'year': year, 'month': month, 'day': day}
+    return EthiopianDate._trusted(year, month, day)
 
 def add_years(ethiopian, years):
     """
     Adds a specified number of years to an Ethiopian date.
 
     Args:
-        ethiopian (dict): The starting Ethiopian date {'year', 'month', 'day'}.
-        years (int): The number of years to add.
+        ethiopian (EthiopianDate or dict): The starting Ethiopian date {'year', 'month', 'day'}.
+        years (int): The number of years to add; negative values move backward.
 
     Returns:
-        dict: The resulting Ethiopian date.
+        EthiopianDate: The resulting Ethiopian date.
     """
     validate_ethiopian_date_object(ethiopian, 'add_years', 'ethiopian') # 
     validate_numeric_inputs('add_years', years=years) # 
 
-    year, month, day = ethiopian['year'], ethiopian['month'], ethiopian['day']
+    return _add_years(ethiopian['year'], ethiopian['month'], ethiopian['day'], years)
+
+def _add_years(year, month, day, years):
+    """Unvalidated core of add_years, shared with the date ranges."""
     year += years # 
 
     # Handle the case where the original date was a leap day (Pagume 6),
     # and the new date is in a non-leap year.
     if month == 13 and day == 6 and not is_ethiopian_leap_year(year): # 
         day = 5 # 
-        
 
-    return {'year': year, 'month': month, 'day': day}
+    return EthiopianDate._trusted(year, month, day)
 
 def diff_in_days(date_a, date_b):
     """
     Calculates the difference in days between two Ethiopian dates.
 
     Args:
-        date_a (dict): The first Ethiopian date.
-        date_b (dict): The second Ethiopian date.
+        date_a (EthiopianDate or dict): The first Ethiopian date.
+        date_b (EthiopianDate or dict): The second Ethiopian date.
 
     Returns:
         int: The difference in days.
@@ -100,20 +104,9 @@ def diff_in_days(date_a, date_b):
     validate_ethiopian_date_object(date_a, 'diff_in_days', 'a') # 
     validate_ethiopian_date_object(date_b, 'diff_in_days', 'b') # 
 
-    def total_days(eth_date): # 
-        """Helper to count days from a fixed epoch (year 1, month 1, day 1)."""
-        days = 0
-        # Add days from full years
-        for y in range(1, eth_date['year']): # 
-            days += 366 if is_ethiopian_leap_year(y) else 365 # 
-        # Add days from full months in the current year
-        for m in range(1, eth_date['month']): # 
-            days += get_ethiopian_days_in_month(eth_date['year'], m)
-        # Add days in the current month
-        days += eth_date['day'] # 
-        return days
-
-    return total_days(date_a) - total_days(date_b) # 
+    # Both dates are mapped to day numbers, so the cost is constant for any year.
+    return (ethiopian_to_jdn(date_a['year'], date_a['month'], date_a['day'])
+            - ethiopian_to_jdn(date_b['year'], date_b['month'], date_b['day']))
 
 def diff_in_months(date_a, date_b):
     """
@@ -148,4 +141,203 @@ def diff_in_years(date_a, date_b):
        (date_a['month'] == date_b['month'] and date_a['day'] < date_b['day']): # 
         diff -= 1 # 
         
-    return diff
\ No newline at end of file
+    return diff
+
+# --- Vectorized Batch Arithmetic ---
+# Array versions of the functions above. Dates are structured arrays with 'year',
+# 'month' and 'day' fields (DATE_PARTS_DTYPE, as returned by to_ec_many); offsets
+# may be arrays or scalars and broadcast against them. Like the scalar functions,
+# they do not check that each input date exists. NumPy is imported on first use.
+
+def _date_columns(dates):
+    """Splits a structured date array into int64 year, month and day arrays."""
+    import numpy as np
+
+    dates = np.asarray(dates)
+    return (dates['year'].astype(np.int64), dates['month'].astype(np.int64),
+            dates['day'].astype(np.int64))
+
+def _pack_dates(year, month, day):
+    """Packs year, month and day arrays into a DATE_PARTS_DTYPE structured array."""
+    import numpy as np
+
+    year, month, day = np.broadcast_arrays(year, month, day)
+    out = np.empty(year.shape, dtype=DATE_PARTS_DTYPE)
+    out['year'] = year
+    out['month'] = month
+    out['day'] = day
+    return out
+
+def add_days_many(dates, days):
+    """
+    Vectorized add_days: adds `days` (array or scalar, may be negative) to each date.
+
+    Returns:
+        numpy.ndarray: A structured array of the resulting Ethiopian dates.
+    """
+    import numpy as np
+
+    year, month, day = _date_columns(dates)
+    jdn = ethiopian_to_jdn(year, month, day) + np.asarray(days, dtype=np.int64)
+    return _pack_dates(*jdn_to_ethiopian(jdn))
+
+def add_months_many(dates, months):
+    """
+    Vectorized add_months, capping the day at the length of the target month.
+
+    Returns:
+        numpy.ndarray: A structured array of the resulting Ethiopian dates.
+    """
+    import numpy as np
+
+    year, month, day = _date_columns(dates)
+    total_months = month + np.asarray(months, dtype=np.int64)
+    year = year + (total_months - 1) // 13
+    month = (total_months - 1) % 13 + 1
+    days_in_target_month = np.where(month == 13, 5 + (year % 4 == 3), 30)
+    return _pack_dates(year, month, np.minimum(day, days_in_target_month))
+
+def add_years_many(dates, years):
+    """
+    Vectorized add_years, moving Pagume 6 to Pagume 5 in non-leap target years.
+
+    Returns:
+        numpy.ndarray: A structured array of the resulting Ethiopian dates.
+    """
+    import numpy as np
+
+    year, month, day = _date_columns(dates)
+    year = year + np.asarray(years, dtype=np.int64)
+    day = np.where((month == 13) & (day == 6) & (year % 4 != 3), 5, day)
+    return _pack_dates(year, month, day)
+
+def diff_in_days_many(dates_a, dates_b):
+    """Vectorized diff_in_days; returns an int64 array of day differences."""
+    year_a, month_a, day_a = _date_columns(dates_a)
+    year_b, month_b, day_b = _date_columns(dates_b)
+    return ethiopian_to_jdn(year_a, month_a, day_a) - ethiopian_to_jdn(year_b, month_b, day_b)
+
+def diff_in_months_many(dates_a, dates_b):
+    """Vectorized diff_in_months; returns an int64 array of whole-month differences."""
+    year_a, month_a, day_a = _date_columns(dates_a)
+    year_b, month_b, day_b = _date_columns(dates_b)
+    return (year_a * 13 + month_a) - (year_b * 13 + month_b) - (day_a < day_b)
+
+def diff_in_years_many(dates_a, dates_b):
+    """Vectorized diff_in_years; returns an int64 array of whole-year differences."""
+    year_a, month_a, day_a = _date_columns(dates_a)
+    year_b, month_b, day_b = _date_columns(dates_b)
+    not_reached = (month_a < month_b) | ((month_a == month_b) & (day_a < day_b))
+    return year_a - year_b - not_reached
+
+# --- Date Ranges ---
+
+RANGE_UNITS = ('day', 'week', 'month', 'year')
+
+class EthiopianDateRange(Sequence):
+    """
+    A lazy, immutable sequence of Ethiopian dates spaced by a fixed stride.
+
+    Like the built-in ``range``, it stores only its origin and a range of step
+    offsets, so iterating a century of days uses constant memory. It supports
+    ``len()``, indexing, slicing and ``reversed()`` in constant time.
+
+    Month and year strides are always measured from the origin, so a range of
+    month-ends starting on day 30 returns to day 30 after passing Pagume.
+    """
+    __slots__ = ('_origin', '_unit', '_offsets')
+
+    def __init__(self, origin, unit, offsets):
+        self._origin = origin
+        self._unit = unit
+        self._offsets = offsets
+
+    def _date_at(self, offset):
+        year, month, day = self._origin
+        if self._unit == 'day':
+            return EthiopianDate._trusted(*jdn_to_ethiopian(ethiopian_to_jdn(year, month, day) + offset))
+        if self._unit == 'week':
+            return EthiopianDate._trusted(*jdn_to_ethiopian(ethiopian_to_jdn(year, month, day) + 7 * offset))
+        if self._unit == 'month':
+            return _add_months(year, month, day, offset)
+        return _add_years(year, month, day, offset)
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return EthiopianDateRange(self._origin, self._unit, self._offsets[index])
+        return self._date_at(self._offsets[index])
+
+    def __iter__(self):
+        if self._unit in ('day', 'week'):
+            # Walk day numbers directly instead of re-deriving each date from the origin.
+            stride = 7 if self._unit == 'week' else 1
+            base = ethiopian_to_jdn(*self._origin)
+            for offset in self._offsets:
+                yield EthiopianDate._trusted(*jdn_to_ethiopian(base + stride * offset))
+        else:
+            for offset in self._offsets:
+                yield self._date_at(offset)
+
+    def __reversed__(self):
+        return iter(self[::-1])
+
+    def __repr__(self):
+        offsets = self._offsets
+        return (f"EthiopianDateRange(origin={EthiopianDate._trusted(*self._origin)!r}, "
+                f"unit={self._unit!r}, offsets=range({offsets.start}, {offsets.stop}, {offsets.step}))")
+
+def date_range(start, stop, step=1, unit='day'):
+    """
+    Returns a lazy range of Ethiopian dates from `start` up to, but not including, `stop`.
+
+    Args:
+        start (EthiopianDate or dict): The first Ethiopian date.
+        stop (EthiopianDate or dict): The date at which the range ends (exclusive).
+        step (int): The stride in `unit`s; negative values iterate backward, in which
+            case `stop` should come before `start`.
+        unit (str): One of 'day', 'week', 'month' or 'year'.
+
+    Returns:
+        EthiopianDateRange: A sequence supporting len(), indexing, slicing and reversed().
+    """
+    validate_ethiopian_date_object(start, 'date_range', 'start')
+    validate_ethiopian_date_object(stop, 'date_range', 'stop')
+    if not isinstance(step, int) or isinstance(step, bool):
+        raise InvalidInputTypeError('date_range', 'step', 'int', step)
+    start = EthiopianDate.coerce(start)  # Raises InvalidEthiopianDateError for e.g. month 14
+    stop = EthiopianDate.coerce(stop)
+    if unit not in RANGE_UNITS:
+        raise KenatError(f"Invalid date_range unit: \"{unit}\". Expected one of {', '.join(RANGE_UNITS)}.")
+    if step == 0:
+        raise KenatError("date_range step must not be zero.")
+
+    origin = (start.year, start.month, start.day)
+    start_jdn = ethiopian_to_jdn(*origin)
+    stop_jdn = ethiopian_to_jdn(stop.year, stop.month, stop.day)
+
+    if unit in ('day', 'week'):
+        stride = step * (7 if unit == 'week' else 1)
+        count = max(0, -(-(stop_jdn - start_jdn) // stride))
+    else:
+        if unit == 'month':
+            span = (stop.year * 13 + stop.month) - (start.year * 13 + start.month)
+        else:
+            span = stop.year - start.year
+        dates = EthiopianDateRange(origin, unit, None)
+
+        def before_stop(k):
+            date = dates._date_at(k * step)
+            jdn = ethiopian_to_jdn(date.year, date.month, date.day)
+            return jdn < stop_jdn if step > 0 else jdn > stop_jdn
+
+        # Start from the whole-unit estimate and correct for day clamping at either end.
+        count = max(0, -(-span // step))
+        while count > 0 and not before_stop(count - 1):
+            count -= 1
+        while before_stop(count):
+            count += 1
+
+    return EthiopianDateRange(origin, unit, range(0, count * step, step))
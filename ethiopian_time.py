@@ -0,0 +1,264 @@
+"""
+Ethiopian clock time.
+
+The Ethiopian day is counted from sunrise: civil 06:00 is 12:00 in the 'day'
+period (ጠዋት), 07:00 is 1:00, and civil 18:00 starts the 'night' period (ማታ)
+again at 12:00. The calendar date itself follows the civil date, as in to_ec.
+
+Time is backed by a single int (seconds since 12:00 day, i.e. civil 06:00).
+The batch functions work on NumPy arrays of epoch seconds or datetime64 values
+and return structured arrays, without creating a Python object per row.
+"""
+import datetime
+from functools import total_ordering
+
+from .conversions import to_ec, DATE_PARTS_DTYPE
+from .utils import (
+    validate_numeric_inputs,
+    validate_ethiopian_date_object,
+    ethiopian_to_jdn,
+    jdn_to_ethiopian,
+    jdn_to_gregorian,
+    EthiopianDate,
+    _Immutable,
+    _slot_setters
+)
+from .exceptions import InvalidTimeError
+from .constants import (
+    PERIOD_LABELS,
+    ETHIOPIAN_CLOCK_OFFSET_SECONDS,
+    EAT_UTC_OFFSET_SECONDS,
+    UNIX_EPOCH_JDN,
+    JDN_ORDINAL_OFFSET
+)
+
+SECONDS_PER_DAY = 86400
+_HALF_DAY = SECONDS_PER_DAY // 2
+PERIODS = ('day', 'night')
+
+
+@total_ordering
+class Time(_Immutable):
+    """
+    An immutable Ethiopian clock time.
+
+    Args:
+        hour (int): The Ethiopian hour, 1-12.
+        minute (int): 0-59.
+        period (str): 'day' (civil 06:00-17:59) or 'night' (civil 18:00-05:59).
+        second (int): 0-59.
+    """
+    __slots__ = ('_seconds',)
+
+    def __init__(self, hour, minute=0, period='day', second=0):
+        validate_numeric_inputs('Time', hour=hour, minute=minute, second=second)
+        if not 1 <= hour <= 12:
+            raise InvalidTimeError(f"Invalid Ethiopian hour {hour}: expected 1-12")
+        if not 0 <= minute <= 59:
+            raise InvalidTimeError(f"Invalid minute {minute}: expected 0-59")
+        if not 0 <= second <= 59:
+            raise InvalidTimeError(f"Invalid second {second}: expected 0-59")
+        if period not in PERIODS:
+            raise InvalidTimeError(f"Invalid period '{period}': expected 'day' or 'night'")
+        seconds = (hour % 12) * 3600 + minute * 60 + second
+        _set_seconds(self, int(seconds) + (_HALF_DAY if period == 'night' else 0))
+
+    @classmethod
+    def _from_seconds(cls, seconds):
+        """Builds a Time from seconds since 12:00 day (0-86399), skipping validation."""
+        self = object.__new__(cls)
+        _set_seconds(self, seconds)
+        return self
+
+    @classmethod
+    def from_gregorian(cls, hour, minute=0, second=0):
+        """
+        Converts a civil (24-hour) clock time to Ethiopian time.
+
+        Args:
+            hour (int): 0-23.
+            minute (int): 0-59.
+            second (int): 0-59.
+        """
+        validate_numeric_inputs('Time.from_gregorian', hour=hour, minute=minute, second=second)
+        if not (0 <= hour <= 23 and 0 <= minute <= 59 and 0 <= second <= 59):
+            raise InvalidTimeError(f"Invalid Gregorian time {hour}:{minute}:{second}")
+        seconds = int(hour * 3600 + minute * 60 + second)
+        return cls._from_seconds((seconds - ETHIOPIAN_CLOCK_OFFSET_SECONDS) % SECONDS_PER_DAY)
+
+    def to_gregorian(self):
+        """Returns the civil clock time as a datetime.time."""
+        hour, rest = divmod((self._seconds + ETHIOPIAN_CLOCK_OFFSET_SECONDS) % SECONDS_PER_DAY, 3600)
+        return datetime.time(hour, *divmod(rest, 60))
+
+    def __reduce__(self):
+        return (type(self)._from_seconds, (self._seconds,))
+
+    @property
+    def hour(self):
+        """The Ethiopian hour, 1-12."""
+        return (self._seconds % _HALF_DAY) // 3600 or 12
+
+    @property
+    def minute(self):
+        return self._seconds % 3600 // 60
+
+    @property
+    def second(self):
+        return self._seconds % 60
+
+    @property
+    def period(self):
+        """'day' or 'night'."""
+        return 'night' if self._seconds >= _HALF_DAY else 'day'
+
+    def format(self, lang='amharic', seconds=False):
+        """Returns the time as 'h:mm period', with the Amharic period label by default."""
+        period = self.period
+        label = PERIOD_LABELS[period] if lang == 'amharic' else period
+        clock = f"{self.hour}:{self.minute:02d}" + (f":{self.second:02d}" if seconds else '')
+        return f"{clock} {label}"
+
+    # --- Comparison and hashing (in order from civil 06:00; see total_ordering) ---
+
+    def __hash__(self):
+        return hash(self._seconds)
+
+    def __eq__(self, other):
+        if not isinstance(other, Time):
+            return NotImplemented
+        return self._seconds == other._seconds
+
+    def __lt__(self, other):
+        if not isinstance(other, Time):
+            return NotImplemented
+        return self._seconds < other._seconds
+
+    def __str__(self):
+        return self.format('english')
+
+    def __repr__(self):
+        return f"Time({self.hour}, {self.minute}, '{self.period}', {self.second})"
+
+
+_set_seconds = _slot_setters(Time, '_seconds')[0]
+
+
+# --- Date and Time Conversion ---
+
+def to_ethiopian_datetime(value, utc_offset=EAT_UTC_OFFSET_SECONDS):
+    """
+    Converts a Gregorian datetime or a Unix timestamp to an Ethiopian date and time.
+
+    Args:
+        value (datetime.datetime or int or float): A datetime, read at its own wall
+            clock time, or epoch seconds.
+        utc_offset (int): For epoch seconds, the civil time zone as seconds east of
+            UTC (East Africa Time by default).
+
+    Returns:
+        tuple: (EthiopianDate, Time).
+    """
+    if isinstance(value, datetime.datetime):
+        seconds = value.hour * 3600 + value.minute * 60 + value.second
+        date = to_ec(value.year, value.month, value.day)
+    else:
+        validate_numeric_inputs('to_ethiopian_datetime', value=value, utc_offset=utc_offset)
+        days, seconds = divmod(int(value // 1) + utc_offset, SECONDS_PER_DAY)
+        year, month, day = jdn_to_gregorian(days + UNIX_EPOCH_JDN)
+        date = to_ec(year, month, day)
+    return date, Time._from_seconds((seconds - ETHIOPIAN_CLOCK_OFFSET_SECONDS) % SECONDS_PER_DAY)
+
+
+def to_gregorian_datetime(ethiopian, time):
+    """
+    Converts an Ethiopian date and time to a naive Gregorian (civil wall clock) datetime.
+
+    Args:
+        ethiopian (EthiopianDate or dict): The Ethiopian date.
+        time (Time): The Ethiopian time.
+    """
+    validate_ethiopian_date_object(ethiopian, 'to_gregorian_datetime', 'ethiopian')
+    date = EthiopianDate.coerce(ethiopian)
+    if not isinstance(time, Time):
+        raise InvalidTimeError(f"Expected a Time, got {type(time).__name__}")
+    day = datetime.date.fromordinal(ethiopian_to_jdn(date.year, date.month, date.day) - JDN_ORDINAL_OFFSET)
+    return datetime.datetime.combine(day, time.to_gregorian())
+
+
+# --- Vectorized Batch Conversion ---
+# NumPy is imported on first use. 'period' is 0 for day and 1 for night.
+
+DATETIME_PARTS_DTYPE = DATE_PARTS_DTYPE + [
+    ('hour', 'i1'), ('minute', 'i1'), ('second', 'i1'), ('period', 'i1'),
+]
+
+
+def to_ethiopian_datetime_many(timestamps, utc_offset=EAT_UTC_OFFSET_SECONDS):
+    """
+    Converts arrays of Unix timestamps to Ethiopian dates and times in one pass.
+
+    Args:
+        timestamps (array-like): Epoch seconds (int or float), or a datetime64 array
+            read as UTC.
+        utc_offset (int): The civil time zone as seconds east of UTC (EAT by default).
+
+    Returns:
+        tuple: ``(parts, valid)`` where ``parts`` is a structured array with ``year``,
+        ``month``, ``day``, ``hour`` (1-12), ``minute``, ``second`` and ``period``
+        fields and ``valid`` is a boolean mask. NaN/NaT rows and dates outside
+        1900-2100 are flagged False and zero-filled.
+    """
+    import numpy as np
+
+    timestamps = np.asarray(timestamps)
+    if np.issubdtype(timestamps.dtype, np.datetime64):
+        stamps = timestamps.astype('datetime64[s]')
+        valid = ~np.isnat(stamps)
+        seconds = np.where(valid, stamps.astype(np.int64), 0)
+    elif np.issubdtype(timestamps.dtype, np.floating):
+        valid = np.isfinite(timestamps)
+        seconds = np.floor(np.where(valid, timestamps, 0)).astype(np.int64)
+    else:
+        valid = np.ones(timestamps.shape, dtype=bool)
+        seconds = timestamps.astype(np.int64)
+
+    days, civil_seconds = np.divmod(seconds + utc_offset, SECONDS_PER_DAY)
+    jdn = days + UNIX_EPOCH_JDN
+    greg_year = jdn_to_gregorian(jdn)[0]
+    valid &= (greg_year >= 1900) & (greg_year <= 2100)
+    year, month, day = jdn_to_ethiopian(jdn)
+
+    ethiopian_seconds = (civil_seconds - ETHIOPIAN_CLOCK_OFFSET_SECONDS) % SECONDS_PER_DAY
+    hour = (ethiopian_seconds % _HALF_DAY) // 3600
+    out = np.zeros(valid.shape, dtype=DATETIME_PARTS_DTYPE)
+    for field, values in (('year', year), ('month', month), ('day', day),
+                          ('hour', np.where(hour == 0, 12, hour)),
+                          ('minute', ethiopian_seconds % 3600 // 60),
+                          ('second', ethiopian_seconds % 60),
+                          ('period', ethiopian_seconds >= _HALF_DAY)):
+        out[field] = np.where(valid, values, 0)
+    return out, valid
+
+
+def to_timestamps_many(parts, utc_offset=EAT_UTC_OFFSET_SECONDS):
+    """
+    Converts a structured array of Ethiopian dates and times (as returned by
+    to_ethiopian_datetime_many) back to Unix timestamps.
+
+    Args:
+        parts (numpy.ndarray): An array with DATETIME_PARTS_DTYPE fields.
+        utc_offset (int): The civil time zone as seconds east of UTC (EAT by default).
+
+    Returns:
+        numpy.ndarray: int64 epoch seconds. Like the other batch functions, the
+        input dates and times are not checked.
+    """
+    import numpy as np
+
+    year, month, day, hour, minute, second, period = (
+        parts[field].astype(np.int64) for field in ('year', 'month', 'day', 'hour', 'minute', 'second', 'period'))
+    ethiopian_seconds = (hour % 12) * 3600 + minute * 60 + second + period * _HALF_DAY
+    civil_seconds = (ethiopian_seconds + ETHIOPIAN_CLOCK_OFFSET_SECONDS) % SECONDS_PER_DAY
+    days = ethiopian_to_jdn(year, month, day) - UNIX_EPOCH_JDN
+    return days * SECONDS_PER_DAY + civil_seconds - utc_offset
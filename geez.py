@@ -0,0 +1,170 @@
+"""
+Conversion between Arabic numbers and Ge'ez numerals.
+
+Ge'ez numerals have no zero and no place value. Each number below 100 is a tens
+sign followed by a ones sign, ፻ multiplies what precedes it by 100 and ፼ by
+10000, and a leading 1 before ፻ or ፼ is left out (100 is ፻, 10000 is ፼).
+
+Numbers up to GEEZ_TABLE_LIMIT, which covers every day and year in practical
+use, are served from tables built on first use; larger ones are converted
+algorithmically.
+"""
+from .exceptions import GeezConverterError
+
+GEEZ_ONES = ('', '፩', '፪', '፫', '፬', '፭', '፮', '፯', '፰', '፱')
+GEEZ_TENS = ('', '፲', '፳', '፴', '፵', '፶', '፷', '፸', '፹', '፺')
+GEEZ_HUNDRED = '፻'
+GEEZ_TEN_THOUSAND = '፼'
+
+GEEZ_TABLE_LIMIT = 10000
+
+_ONES_VALUES = {char: value for value, char in enumerate(GEEZ_ONES) if char}
+_TENS_VALUES = {char: value * 10 for value, char in enumerate(GEEZ_TENS) if char}
+
+_tables = None
+
+
+def _geez_tables():
+    """
+    Builds, once, the tuple of Ge'ez strings for 0..GEEZ_TABLE_LIMIT and its
+    reverse {string: number} map.
+    """
+    global _tables
+    if _tables is None:
+        below_100 = [GEEZ_TENS[n // 10] + GEEZ_ONES[n % 10] for n in range(100)]
+        strings = ['0']
+        for n in range(1, GEEZ_TABLE_LIMIT + 1):
+            strings.append(_to_geez_algorithmic(n, below_100))
+        strings = tuple(strings)
+        _tables = (strings, {string: n for n, string in enumerate(strings)})
+    return _tables
+
+
+def _to_geez_algorithmic(number, below_100=None):
+    """Converts a positive integer by splitting off ten-thousands, then hundreds."""
+    def convert_below_100(n):
+        return below_100[n] if below_100 else GEEZ_TENS[n // 10] + GEEZ_ONES[n % 10]
+
+    if number >= 10000:
+        upper, remainder = divmod(number, 10000)
+        upper_part = _to_geez_algorithmic(upper, below_100) if upper > 1 else ''
+        return upper_part + GEEZ_TEN_THOUSAND + (_to_geez_algorithmic(remainder, below_100) if remainder else '')
+    if number >= 100:
+        hundreds, remainder = divmod(number, 100)
+        return (convert_below_100(hundreds) if hundreds > 1 else '') + GEEZ_HUNDRED + convert_below_100(remainder)
+    return convert_below_100(number)
+
+
+def _parse_below_100(text, original):
+    """Parses an optional tens sign followed by an optional ones sign."""
+    value = 0
+    rest = text
+    if rest and rest[0] in _TENS_VALUES:
+        value += _TENS_VALUES[rest[0]]
+        rest = rest[1:]
+    if rest and rest[0] in _ONES_VALUES:
+        value += _ONES_VALUES[rest[0]]
+        rest = rest[1:]
+    if rest:
+        raise GeezConverterError(f"Invalid Ge'ez numeral \"{original}\": unexpected \"{rest[0]}\"")
+    return value
+
+
+def _to_arabic_algorithmic(text, original):
+    """
+    Parses a Ge'ez numeral. The last ፼ splits the numeral into a multiplier of
+    10000 (itself a numeral, empty meaning 1) and a remainder below 10000, which
+    ፻ splits the same way.
+    """
+    split = text.rfind(GEEZ_TEN_THOUSAND)
+    if split >= 0:
+        upper = text[:split]
+        upper_value = _to_arabic_algorithmic(upper, original) if upper else 1
+        return upper_value * 10000 + _to_arabic_algorithmic(text[split + 1:], original)
+    split = text.find(GEEZ_HUNDRED)
+    if split >= 0:
+        upper = text[:split]
+        upper_value = _parse_below_100(upper, original) if upper else 1
+        if upper and not upper_value:
+            raise GeezConverterError(f"Invalid Ge'ez numeral \"{original}\"")
+        return upper_value * 100 + _parse_below_100(text[split + 1:], original)
+    return _parse_below_100(text, original)
+
+
+def to_geez(number):
+    """
+    Converts a non-negative integer to Ge'ez numerals.
+
+    Args:
+        number (int or str): The number, or a string of decimal digits.
+
+    Returns:
+        str: The Ge'ez numeral. Ge'ez has no zero, so 0 is returned as '0'.
+
+    Raises:
+        GeezConverterError: If the input is not a non-negative integer.
+    """
+    if isinstance(number, str):
+        digits = number.strip()
+        if not (digits.isascii() and digits.isdigit()):  # isdigit alone also accepts e.g. '፩' and '²'
+            raise GeezConverterError(f"Input must be a non-negative integer, got \"{number}\"")
+        number = int(digits)
+    elif not isinstance(number, int) or isinstance(number, bool):
+        raise GeezConverterError(f"Input must be a number or a string, got {type(number).__name__}")
+    if number < 0:
+        raise GeezConverterError(f"Input must be a non-negative integer, got {number}")
+    if number <= GEEZ_TABLE_LIMIT:
+        return _geez_tables()[0][number]
+    return _to_geez_algorithmic(number)
+
+
+def to_arabic(geez):
+    """
+    Converts Ge'ez numerals to an integer.
+
+    Args:
+        geez (str): The Ge'ez numeral, e.g. '፳፻፲፯'.
+
+    Returns:
+        int: The number.
+
+    Raises:
+        GeezConverterError: If the input is not a string or contains anything but Ge'ez numerals.
+    """
+    if not isinstance(geez, str):
+        raise GeezConverterError(f"Input must be a string, got {type(geez).__name__}")
+    value = _geez_tables()[1].get(geez)
+    if value is not None:
+        return value
+    text = geez.strip()
+    if not text:
+        raise GeezConverterError("Input must be a non-empty string")
+    return _to_arabic_algorithmic(text, geez)
+
+
+# --- Batch Conversion ---
+# The same conversions over sequences (including NumPy integer arrays). Values in
+# the table range are plain lookups; anything else goes through the scalar path.
+
+def to_geez_many(numbers):
+    """
+    Converts a sequence of non-negative integers to Ge'ez numerals.
+
+    Returns:
+        list: The Ge'ez numerals, in input order.
+    """
+    if hasattr(numbers, 'tolist'):
+        numbers = numbers.tolist()  # NumPy scalars become plain ints
+    strings = _geez_tables()[0]
+    return [strings[n] if type(n) is int and 0 <= n <= GEEZ_TABLE_LIMIT else to_geez(n) for n in numbers]
+
+
+def to_arabic_many(geez_numerals):
+    """
+    Converts a sequence of Ge'ez numerals to integers.
+
+    Returns:
+        list: The numbers, in input order.
+    """
+    values = _geez_tables()[1]
+    return [values[g] if type(g) is str and g in values else to_arabic(g) for g in geez_numerals]
@@ -0,0 +1,417 @@
+"""
+Holiday listings for the Ethiopian calendar: per-year and per-month holiday
+lists, the Islamic holidays, and a day-number index for range queries.
+
+The Islamic holidays follow the lunar Hijri calendar and drift about 11 days
+earlier every year, so a single Ethiopian or Gregorian year can hold the same
+holiday twice (or, in principle, not at all). Dates use the tabular Hijri
+calendar, like conversions.hijri_to_gregorian.
+"""
+import datetime
+from bisect import bisect_left, bisect_right
+from types import MappingProxyType
+
+from .utils import (
+    validate_numeric_inputs,
+    validate_ethiopian_date_object,
+    ethiopian_to_jdn,
+    jdn_to_ethiopian,
+    EthiopianDate
+)
+from .conversions import _hijri_to_jd, _jd_to_hijri
+from .bahire_hasab import _movable_feast_date
+from .exceptions import UnknownHolidayError, InvalidEthiopianDateError, KenatError
+from .cache import LRUCache
+from .constants import (
+    ISLAMIC_HOLIDAY_HIJRI_DATES,
+    JDN_ORDINAL_OFFSET,
+    FIXED_HOLIDAYS,
+    MOVABLE_HOLIDAYS,
+    MOVABLE_HOLIDAY_TEWSAK,
+    KEY_TO_TEWSAK_MAP,
+    HOLIDAY_INFO,
+    HOLIDAY_TAG_BITS
+)
+
+
+# --- Islamic Holidays ---
+# Occurrences are computed once per year, for every Islamic holiday at once, and
+# kept in bounded caches as read-only mappings of date tuples.
+
+_islamic_ethiopian_cache = LRUCache(512)
+_islamic_gregorian_cache = LRUCache(512)
+
+
+def _islamic_holiday_days(first_jdn, end_jdn):
+    """
+    Returns {holiday key: tuple of JDNs} for every Islamic holiday falling in
+    [first_jdn, end_jdn), in date order.
+    """
+    first_hijri_year = _jd_to_hijri(first_jdn)['year']
+    last_hijri_year = _jd_to_hijri(end_jdn - 1)['year']
+    days = {}
+    for holiday_key, (month, day) in ISLAMIC_HOLIDAY_HIJRI_DATES.items():
+        days[holiday_key] = tuple(
+            jdn for jdn in (_hijri_to_jd(year, month, day) for year in range(first_hijri_year, last_hijri_year + 1))
+            if first_jdn <= jdn < end_jdn
+        )
+    return days
+
+
+def _calculate_islamic_holidays(ethiopian_year):
+    days = _islamic_holiday_days(ethiopian_to_jdn(ethiopian_year, 1, 1), ethiopian_to_jdn(ethiopian_year + 1, 1, 1))
+    return MappingProxyType({
+        key: tuple(EthiopianDate._trusted(*jdn_to_ethiopian(jdn)) for jdn in jdns)
+        for key, jdns in days.items()
+    })
+
+
+def _calculate_islamic_holidays_gregorian(gregorian_year):
+    first_day = datetime.date(gregorian_year, 1, 1).toordinal() + JDN_ORDINAL_OFFSET
+    end_day = datetime.date(gregorian_year, 12, 31).toordinal() + JDN_ORDINAL_OFFSET + 1
+    days = _islamic_holiday_days(first_day, end_day)
+    return MappingProxyType({
+        key: tuple(datetime.date.fromordinal(jdn - JDN_ORDINAL_OFFSET) for jdn in jdns)
+        for key, jdns in days.items()
+    })
+
+
+def get_islamic_holidays(ethiopian_year):
+    """
+    Returns the dates of the Islamic holidays (eidFitr, eidAdha, moulid) in an Ethiopian year.
+
+    Args:
+        ethiopian_year (int): The Ethiopian year.
+
+    Returns:
+        Mapping: A read-only {holiday key: tuple of EthiopianDate} mapping. A holiday
+        that falls twice in the year has two dates, in date order.
+    """
+    validate_numeric_inputs('get_islamic_holidays', ethiopian_year=ethiopian_year)
+    return _islamic_ethiopian_cache.get_or_compute(ethiopian_year, _calculate_islamic_holidays, ethiopian_year)
+
+
+def get_islamic_holidays_gregorian(gregorian_year):
+    """
+    Returns the dates of the Islamic holidays (eidFitr, eidAdha, moulid) in a Gregorian year.
+
+    Returns:
+        Mapping: A read-only {holiday key: tuple of datetime.date} mapping, in date order.
+    """
+    validate_numeric_inputs('get_islamic_holidays_gregorian', gregorian_year=gregorian_year)
+    return _islamic_gregorian_cache.get_or_compute(
+        gregorian_year, _calculate_islamic_holidays_gregorian, gregorian_year)
+
+
+def get_islamic_holiday(holiday_key, ethiopian_year):
+    """
+    Returns the dates of one Islamic holiday in an Ethiopian year.
+
+    Args:
+        holiday_key (str): 'eidFitr', 'eidAdha' or 'moulid'.
+        ethiopian_year (int): The Ethiopian year.
+
+    Returns:
+        tuple: The holiday's EthiopianDate occurrences in the year (usually one, sometimes two).
+    """
+    if holiday_key not in ISLAMIC_HOLIDAY_HIJRI_DATES:
+        raise UnknownHolidayError(holiday_key)
+    return get_islamic_holidays(ethiopian_year)[holiday_key]
+
+
+def clear_islamic_holiday_cache():
+    """Empties the per-year Islamic holiday caches and resets their counters."""
+    _islamic_ethiopian_cache.clear()
+    _islamic_gregorian_cache.clear()
+
+
+# --- Tag Bitmasks ---
+# Each holiday's tags are folded into one integer (see HOLIDAY_TAG_BITS), so a
+# tag filter is `holiday_mask & filter_mask` rather than list membership tests.
+
+_HOLIDAY_TAGS = {key: tuple(info['tags']) for key, info in FIXED_HOLIDAYS.items()}
+_HOLIDAY_TAGS.update((key, tuple(info['tags'])) for key, info in MOVABLE_HOLIDAYS.items())
+
+
+def tags_to_mask(tags):
+    """
+    Folds HolidayTags into a bitmask.
+
+    Args:
+        tags: A tag, an iterable of tags, or an int mask (returned unchanged).
+
+    Returns:
+        int: The OR of the tags' bits; a holiday matches a filter when `mask & filter` is non-zero.
+    """
+    if isinstance(tags, int):
+        return tags
+    if isinstance(tags, str):
+        tags = (tags,)
+    mask = 0
+    for tag in tags:
+        bit = HOLIDAY_TAG_BITS.get(tag)
+        if bit is None:
+            raise KenatError(f"Unknown holiday tag: \"{tag}\"")
+        mask |= bit
+    return mask
+
+
+_HOLIDAY_MASKS = {key: tags_to_mask(tags) for key, tags in _HOLIDAY_TAGS.items()}
+
+
+# --- Holidays per Year ---
+# The (day number, key) list of a year is computed once and cached; the localized
+# holiday objects built from it are cached per (year, lang), like get_bahire_hasab.
+
+_year_cache = LRUCache(512)
+_year_view_cache = LRUCache(256)
+
+
+def _calculate_year_holiday_days(ethiopian_year):
+    """Returns (JDN, holiday key) pairs for every fixed, movable and Islamic holiday in a year, by date."""
+    days = [(ethiopian_to_jdn(ethiopian_year, info['month'], info['day']), key)
+            for key, info in FIXED_HOLIDAYS.items()]
+    for key, tewsak_key in KEY_TO_TEWSAK_MAP.items():
+        date = _movable_feast_date(ethiopian_year, MOVABLE_HOLIDAY_TEWSAK[tewsak_key])
+        days.append((ethiopian_to_jdn(date.year, date.month, date.day), key))
+    for key, dates in get_islamic_holidays(ethiopian_year).items():
+        days.extend((ethiopian_to_jdn(date.year, date.month, date.day), key) for date in dates)
+    days.sort(key=lambda pair: pair[0])  # Stable, so same-day holidays keep their listing order
+    return tuple(days)
+
+
+def _year_holiday_days(ethiopian_year):
+    return _year_cache.get_or_compute(ethiopian_year, _calculate_year_holiday_days, ethiopian_year)
+
+
+def _localize_year_holidays(ethiopian_year, lang):
+    """
+    Builds the year's read-only holiday objects as (tag mask, month, holiday) triples,
+    so month and tag filters never have to open the holiday objects.
+    """
+    entries = []
+    for day, key in _year_holiday_days(ethiopian_year):
+        date = EthiopianDate._trusted(*jdn_to_ethiopian(day))
+        info = HOLIDAY_INFO.get(key, {})
+        holiday = MappingProxyType({
+            'key': key,
+            'tags': _HOLIDAY_TAGS[key],
+            'movable': key not in FIXED_HOLIDAYS,
+            'name': info.get('name', {}).get(lang) or info.get('name', {}).get('english'),
+            'description': info.get('description', {}).get(lang) or info.get('description', {}).get('english'),
+            'ethiopian': date,
+            'gregorian': datetime.date.fromordinal(day - JDN_ORDINAL_OFFSET)
+        })
+        entries.append((_HOLIDAY_MASKS[key], date.month, holiday))
+    return tuple(entries)
+
+
+def _year_holidays(ethiopian_year, lang):
+    return _year_view_cache.get_or_compute(
+        (ethiopian_year, lang), _localize_year_holidays, ethiopian_year, lang)
+
+
+def get_holidays_for_year(ethiopian_year, lang='amharic', filter=None):
+    """
+    Returns every holiday of an Ethiopian year, in date order.
+
+    Args:
+        ethiopian_year (int): The Ethiopian year.
+        lang (str): The language for names and descriptions.
+        filter: Only return holidays carrying any of these HolidayTags (a tag, a list
+            of tags or a mask from tags_to_mask).
+
+    Returns:
+        list: Read-only holiday mappings with 'key', 'tags', 'movable', 'name',
+        'description', 'ethiopian' (EthiopianDate) and 'gregorian' (datetime.date).
+    """
+    validate_numeric_inputs('get_holidays_for_year', ethiopian_year=ethiopian_year)
+    entries = _year_holidays(ethiopian_year, lang)
+    if not filter:
+        return [holiday for _, _, holiday in entries]
+    mask = tags_to_mask(filter)
+    return [holiday for tag_mask, _, holiday in entries if tag_mask & mask]
+
+
+def get_holidays_in_month(ethiopian_year, ethiopian_month, lang='amharic', filter=None):
+    """
+    Returns the holidays of one Ethiopian month, in date order.
+
+    Args:
+        ethiopian_year (int): The Ethiopian year.
+        ethiopian_month (int): The Ethiopian month (1-13).
+        lang (str): The language for names and descriptions.
+        filter: Only return holidays carrying any of these HolidayTags.
+
+    Returns:
+        list: Read-only holiday mappings, as returned by get_holidays_for_year.
+    """
+    validate_numeric_inputs('get_holidays_in_month', ethiopian_year=ethiopian_year, ethiopian_month=ethiopian_month)
+    if not 1 <= ethiopian_month <= 13:
+        raise InvalidEthiopianDateError(ethiopian_year, ethiopian_month, 1)
+    mask = tags_to_mask(filter) if filter else -1  # -1 has every bit set
+    return [holiday for tag_mask, month, holiday in _year_holidays(ethiopian_year, lang)
+            if month == ethiopian_month and tag_mask & mask]
+
+
+def get_holiday(holiday_key, ethiopian_year, lang='amharic'):
+    """
+    Returns one holiday in an Ethiopian year.
+
+    Args:
+        holiday_key (str): The key of the holiday (e.g., 'meskel', 'fasika', 'eidFitr').
+        ethiopian_year (int): The Ethiopian year.
+        lang (str): The language for the name and description.
+
+    Returns:
+        Mapping: The read-only holiday mapping, or None if the holiday does not fall in
+        that year. An Islamic holiday falling twice returns its first occurrence.
+    """
+    if holiday_key not in _HOLIDAY_TAGS:
+        raise UnknownHolidayError(holiday_key)
+    validate_numeric_inputs('get_holiday', ethiopian_year=ethiopian_year)
+    for _, _, holiday in _year_holidays(ethiopian_year, lang):
+        if holiday['key'] == holiday_key:
+            return holiday
+    return None
+
+
+def clear_holiday_cache():
+    """Empties the per-year holiday caches, Islamic holidays included, and resets their counters."""
+    _year_cache.clear()
+    _year_view_cache.clear()
+    clear_islamic_holiday_cache()
+
+
+def holiday_cache_info():
+    """Returns the hit/miss/eviction counters of the per-year and per-(year, lang) holiday caches."""
+    return {'year': _year_cache.info(), 'localized': _year_view_cache.info()}
+
+
+# --- Holiday Index ---
+# Every holiday of a span of years is laid out once as parallel lists sorted by
+# day number (JDN), so point, range and next/previous queries are a bisection.
+
+DEFAULT_INDEX_YEARS = (1900, 2100)
+
+
+class HolidayIndex:
+    """
+    A sorted index of every holiday from `start_year` to `end_year` (Ethiopian, inclusive).
+
+    Dates are passed as EthiopianDate objects or {'year', 'month', 'day'} dicts and
+    must fall within the indexed span. Holidays are returned as (EthiopianDate, key)
+    pairs. `tags` filters keep holidays carrying any of the given HolidayTags (a tag,
+    a list of tags or a mask from tags_to_mask).
+    """
+    __slots__ = ('start_year', 'end_year', '_first_day', '_end_day', '_days', '_keys', '_filtered')
+
+    def __init__(self, start_year, end_year):
+        validate_numeric_inputs('HolidayIndex', start_year=start_year, end_year=end_year)
+        if end_year < start_year:
+            raise KenatError(f"HolidayIndex end_year {end_year} is before start_year {start_year}")
+        self.start_year = start_year
+        self.end_year = end_year
+        self._first_day = ethiopian_to_jdn(start_year, 1, 1)
+        self._end_day = ethiopian_to_jdn(end_year + 1, 1, 1)
+        self._days = []
+        self._keys = []
+        for year in range(start_year, end_year + 1):
+            for day, key in _year_holiday_days(year):
+                self._days.append(day)
+                self._keys.append(key)
+        self._filtered = {}
+
+    def __len__(self):
+        return len(self._days)
+
+    def _lists(self, tags):
+        """Returns the (days, keys) lists, narrowed to `tags`; each filter is built once."""
+        if not tags:
+            return self._days, self._keys
+        mask = tags_to_mask(tags)
+        lists = self._filtered.get(mask)
+        if lists is None:
+            pairs = [(day, key) for day, key in zip(self._days, self._keys) if _HOLIDAY_MASKS[key] & mask]
+            lists = self._filtered[mask] = ([day for day, _ in pairs], [key for _, key in pairs])
+        return lists
+
+    def _day_number(self, date_obj, func_name, param_name):
+        """Validates a date argument and returns its day number, which must be inside the span."""
+        validate_ethiopian_date_object(date_obj, func_name, param_name)
+        date = EthiopianDate.coerce(date_obj)
+        day = ethiopian_to_jdn(date.year, date.month, date.day)
+        if not self._first_day <= day < self._end_day:
+            raise KenatError(
+                f"{func_name}: {date.year}/{date.month}/{date.day} is outside the indexed "
+                f"years {self.start_year}-{self.end_year}")
+        return day
+
+    @staticmethod
+    def _entry(days, keys, i):
+        return EthiopianDate._trusted(*jdn_to_ethiopian(days[i])), keys[i]
+
+    def holidays_on(self, date_obj, tags=None):
+        """Returns the keys of the holidays falling on a date, as a tuple."""
+        day = self._day_number(date_obj, 'holidays_on', 'date_obj')
+        days, keys = self._lists(tags)
+        return tuple(keys[bisect_left(days, day):bisect_right(days, day)])
+
+    def holidays_between(self, start, end, tags=None):
+        """Returns the (EthiopianDate, key) holidays from `start` to `end`, both inclusive."""
+        first = self._day_number(start, 'holidays_between', 'start')
+        last = self._day_number(end, 'holidays_between', 'end')
+        days, keys = self._lists(tags)
+        return [self._entry(days, keys, i) for i in range(bisect_left(days, first), bisect_right(days, last))]
+
+    def next_holiday(self, date_obj, tags=None):
+        """Returns the first (EthiopianDate, key) holiday after a date, or None past the span."""
+        day = self._day_number(date_obj, 'next_holiday', 'date_obj')
+        days, keys = self._lists(tags)
+        i = bisect_right(days, day)
+        return self._entry(days, keys, i) if i < len(days) else None
+
+    def previous_holiday(self, date_obj, tags=None):
+        """Returns the last (EthiopianDate, key) holiday before a date, or None before the span."""
+        day = self._day_number(date_obj, 'previous_holiday', 'date_obj')
+        days, keys = self._lists(tags)
+        i = bisect_left(days, day)
+        return self._entry(days, keys, i - 1) if i else None
+
+
+_default_index = None
+
+
+def get_holiday_index():
+    """Returns the shared HolidayIndex, building it over DEFAULT_INDEX_YEARS on first use."""
+    global _default_index
+    if _default_index is None:
+        _default_index = HolidayIndex(*DEFAULT_INDEX_YEARS)
+    return _default_index
+
+
+def configure_holiday_index(start_year, end_year):
+    """Rebuilds the shared HolidayIndex over a different span of Ethiopian years."""
+    global _default_index
+    _default_index = HolidayIndex(start_year, end_year)
+    return _default_index
+
+
+def holidays_on(date_obj, tags=None):
+    """Returns the keys of the holidays falling on an Ethiopian date."""
+    return get_holiday_index().holidays_on(date_obj, tags)
+
+
+def holidays_between(start, end, tags=None):
+    """Returns the (EthiopianDate, key) holidays from `start` to `end`, both inclusive."""
+    return get_holiday_index().holidays_between(start, end, tags)
+
+
+def next_holiday(date_obj, tags=None):
+    """Returns the first (EthiopianDate, key) holiday after an Ethiopian date."""
+    return get_holiday_index().next_holiday(date_obj, tags)
+
+
+def previous_holiday(date_obj, tags=None):
+    """Returns the last (EthiopianDate, key) holiday before an Ethiopian date."""
+    return get_holiday_index().previous_holiday(date_obj, tags)
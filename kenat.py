@@ -0,0 +1,252 @@
+import datetime
+from collections.abc import Mapping
+from functools import total_ordering
+
+from .conversions import to_ec, _to_gc_unchecked
+from .utils import (
+    validate_numeric_inputs,
+    validate_ethiopian_date_object,
+    _get_weekday_unchecked,
+    ethiopian_to_jdn,
+    parse_date_string,
+    EthiopianDate,
+    _Immutable,
+    _slot_setters
+)
+from .day_arithmetic import _add_days, _add_months, _add_years, diff_in_months, diff_in_years
+from .holidays import _year_holiday_days, _HOLIDAY_MASKS, tags_to_mask
+from .geez import to_geez
+from .exceptions import UnrecognizedInputError
+from .constants import MONTH_NAMES, DAYS_OF_WEEK
+
+# Marks a derived value that has not been computed yet (None is never a valid value).
+_UNSET = None
+
+
+@total_ordering
+class Kenat(_Immutable):
+    """
+    One Ethiopian date with its derived values.
+
+    Kenat() is today. Kenat('2017/1/1') or Kenat('2017-01-01') parses an Ethiopian
+    date, Kenat({'year', 'month', 'day'}) or Kenat(EthiopianDate) wraps one, and
+    Kenat(datetime.date) converts a Gregorian date.
+
+    The Gregorian date, weekday and holidays are only computed when first read and
+    are then kept on the instance. Instances are immutable and hashable; they compare
+    by date, and `+`/`-` with an int add or subtract days, while `kenat_a - kenat_b`
+    is the difference in days.
+    """
+    __slots__ = ('_date', '_jdn', '_gregorian', '_weekday', '_holidays')
+
+    def __init__(self, date_input=None):
+        if date_input is None:
+            date_input = datetime.date.today()
+
+        gregorian = _UNSET
+        if isinstance(date_input, str):
+            date = EthiopianDate(*parse_date_string(date_input))
+        elif isinstance(date_input, Kenat):
+            date = date_input._date
+            gregorian = date_input._gregorian
+        elif isinstance(date_input, Mapping):
+            validate_ethiopian_date_object(date_input, 'Kenat', 'date_input')
+            date = EthiopianDate.coerce(date_input)
+        elif isinstance(date_input, datetime.date):
+            if isinstance(date_input, datetime.datetime):
+                date_input = date_input.date()
+            date = to_ec(date_input.year, date_input.month, date_input.day)
+            gregorian = date_input  # Already known, so it need not be converted back
+        else:
+            raise UnrecognizedInputError(date_input)
+        _init_slots(self, date, gregorian)
+
+    @classmethod
+    def _trusted(cls, date):
+        """Wraps an EthiopianDate built by the library itself, skipping input handling."""
+        self = object.__new__(cls)
+        _init_slots(self, date, _UNSET)
+        return self
+
+    def __reduce__(self):
+        return (type(self)._trusted, (self._date,))
+
+    # --- Ethiopian parts ---
+
+    @property
+    def year(self):
+        return self._date.year
+
+    @property
+    def month(self):
+        return self._date.month
+
+    @property
+    def day(self):
+        return self._date.day
+
+    @property
+    def ethiopian(self):
+        """The date as an EthiopianDate."""
+        return self._date
+
+    def _day_number(self):
+        jdn = self._jdn
+        if jdn is _UNSET:
+            date = self._date
+            jdn = ethiopian_to_jdn(date.year, date.month, date.day)
+            _set_jdn(self, jdn)
+        return jdn
+
+    # --- Derived values, computed once ---
+
+    @property
+    def gregorian(self):
+        """The equivalent Gregorian date (datetime.date)."""
+        gregorian = self._gregorian
+        if gregorian is _UNSET:
+            date = self._date
+            gregorian = _to_gc_unchecked(date.year, date.month, date.day)
+            _set_gregorian(self, gregorian)
+        return gregorian
+
+    @property
+    def weekday(self):
+        """The weekday index, 0 = Sunday (as in DAYS_OF_WEEK)."""
+        weekday = self._weekday
+        if weekday is _UNSET:
+            date = self._date
+            weekday = _get_weekday_unchecked(date.year, date.month, date.day)
+            _set_weekday(self, weekday)
+        return weekday
+
+    @property
+    def holidays(self):
+        """The keys of the holidays falling on this date, as a tuple."""
+        holidays = self._holidays
+        if holidays is _UNSET:
+            day = self._day_number()
+            holidays = tuple(key for holiday_day, key in _year_holiday_days(self._date.year) if holiday_day == day)
+            _set_holidays(self, holidays)
+        return holidays
+
+    def is_holiday(self, tags=None):
+        """
+        True if a holiday falls on this date.
+
+        Args:
+            tags (optional): Only count holidays carrying any of these HolidayTags
+                (a tag, a list of tags or a mask from holidays.tags_to_mask).
+        """
+        if not tags:
+            return bool(self.holidays)
+        mask = tags_to_mask(tags)
+        return any(_HOLIDAY_MASKS[key] & mask for key in self.holidays)
+
+    def weekday_name(self, lang='amharic'):
+        """Returns the name of the weekday in the given language."""
+        return DAYS_OF_WEEK.get(lang, DAYS_OF_WEEK['english'])[self.weekday]
+
+    def month_name(self, lang='amharic'):
+        """Returns the name of the Ethiopian month in the given language."""
+        return MONTH_NAMES.get(lang, MONTH_NAMES['english'])[self._date.month - 1]
+
+    def format(self, lang='amharic'):
+        """Returns the date as 'day month-name year', e.g. '1 Meskerem 2017'."""
+        return f"{self._date.day} {self.month_name(lang)} {self._date.year}"
+
+    def format_geez(self):
+        """Returns the date in Amharic with Ge'ez numerals, e.g. 'መስከረም ፩ ፳፻፲፯'."""
+        date = self._date
+        return f"{MONTH_NAMES['amharic'][date.month - 1]} {to_geez(date.day)} {to_geez(date.year)}"
+
+    def to_dict(self):
+        """Returns the Ethiopian date as a plain {'year', 'month', 'day'} dict."""
+        return self._date.to_dict()
+
+    # --- Arithmetic ---
+
+    def add_days(self, days):
+        """Returns a new Kenat `days` days later (earlier if negative)."""
+        validate_numeric_inputs('Kenat.add_days', days=days)
+        date = self._date
+        return Kenat._trusted(_add_days(date.year, date.month, date.day, days))
+
+    def add_months(self, months):
+        """Returns a new Kenat `months` months later, capping the day at the month's length."""
+        validate_numeric_inputs('Kenat.add_months', months=months)
+        date = self._date
+        return Kenat._trusted(_add_months(date.year, date.month, date.day, months))
+
+    def add_years(self, years):
+        """Returns a new Kenat `years` years later; Pagume 6 falls back to Pagume 5 in common years."""
+        validate_numeric_inputs('Kenat.add_years', years=years)
+        date = self._date
+        return Kenat._trusted(_add_years(date.year, date.month, date.day, years))
+
+    def diff_in_days(self, other):
+        """The number of days from `other` to this date."""
+        return self._day_number() - _as_kenat(other)._day_number()
+
+    def diff_in_months(self, other):
+        """The number of whole months from `other` to this date."""
+        return diff_in_months(self._date, _as_kenat(other)._date)
+
+    def diff_in_years(self, other):
+        """The number of whole years from `other` to this date."""
+        return diff_in_years(self._date, _as_kenat(other)._date)
+
+    def __add__(self, days):
+        if not isinstance(days, int):
+            return NotImplemented
+        return self.add_days(days)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, int):
+            return self.add_days(-other)
+        if isinstance(other, (Kenat, Mapping)):
+            return self.diff_in_days(other)
+        return NotImplemented
+
+    # --- Comparison and hashing (the other orderings come from total_ordering) ---
+
+    def __hash__(self):
+        return hash(self._date)
+
+    def __eq__(self, other):
+        if isinstance(other, Kenat):
+            return self._date == other._date
+        if isinstance(other, Mapping):
+            return self._date == other
+        return NotImplemented
+
+    def __lt__(self, other):
+        if not isinstance(other, Kenat):
+            return NotImplemented
+        return self._date < other._date
+
+    def __str__(self):
+        date = self._date
+        return f"{date.year}/{date.month:02d}/{date.day:02d}"
+
+    def __repr__(self):
+        return f"Kenat('{self}')"
+
+
+def _as_kenat(other):
+    """Accepts another Kenat or any Ethiopian date mapping as the other side of a difference."""
+    return other if isinstance(other, Kenat) else Kenat(other)
+
+
+_set_date, _set_jdn, _set_gregorian, _set_weekday, _set_holidays = _slot_setters(
+    Kenat, '_date', '_jdn', '_gregorian', '_weekday', '_holidays')
+
+
+def _init_slots(self, date, gregorian):
+    _set_date(self, date)
+    _set_jdn(self, _UNSET)
+    _set_gregorian(self, gregorian)
+    _set_weekday(self, _UNSET)
+    _set_holidays(self, _UNSET)
@@ -3,13 +3,10 @@ from tkinter import messagebox
 from PIL import Image, ImageTk
 import os
 
-# --- Imports (Ensure these files are in the same folder) ---
-from constants import (
-    MONTH_NAMES, DAYS_OF_WEEK, FIXED_HOLIDAYS, HOLIDAY_INFO,
-    MOVABLE_HOLIDAYS
-)
-from conversions import to_gc
-from bahire_hasab import get_bahire_hasab
+# --- Package Imports (run with: python -m <package>.main_calendar) ---
+from .constants import MONTH_NAMES, HOLIDAY_INFO
+from .conversions import to_gc
+from .month_grid import MonthGrid
 
 
 class EthiopianCalendarApp:
@@ -19,7 +16,7 @@ class EthiopianCalendarApp:
         self.root.geometry("600x750")
 
         # --- BACKGROUND IMAGE SECTION ---
-        bg_image_path = "assest/ortho.png"
+        bg_image_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assest", "ortho.png")
         if os.path.exists(bg_image_path):
             self.bg_raw = Image.open(bg_image_path)
             self.bg_resized = self.bg_raw.resize((600, 750), Image.Resampling.LANCZOS)
@@ -120,37 +117,27 @@ class EthiopianCalendarApp:
         except:
             year = 2018
 
-        num_days = 30 if month_idx < 12 else (6 if (year % 4 == 3) else 5)
-        bahir = get_bahire_hasab(year, lang="english")
-        movable = bahir.get('movableFeasts', {})
-
-        hols_map = {}
-        for k, info in FIXED_HOLIDAYS.items():
-            if info['month'] == month_idx + 1: hols_map.setdefault(info['day'], []).append(k)
-        for k, info in movable.items():
-            if info.get('ethiopian', {}).get('month') == month_idx + 1:
-                hols_map.setdefault(info['ethiopian']['day'], []).append(k)
-
-        first_day_gc = to_gc(year, month_idx + 1, 1)
-        start_col = (first_day_gc.weekday() + 1) % 7
+        month_grid = MonthGrid.create(year, month_idx + 1, weekday_lang="english")
 
         win = tk.Toplevel(self.root)
         win.title(f"{MONTH_NAMES['english'][month_idx]} {year}")
         grid = tk.Frame(win)
         grid.pack(pady=20, padx=20)
 
-        for i, day_name in enumerate(DAYS_OF_WEEK["english"]):
+        for i, day_name in enumerate(month_grid['headers']):
             tk.Label(grid, text=day_name[:3], font=("Arial", 10, "bold")).grid(row=0, column=i)
 
-        for day in range(1, num_days + 1):
-            idx = (day - 1) + start_col
-            h_keys = hols_map.get(day, [])
-
-            btn = tk.Button(grid, text=str(day), width=8, height=2,
-                            fg="red" if h_keys else "black",
-                            bg="blue" if h_keys else "orange",
-                            command=lambda k=h_keys: self.open_holiday_detail(k[0]) if k else None)
-            btn.grid(row=(idx // 7) + 1, column=idx % 7, padx=2, pady=2)
+        for row, week in enumerate(month_grid['weeks'], start=1):
+            for column, cell in enumerate(week):
+                if cell is None:
+                    continue
+                h_keys = cell['holidays']
+
+                btn = tk.Button(grid, text=str(cell['day']), width=8, height=2,
+                                fg="red" if h_keys else "black",
+                                bg="blue" if h_keys else "orange",
+                                command=lambda k=h_keys: self.open_holiday_detail(k[0]) if k else None)
+                btn.grid(row=row, column=column, padx=2, pady=2)
 
 
 if __name__ == "__main__":
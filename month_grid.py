@@ -0,0 +1,123 @@
+import datetime
+from types import MappingProxyType
+
+from .utils import validate_numeric_inputs, get_ethiopian_days_in_month, ethiopian_to_jdn, jdn_to_weekday, EthiopianDate
+from .holidays import _year_holiday_days, _HOLIDAY_MASKS, tags_to_mask
+from .geez import to_geez_many, to_geez
+from .cache import LRUCache
+from .exceptions import InvalidGridConfigError
+from .constants import MONTH_NAMES, DAYS_OF_WEEK, JDN_ORDINAL_OFFSET
+
+# Finished grids are read-only, so one cached grid can be handed to every caller.
+_grid_cache = LRUCache(512)
+
+
+class MonthGrid:
+    """
+    The calendar grid of one Ethiopian month: weekday headers, the days aligned
+    into week rows, and each day's weekday, Gregorian date and holidays.
+
+    Args:
+        year (int): The Ethiopian year.
+        month (int): The Ethiopian month (1-13).
+        week_start (int): The weekday of the first column, 0 = Sunday (the default) to 6.
+        weekday_lang (str): The language of the weekday headers and names.
+        holiday_filter (optional): Only list holidays carrying any of these HolidayTags
+            (a tag, a list of tags or a mask from holidays.tags_to_mask).
+    """
+    __slots__ = ('year', 'month', 'week_start', 'weekday_lang', 'holiday_mask')
+
+    def __init__(self, year, month, week_start=0, weekday_lang='amharic', holiday_filter=None):
+        validate_numeric_inputs('MonthGrid', year=year, month=month, week_start=week_start)
+        if not 1 <= month <= 13:
+            raise InvalidGridConfigError(f"Invalid month {month}: expected 1-13")
+        if week_start not in range(7):
+            raise InvalidGridConfigError(f"Invalid week_start {week_start}: expected 0 (Sunday) to 6 (Saturday)")
+        if weekday_lang not in DAYS_OF_WEEK:
+            raise InvalidGridConfigError(
+                f"Invalid weekday_lang '{weekday_lang}': expected one of {', '.join(DAYS_OF_WEEK)}")
+        self.year = year
+        self.month = month
+        self.week_start = week_start
+        self.weekday_lang = weekday_lang
+        self.holiday_mask = tags_to_mask(holiday_filter) if holiday_filter else -1  # -1 has every bit set
+
+    @classmethod
+    def create(cls, year, month, **options):
+        """Builds the grid for one month; shorthand for MonthGrid(...).generate()."""
+        return cls(year, month, **options).generate()
+
+    @classmethod
+    def for_year(cls, year, **options):
+        """Returns the grids of all 13 months of an Ethiopian year, as a tuple."""
+        return tuple(cls(year, month, **options).generate() for month in range(1, 14))
+
+    def generate(self):
+        """
+        Returns the grid, built once per (year, month, options) and cached.
+
+        Returns:
+            Mapping: A read-only mapping with 'year', 'month', 'monthName', 'headers'
+            (weekday names from week_start), 'startColumn', 'yearGeez', 'days' (one cell
+            per day) and 'weeks' (rows of 7 cells, None where a row has no day). Each
+            cell holds 'day', 'dayGeez', 'weekday' (0 = Sunday), 'weekdayName',
+            'ethiopian', 'gregorian' and 'holidays' (a tuple of holiday keys).
+        """
+        key = (self.year, self.month, self.week_start, self.weekday_lang, self.holiday_mask)
+        return _grid_cache.get_or_compute(key, _build_grid, *key)
+
+    def __repr__(self):
+        return f"MonthGrid({self.year!r}, {self.month!r}, week_start={self.week_start!r})"
+
+
+def _build_grid(year, month, week_start, weekday_lang, holiday_mask):
+    """Lays out one month from the year's cached holiday list and the day numbers."""
+    first_day = ethiopian_to_jdn(year, month, 1)
+    days_in_month = get_ethiopian_days_in_month(year, month)
+    weekday_names = DAYS_OF_WEEK[weekday_lang]
+
+    holidays_by_day = {}
+    for holiday_day, key in _year_holiday_days(year):
+        if first_day <= holiday_day < first_day + days_in_month and _HOLIDAY_MASKS[key] & holiday_mask:
+            holidays_by_day.setdefault(holiday_day, []).append(key)
+
+    day_numerals = to_geez_many(range(1, days_in_month + 1))
+    cells = []
+    for offset in range(days_in_month):
+        day_number = first_day + offset
+        weekday = jdn_to_weekday(day_number)
+        cells.append(MappingProxyType({
+            'day': offset + 1,
+            'dayGeez': day_numerals[offset],
+            'weekday': weekday,
+            'weekdayName': weekday_names[weekday],
+            'ethiopian': EthiopianDate._trusted(year, month, offset + 1),
+            'gregorian': datetime.date.fromordinal(day_number - JDN_ORDINAL_OFFSET),
+            'holidays': tuple(holidays_by_day.get(day_number, ())),
+        }))
+
+    start_column = (jdn_to_weekday(first_day) - week_start) % 7
+    padded = [None] * start_column + cells
+    padded += [None] * (-len(padded) % 7)
+    weeks = tuple(tuple(padded[i:i + 7]) for i in range(0, len(padded), 7))
+
+    return MappingProxyType({
+        'year': year,
+        'month': month,
+        'monthName': MappingProxyType({lang: names[month - 1] for lang, names in MONTH_NAMES.items() if len(names) == 13}),
+        'headers': tuple(weekday_names[(week_start + i) % 7] for i in range(7)),
+        'startColumn': start_column,
+        'yearGeez': to_geez(year),
+        'days': tuple(cells),
+        'weeks': weeks,
+    })
+
+
+def clear_month_grid_cache():
+    """Empties the grid cache and resets its counters."""
+    _grid_cache.clear()
+
+
+def month_grid_cache_info():
+    """Returns the hit/miss/eviction counters of the grid cache."""
+    return _grid_cache.info()
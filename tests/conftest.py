@@ -0,0 +1,12 @@
+"""
+Puts the benchmarks directory on sys.path and registers the repository as the
+package ``kenat`` (as the benchmark scripts do), so the tests can use package
+imports without installing anything and compare against the reference
+implementations kept in the benchmarks.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+import _package  # noqa: F401,E402
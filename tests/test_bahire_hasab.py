@@ -0,0 +1,42 @@
+from bench_bahire_hasab import _reference_movable_holiday
+from profile_bahire_hasab import _legacy_get_bahire_hasab
+from kenat.bahire_hasab import (
+    get_bahire_hasab, get_movable_holiday, get_bahire_hasab_range, iter_bahire_hasab_range,
+    _calculate_bahire_hasab_base, _calculate_bahire_hasab_core,
+)
+from kenat.constants import MOVABLE_HOLIDAY_TEWSAK
+
+
+def test_movable_holidays_match_direct_algorithm():
+    for year in range(-1000, 7001):
+        for holiday_key in MOVABLE_HOLIDAY_TEWSAK:
+            expected = _reference_movable_holiday(holiday_key, year)
+            assert get_movable_holiday(holiday_key, year) == expected, (year, holiday_key)
+
+
+def test_core_matches_direct_algorithm():
+    # The full core also carries Gregorian dates, which datetime only has from year 1.
+    for year in range(1, 7001):
+        reference = _calculate_bahire_hasab_base(year)
+        core = _calculate_bahire_hasab_core(year)
+        for key, value in reference.items():
+            assert core[key] == value, (year, key)
+        for holiday_key in MOVABLE_HOLIDAY_TEWSAK:
+            assert core['feasts'][holiday_key][0] == _reference_movable_holiday(holiday_key, year), (year, holiday_key)
+
+
+def test_range_matches_get_bahire_hasab():
+    columns = get_bahire_hasab_range(1, 3000, gregorian=True)
+    for i, (year, feasts) in enumerate(iter_bahire_hasab_range(1, 3000)):
+        assert columns['year'][i] == year
+        movable = get_bahire_hasab(year, lang='english')['movableFeasts']
+        for key, feast in movable.items():
+            assert feasts[key] == feast['ethiopian'], (year, key)
+            assert tuple(columns['ethiopian'][key][i]) == tuple(feast['ethiopian'].values()), (year, key)
+            assert columns['gregorian'][key][i].item() == feast['gregorian'], (year, key)
+
+
+def test_get_bahire_hasab_matches_validating_implementation():
+    for year in range(1900, 2101):
+        for lang in ('amharic', 'english'):
+            assert get_bahire_hasab(year, lang) == _legacy_get_bahire_hasab(year, lang), (year, lang)
@@ -0,0 +1,27 @@
+import pytest
+
+from kenat.bulk_convert import convert_ndjson_batch
+from kenat.exceptions import KenatError
+
+LINES = ['{"d": "2017/1/1"}\n', '{"d": \n', '"2017/1/1"\n', '[1]\n', '{"d": 20170101}\n', '{"d": "2017-04-29"}\n']
+
+
+def test_ndjson_keep_passes_bad_lines_and_values_through():
+    assert convert_ndjson_batch(LINES, 1, ['d'], 'to_gc', 'keep') == (
+        '{"d": "2024-09-11"}\n{"d": \n"2017/1/1"\n[1]\n{"d": 20170101}\n{"d": "2025-01-07"}\n')
+
+
+def test_ndjson_empty_drops_bad_lines_and_blanks_bad_values():
+    assert convert_ndjson_batch(LINES, 1, ['d'], 'to_gc', 'empty') == (
+        '{"d": "2024-09-11"}\n{"d": ""}\n{"d": "2025-01-07"}\n')
+
+
+@pytest.mark.parametrize('line, row, message', [
+    (LINES[1], 2, 'invalid JSON'),
+    (LINES[2], 3, 'expected a JSON object, got str'),
+    (LINES[3], 4, 'expected a JSON object, got list'),
+    (LINES[4], 5, 'Invalid date string format'),
+])
+def test_ndjson_fail_reports_the_row(line, row, message):
+    with pytest.raises(KenatError, match=f'^Row {row}: .*{message}'):
+        convert_ndjson_batch([LINES[0]] * (row - 1) + [line], 1, ['d'], 'to_gc', 'fail')
@@ -0,0 +1,78 @@
+import datetime
+import random
+
+import pytest
+
+pd = pytest.importorskip('pandas')
+
+import kenat.columnar  # noqa: F401,E402  Registers Series.ethiopian
+from kenat.conversions import to_gc, to_ec  # noqa: E402
+from kenat.holidays import get_holidays_for_year  # noqa: E402
+from kenat.exceptions import KenatError  # noqa: E402
+
+
+def _scalar_to_gc(value):
+    try:
+        return to_gc(*(int(part) for part in value.strip().replace('-', '/').split('/')))
+    except (KenatError, ValueError):
+        return None
+
+
+def test_to_gc_matches_scalar_path():
+    rng = random.Random(0)
+    strings = [f"{rng.randint(1890, 2110)}{rng.choice('-/')}{rng.randint(1, 13)}/{rng.randint(1, 30)}"
+               for _ in range(20_000)]
+    result = pd.Series(strings).ethiopian.to_gc()
+    for value, converted in zip(strings, result):
+        expected = _scalar_to_gc(value)
+        if expected is None:
+            assert pd.isna(converted), value
+        else:
+            assert converted.date() == expected, value
+
+
+def test_to_gc_outside_nanosecond_range():
+    # datetime64[ns] only spans 1677-2262; these must not wrap around.
+    result = pd.Series(['2300/1/1', '1500-01-01']).ethiopian.to_gc()
+    assert [value.date() for value in result] == [to_gc(2300, 1, 1), to_gc(1500, 1, 1)]
+
+
+def test_to_gc_unparseable_rows_are_nat():
+    values = ['٢٠١٧/١/١', '२०१७/1/1', '2017/1/1/1', '12345/1/1', '2017.1.1', '', None, 20170101,
+              '2016/13/6', ' 2017-01-01 ', '0001/1/1']
+    result = pd.Series(values, dtype=object).ethiopian.to_gc()
+    assert result[:9].isna().all()
+    assert result[9].date() == to_gc(2017, 1, 1)
+    assert result[10].date() == to_gc(1, 1, 1)
+    assert pd.Series([], dtype=object).ethiopian.to_gc().empty
+    assert pd.Series(['bad', None]).ethiopian.to_gc().isna().all()
+
+
+def test_to_ec_matches_scalar_path():
+    rng = random.Random(0)
+    dates = [datetime.date(1900, 1, 1) + datetime.timedelta(days=rng.randrange(73000)) for _ in range(20_000)]
+    frame = pd.Series(pd.to_datetime(dates)).ethiopian.to_ec()
+    for date, (year, month, day) in zip(dates, frame.itertuples(index=False)):
+        assert to_ec(date.year, date.month, date.day) == {'year': year, 'month': month, 'day': day}, date
+
+
+def test_accessor_reflects_in_place_changes():
+    series = pd.Series(pd.to_datetime(['2024-09-11', '2025-01-07']))
+    assert series.ethiopian.year.tolist() == [2017, 2017]
+    assert series.ethiopian.is_holiday().tolist() == [True, True]
+    series.iloc[0] = pd.Timestamp('2030-01-01')
+    assert series.ethiopian.year.tolist() == [2022, 2017]
+    assert series.ethiopian.is_holiday().tolist() == [False, True]
+
+
+@pytest.mark.parametrize('tags', [None, ['public'], ['muslim', 'christian']])
+def test_is_holiday_matches_holiday_listing(tags):
+    days = pd.Series(pd.date_range('2014-09-01', '2019-09-30', freq='D'))
+    expected = {
+        holiday['gregorian']
+        for year in range(2006, 2013)
+        for holiday in get_holidays_for_year(year, lang='english', filter=tags)
+    }
+    flags = days.ethiopian.is_holiday(tags)
+    assert [day.date() for day, flag in zip(days, flags) if flag] == sorted(
+        day for day in expected if datetime.date(2014, 9, 1) <= day <= datetime.date(2019, 9, 30))
@@ -0,0 +1,37 @@
+import datetime
+
+# The legacy functions assume Enkutatash falls on Sep 11, or Sep 12 before a
+# Gregorian leap year, which stops holding once 2100 skips its leap day. The
+# comparison therefore ends with Ethiopian year 2091 (Gregorian 2099-09-10).
+LAST_LEGACY_YEAR = 2091
+LAST_LEGACY_DATE = datetime.date(2099, 9, 10)
+
+from bench_conversions import _legacy_to_gc, _legacy_to_ec, _legacy_get_weekday
+from kenat.conversions import to_gc, to_ec
+from kenat.utils import get_weekday, get_ethiopian_days_in_month
+
+
+def _ethiopian_dates(first_year, last_year):
+    for year in range(first_year, last_year + 1):
+        for month in range(1, 14):
+            for day in range(1, get_ethiopian_days_in_month(year, month) + 1):
+                yield year, month, day
+
+
+def test_to_gc_and_get_weekday_match_legacy():
+    for year, month, day in _ethiopian_dates(1892, LAST_LEGACY_YEAR):
+        assert to_gc(year, month, day) == _legacy_to_gc(year, month, day), (year, month, day)
+        date = {'year': year, 'month': month, 'day': day}
+        assert get_weekday(date) == _legacy_get_weekday(date), date
+
+
+def test_to_ec_matches_legacy():
+    date = datetime.date(1900, 1, 1)
+    while date <= LAST_LEGACY_DATE:
+        assert to_ec(date.year, date.month, date.day) == _legacy_to_ec(date.year, date.month, date.day), date
+        date += datetime.timedelta(days=1)
+
+
+def test_to_gc_after_2100_skips_its_leap_day():
+    assert to_gc(2092, 1, 1) == datetime.date(2099, 9, 12)
+    assert to_ec(2100, 3, 1) == {'year': 2092, 'month': 6, 'day': 21}
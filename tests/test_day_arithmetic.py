@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from bench_day_arithmetic import _every_date, _legacy_add_days, _legacy_diff_in_days, _random_dates
+from kenat import day_arithmetic
+from kenat.day_arithmetic import add_days, add_months, add_years, date_range, diff_in_days
+from kenat.exceptions import InvalidEthiopianDateError, InvalidInputTypeError
+from kenat.utils import EthiopianDate, get_ethiopian_days_in_month
+
+
+@pytest.mark.parametrize('step', [1.5, 1.0, '1', True])
+def test_date_range_requires_int_step(step):
+    with pytest.raises(InvalidInputTypeError):
+        date_range(EthiopianDate(2017, 1, 1), EthiopianDate(2017, 2, 1), step)
+
+
+@pytest.mark.parametrize('start, stop', [
+    ({'year': 2017, 'month': 14, 'day': 1}, {'year': 2018, 'month': 1, 'day': 1}),
+    ({'year': 2017, 'month': 1, 'day': 1}, {'year': 2016, 'month': 13, 'day': 6}),
+])
+def test_date_range_rejects_invalid_dates(start, stop):
+    with pytest.raises(InvalidEthiopianDateError):
+        date_range(start, stop)
+
+
+def test_date_range_accepts_dicts():
+    dates = date_range({'year': 2017, 'month': 13, 'day': 4}, {'year': 2018, 'month': 1, 'day': 2})
+    assert list(dates) == [EthiopianDate(2017, 13, 4), EthiopianDate(2017, 13, 5), EthiopianDate(2018, 1, 1)]
+
+
+def test_diff_in_days_counts_every_day():
+    """Every valid date in years 1-3000 must sit exactly one day after its predecessor."""
+    anchor = {'year': 1, 'month': 1, 'day': 1}
+    for i, date in enumerate(_every_date(1, 3000)):
+        assert diff_in_days(date, anchor) == i, date
+
+
+@pytest.mark.parametrize('other', [{'year': 2017, 'month': 13, 'day': 5}, {'year': 1, 'month': 1, 'day': 1}])
+def test_diff_in_days_matches_legacy(other):
+    for date in list(_every_date(1, 3000))[::997]:
+        assert diff_in_days(date, other) == _legacy_diff_in_days(date, other), date
+
+
+def test_add_days_matches_legacy_and_reverses():
+    """Forward offsets must match the legacy month-by-month roll-over, and
+    negative offsets must undo them."""
+    for i, date in enumerate(_every_date(1900, 2200)):
+        days = (i * 7919) % 20000
+        moved = add_days(date, days)
+        if i % 13 == 0:
+            assert moved == _legacy_add_days(date, days), (date, days)
+        assert add_days(moved, -days) == date, (date, days)
+        assert diff_in_days(moved, date) == days, (date, days)
+
+
+@pytest.mark.parametrize('months', [-1, -13, -27, -130])
+def test_add_months_backwards_caps_the_day(months):
+    for date in _every_date(1990, 2030):
+        moved = add_months(date, months)
+        assert 1 <= moved['day'] <= get_ethiopian_days_in_month(moved['year'], moved['month']), date
+        assert (moved['year'] * 13 + moved['month']) - (date['year'] * 13 + date['month']) == months, date
+        if date['day'] <= 5:
+            assert add_months(moved, -months) == date, date
+
+
+@pytest.mark.parametrize('years', [-1, -3, -4, -100])
+def test_add_years_backwards_clamps_pagume(years):
+    for date in _every_date(1990, 2030):
+        moved = add_years(date, years)
+        day = min(date['day'], get_ethiopian_days_in_month(date['year'] + years, date['month']))
+        assert (moved['year'], moved['month'], moved['day']) == (date['year'] + years, date['month'], day), date
+
+
+@pytest.mark.parametrize('name, scale', [('add_days', 1), ('add_months', 100), ('add_years', 1000)])
+def test_add_many_matches_scalar(name, scale):
+    dates, _, scalar_dates, _ = _random_dates(20_000)
+    shifts = np.random.default_rng(1).integers(-5000, 5000, size=len(dates)) // scale
+    batch = getattr(day_arithmetic, name + '_many')(dates, shifts).tolist()
+    scalar = getattr(day_arithmetic, name)
+    for row, date, shift in zip(batch, scalar_dates, shifts.tolist()):
+        result = scalar(date, shift)
+        assert row == (result['year'], result['month'], result['day']), (date, shift)
+
+
+@pytest.mark.parametrize('name', ['diff_in_days', 'diff_in_months', 'diff_in_years'])
+def test_diff_many_matches_scalar(name):
+    dates_a, dates_b, scalar_a, scalar_b = _random_dates(20_000)
+    batch = getattr(day_arithmetic, name + '_many')(dates_a, dates_b).tolist()
+    scalar = getattr(day_arithmetic, name)
+    for result, a, b in zip(batch, scalar_a, scalar_b):
+        assert result == scalar(a, b), (a, b)
@@ -0,0 +1,62 @@
+import datetime
+
+import numpy as np
+import pytest
+
+from bench_ethiopian_time import _FIRST, _LAST
+from kenat.constants import EAT_UTC_OFFSET_SECONDS
+from kenat.ethiopian_time import (
+    Time, to_ethiopian_datetime, to_gregorian_datetime, to_ethiopian_datetime_many, to_timestamps_many,
+)
+
+_EAT = datetime.timezone(datetime.timedelta(seconds=EAT_UTC_OFFSET_SECONDS))
+
+
+@pytest.fixture(scope='module')
+def timestamps():
+    return np.random.default_rng(0).integers(_FIRST, _LAST, 200_000)
+
+
+@pytest.mark.parametrize('civil, expected', [
+    ((6,), Time(12, 0, 'day')),
+    ((7, 30), Time(1, 30, 'day')),
+    ((18,), Time(12, 0, 'night')),
+    ((5, 59, 59), Time(11, 59, 'night', 59)),
+])
+def test_from_gregorian(civil, expected):
+    assert Time.from_gregorian(*civil) == expected
+
+
+def test_time_round_trips_every_civil_second():
+    for seconds in range(0, 86400, 7):
+        civil = datetime.time(seconds // 3600, seconds // 60 % 60, seconds % 60)
+        time = Time.from_gregorian(civil.hour, civil.minute, civil.second)
+        assert time.to_gregorian() == civil, civil
+        assert Time(time.hour, time.minute, time.period, time.second) == time, civil
+
+
+def test_batch_matches_scalar_path(timestamps):
+    parts, valid = to_ethiopian_datetime_many(timestamps)
+    assert valid.all()
+    for i in range(0, len(timestamps), 37):
+        stamp = int(timestamps[i])
+        date, time = to_ethiopian_datetime(stamp)
+        row = parts[i]
+        assert (row['year'], row['month'], row['day']) == (date.year, date.month, date.day), stamp
+        assert (row['hour'], row['minute'], row['second'], bool(row['period'])) == (
+            time.hour, time.minute, time.second, time.period == 'night'), stamp
+        wall = datetime.datetime.fromtimestamp(stamp, _EAT).replace(tzinfo=None)
+        assert to_gregorian_datetime(date, time) == wall, stamp
+        assert to_ethiopian_datetime(wall) == (date, time), stamp
+
+
+def test_batch_round_trips(timestamps):
+    parts = to_ethiopian_datetime_many(timestamps)[0]
+    assert (to_timestamps_many(parts) == timestamps).all()
+    assert (to_ethiopian_datetime_many(timestamps.astype('datetime64[s]'))[0] == parts).all()
+
+
+def test_batch_marks_invalid_rows():
+    parts, valid = to_ethiopian_datetime_many(np.array([np.nan, 0.5, _LAST + 10 * 86400]))
+    assert valid.tolist() == [False, True, False]
+    assert parts[0]['year'] == parts[2]['year'] == 0
@@ -0,0 +1,38 @@
+import random
+
+import pytest
+
+from bench_geez import _reference_to_geez, _reference_to_arabic
+from kenat.exceptions import GeezConverterError
+from kenat.geez import to_geez, to_arabic, to_geez_many, to_arabic_many, GEEZ_TABLE_LIMIT
+
+
+def test_matches_reference_below_200000():
+    for n in range(0, 200_001):
+        geez = to_geez(n)
+        assert geez == _reference_to_geez(n), n
+        assert to_arabic(geez) == n == _reference_to_arabic(geez), n
+
+
+def test_matches_reference_for_large_numbers():
+    rng = random.Random(0)
+    for _ in range(50_000):
+        n = rng.randrange(10 ** rng.randrange(1, 25))
+        assert to_geez(n) == _reference_to_geez(n), n
+        assert to_arabic(to_geez(n)) == n, n
+
+
+def test_batch_matches_scalar():
+    numbers = list(range(GEEZ_TABLE_LIMIT + 50))
+    assert to_geez_many(numbers) == [to_geez(n) for n in numbers]
+    assert to_arabic_many(to_geez_many(numbers)) == numbers
+
+
+def test_accepts_padded_digit_string():
+    assert to_geez(' 2017 ') == to_geez(2017)
+
+
+@pytest.mark.parametrize('bad', ['፩', '²', '١٢', '-1', '1.5', ''])
+def test_rejects_non_ascii_digit_strings(bad):
+    with pytest.raises(GeezConverterError):
+        to_geez(bad)
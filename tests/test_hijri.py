@@ -0,0 +1,24 @@
+from bench_hijri import _legacy_jd_to_hijri, _legacy_hijri_to_gregorian
+from kenat.conversions import hijri_to_gregorian, _hijri_to_jd, _jd_to_hijri
+from kenat.utils import gregorian_to_jdn
+
+
+def test_jd_to_hijri_matches_legacy_and_round_trips():
+    """Every day in 1900-2100 must map to the same Hijri date, and back, as before."""
+    for jd in range(gregorian_to_jdn(1900, 1, 1), gregorian_to_jdn(2100, 12, 31) + 1):
+        hijri = _jd_to_hijri(jd)
+        assert hijri == _legacy_jd_to_hijri(jd), jd
+        assert _hijri_to_jd(hijri['year'], hijri['month'], hijri['day']) == jd, jd
+
+
+def test_hijri_to_gregorian_matches_legacy_search():
+    # The full search is slow, so compare it on a sample of dates, including
+    # non-existent days (30th of a 29-day month) and the wrong Gregorian year.
+    for h_year in range(1320, 1520, 13):
+        for h_month in (1, 2, 9, 10, 12):
+            for h_day in (1, 10, 29, 30):
+                g = _legacy_hijri_to_gregorian(h_year, h_month, h_day, h_year + 579)
+                g_year = g.year if g else h_year + 579
+                for year in (g_year - 1, g_year, g_year + 1):
+                    expected = _legacy_hijri_to_gregorian(h_year, h_month, h_day, year)
+                    assert hijri_to_gregorian(h_year, h_month, h_day, year) == expected, (h_year, h_month, h_day, year)
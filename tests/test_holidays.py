@@ -0,0 +1,42 @@
+import random
+from bisect import bisect_left
+
+from bench_holidays import _matches_tags
+from kenat import holidays
+from kenat.constants import HolidayTags, ISLAMIC_HOLIDAY_HIJRI_DATES
+from kenat.conversions import hijri_to_gregorian, _jd_to_hijri
+from kenat.utils import ethiopian_to_jdn, gregorian_to_jdn, jdn_to_ethiopian
+
+TAG_FILTERS = (None, [HolidayTags.PUBLIC], [HolidayTags.MUSLIM, HolidayTags.STATE])
+
+
+def test_islamic_holiday_listings_match_hijri_to_gregorian():
+    """Every Islamic holiday in each Gregorian year must match a hijri_to_gregorian lookup."""
+    for year in range(1900, 2101):
+        listing = holidays.get_islamic_holidays_gregorian(year)
+        hijri_year = _jd_to_hijri(gregorian_to_jdn(year, 1, 1))['year']
+        for key, (month, day) in ISLAMIC_HOLIDAY_HIJRI_DATES.items():
+            found = (hijri_to_gregorian(h_year, month, day, year) for h_year in range(hijri_year, hijri_year + 3))
+            assert listing[key] == tuple(date for date in found if date), (year, key)
+
+
+def test_index_queries_match_a_scan_of_every_holiday():
+    first_year, last_year = holidays.DEFAULT_INDEX_YEARS
+    everything = [pair for year in range(first_year, last_year + 1) for pair in holidays._year_holiday_days(year)]
+    matching = {i: [(d, key) for d, key in everything if _matches_tags(key, tags)] for i, tags in enumerate(TAG_FILTERS)}
+    rng = random.Random(0)
+    for _ in range(3000):
+        day = rng.randrange(ethiopian_to_jdn(first_year, 1, 1), ethiopian_to_jdn(last_year + 1, 1, 1))
+        year, month, day_of_month = jdn_to_ethiopian(day)
+        date = {'year': year, 'month': month, 'day': day_of_month}
+        i = rng.randrange(len(TAG_FILTERS))
+        tags, pairs = TAG_FILTERS[i], matching[i]
+        lo, hi = bisect_left(pairs, (day,)), bisect_left(pairs, (day + 1,))
+
+        assert holidays.holidays_on(date, tags) == tuple(key for d, key in pairs[lo:hi]), date
+        for found, expected in ((holidays.next_holiday(date, tags), pairs[hi:hi + 1]),
+                                (holidays.previous_holiday(date, tags), pairs[max(lo - 1, 0):lo])):
+            if found is None:
+                assert not expected, date
+            else:
+                assert (ethiopian_to_jdn(found[0].year, found[0].month, found[0].day), found[1]) == expected[0], date
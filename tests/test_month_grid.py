@@ -0,0 +1,19 @@
+from bench_month_grid import _legacy_month
+from kenat.constants import ISLAMIC_HOLIDAY_HIJRI_DATES
+from kenat.month_grid import MonthGrid
+
+
+def test_matches_old_month_views():
+    # The old views never listed the Islamic holidays, so they are left out of the comparison.
+    for year in range(1900, 2101):
+        for month_idx in range(13):
+            legacy_grid, legacy_start = _legacy_month(year, month_idx)
+            grid = MonthGrid.create(year, month_idx + 1, weekday_lang='english')
+            assert grid['startColumn'] == legacy_start, (year, month_idx)
+            assert len(grid['days']) == len(legacy_grid), (year, month_idx)
+            for cell, legacy in zip(grid['days'], legacy_grid):
+                assert cell['weekdayName'] == legacy['weekday'], (year, month_idx, cell['day'])
+                keys = [key for key in cell['holidays'] if key not in ISLAMIC_HOLIDAY_HIJRI_DATES]
+                assert sorted(keys) == sorted(legacy['holidays']), (year, month_idx, cell['day'])
+            cells = [cell for week in grid['weeks'] for cell in week]
+            assert cells.index(grid['days'][0]) == legacy_start and len(cells) % 7 == 0, (year, month_idx)
@@ -1,4 +1,10 @@
-from exceptions import InvalidInputTypeError
+import re
+from collections.abc import Mapping
+from functools import total_ordering
+
+from . import cache
+from .exceptions import InvalidInputTypeError, InvalidEthiopianDateError, InvalidDateFormatError
+from .constants import ETHIOPIAN_EPOCH_JDN
 
 # --- Validation Helpers ---
 
@@ -18,18 +24,147 @@ def validate_ethiopian_date_object(date_obj, func_name, param_name):
     Validates that the input is a valid Ethiopian date object.
     
     Raises:
-        InvalidInputTypeError: If the object is not a dict or its components are not numbers.
+        InvalidInputTypeError: If the object is not a dict (or other mapping, such as an
+            EthiopianDate) or its components are not numbers.
     """
-    if not isinstance(date_obj, dict):
+    if type(date_obj) is EthiopianDate:
+        return  # Already validated when it was built
+    if not isinstance(date_obj, Mapping):
         raise InvalidInputTypeError(func_name, param_name, 'dict', date_obj)
-    validate_numeric_inputs(
-        func_name,
-        **{
-            f'{param_name}.year': date_obj.get('year'),
-            f'{param_name}.month': date_obj.get('month'),
-            f'{param_name}.day': date_obj.get('day'),
-        }
-    )
+    # Checked inline so the qualified parameter name is only built on failure.
+    for key in ('year', 'month', 'day'):
+        value = date_obj.get(key)
+        if not isinstance(value, (int, float)) or value != value: # Checks for NaN
+            raise InvalidInputTypeError(func_name, f'{param_name}.{key}', 'number', value)
+
+# --- Immutable Value Types ---
+
+class _Immutable:
+    """
+    Base for the library's immutable ``__slots__`` value types (EthiopianDate,
+    Kenat, Time). Attribute assignment is refused; the class itself writes its
+    slots through the setters returned by `_slot_setters`.
+    """
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+def _slot_setters(cls, *names):
+    """Returns the raw setters of the named slots of `cls`, which bypass `_Immutable.__setattr__`."""
+    return tuple(getattr(cls, name).__set__ for name in names)
+
+# --- Ethiopian Date Value Type ---
+
+@total_ordering
+class EthiopianDate(_Immutable, Mapping):
+    """
+    An immutable, hashable and ordered Ethiopian date.
+
+    It uses ``__slots__`` instead of a per-instance dict, so it costs a fraction
+    of the memory of a ``{'year', 'month', 'day'}`` dict and can be used as a dict
+    key or set member. For compatibility it is also a read-only mapping with the
+    keys 'year', 'month' and 'day', and compares equal to the equivalent dict.
+    """
+    __slots__ = ('year', 'month', 'day')
+
+    def __init__(self, year, month, day):
+        validate_numeric_inputs('EthiopianDate', year=year, month=month, day=day)
+        if not is_valid_ethiopian_date(year, month, day):
+            raise InvalidEthiopianDateError(year, month, day)
+        _set_year(self, year)
+        _set_month(self, month)
+        _set_day(self, day)
+
+    @classmethod
+    def _trusted(cls, year, month, day):
+        """Builds an instance from parts already known to be valid, skipping validation."""
+        self = object.__new__(cls)
+        _set_year(self, year)
+        _set_month(self, month)
+        _set_day(self, day)
+        return self
+
+    @classmethod
+    def coerce(cls, date_obj):
+        """Returns `date_obj` as an EthiopianDate, converting a dict if needed."""
+        if type(date_obj) is cls:
+            return date_obj
+        return cls(date_obj['year'], date_obj['month'], date_obj['day'])
+
+    def to_dict(self):
+        """Returns the date as a plain {'year', 'month', 'day'} dict."""
+        return {'year': self.year, 'month': self.month, 'day': self.day}
+
+    def __reduce__(self):
+        return (type(self)._trusted, (self.year, self.month, self.day))
+
+    # --- Mapping protocol ---
+
+    def __getitem__(self, key):
+        if key == 'year':
+            return self.year
+        if key == 'month':
+            return self.month
+        if key == 'day':
+            return self.day
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(('year', 'month', 'day'))
+
+    def __len__(self):
+        return 3
+
+    # --- Comparison and hashing (the other orderings come from total_ordering) ---
+
+    def _key(self):
+        return (self.year, self.month, self.day)
+
+    def __hash__(self):
+        return hash((self.year, self.month, self.day))
+
+    def __eq__(self, other):
+        if isinstance(other, EthiopianDate):
+            return self._key() == other._key()
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    def __lt__(self, other):
+        if not isinstance(other, EthiopianDate):
+            return NotImplemented
+        return self._key() < other._key()
+
+    def __repr__(self):
+        return f"EthiopianDate({self.year!r}, {self.month!r}, {self.day!r})"
+
+_set_year, _set_month, _set_day = _slot_setters(EthiopianDate, 'year', 'month', 'day')
+
+# --- Date Strings ---
+
+# 'yyyy/mm/dd' or 'yyyy-mm-dd', as accepted by Kenat, bulk_convert and the pandas accessor.
+# [0-9] rather than \d, which would also accept e.g. Arabic-Indic digits.
+DATE_STRING_PATTERN = re.compile(r'^\s*([0-9]{1,4})[-/]([0-9]{1,2})[-/]([0-9]{1,2})\s*$')
+
+def parse_date_string(value):
+    """
+    Splits a 'yyyy/mm/dd' or 'yyyy-mm-dd' string into its parts, without checking
+    that they form a valid date.
+
+    Returns:
+        tuple: (year, month, day) as ints.
+
+    Raises:
+        InvalidDateFormatError: If the string is not in either format.
+    """
+    match = DATE_STRING_PATTERN.match(value)
+    if not match:
+        raise InvalidDateFormatError(value)
+    return tuple(int(part) for part in match.groups())
 
 # --- Date Property Helpers ---
 
@@ -56,17 +191,34 @@ def get_ethiopian_days_in_month(year, month):
         return 6 if is_ethiopian_leap_year(year) else 5
     return 30
 
+def get_gregorian_days_in_month(year, month):
+    """
+    Returns the number of days in the given Gregorian month and year.
+    """
+    if month == 2:
+        return 29 if is_gregorian_leap_year(year) else 28
+    return 30 if month in (4, 6, 9, 11) else 31
+
 def get_weekday(eth_date):
     """
     Returns the weekday (0=Sunday, 6=Saturday) for a given Ethiopian date.
     """
-    # Import locally to prevent circular dependency with the 'conversions' module
-    import conversions
-    g = conversions.to_gc(eth_date['year'], eth_date['month'], eth_date['day'])
-    # The getDay() method in JS returns 0 for Sunday, which matches Python's isoweekday() % 7 behavior.
-    # Python's weekday() is 0 for Monday. JS getDay() is 0 for Sunday.
-    # The source new Date(...).getDay() is 0 for Sunday.
-    return (g.isoweekday() % 7)
+    year, month, day = eth_date['year'], eth_date['month'], eth_date['day']
+    memo = cache.get_conversion_cache('get_weekday')
+    if memo is not None:
+        return memo.get_or_compute((year, month, day), _get_weekday, year, month, day)
+    return _get_weekday(year, month, day)
+
+def _get_weekday(year, month, day):
+    """Uncached implementation of get_weekday."""
+    validate_numeric_inputs('get_weekday', eth_year=year, eth_month=month, eth_day=day)
+    if not is_valid_ethiopian_date(year, month, day):
+        raise InvalidEthiopianDateError(year, month, day)
+    return _get_weekday_unchecked(year, month, day)
+
+def _get_weekday_unchecked(year, month, day):
+    """Trusted fast path of get_weekday for internal callers holding known-valid dates."""
+    return jdn_to_weekday(ethiopian_to_jdn(year, month, day))
 
 def is_valid_ethiopian_date(year, month, day):
     """
@@ -102,4 +254,41 @@ def month_day_from_day_of_year(year, day_of_year):
     while day_of_year > month_lengths[month - 1]:
         day_of_year -= month_lengths[month - 1]
         month += 1
-    return {'month': month, 'day': day_of_year}
\ No newline at end of file
+    return {'month': month, 'day': day_of_year}
+
+# --- Day Number Helpers ---
+# Every calendar is mapped onto the Julian Day Number (JDN), a plain integer day count,
+# so conversions and weekday lookups reduce to a handful of integer operations.
+# The helpers only use integer operators, so they also work element-wise on NumPy arrays.
+
+def ethiopian_to_jdn(year, month, day):
+    """Converts an Ethiopian date to its Julian Day Number."""
+    return ETHIOPIAN_EPOCH_JDN - 1 + 365 * (year - 1) + year // 4 + 30 * (month - 1) + day
+
+def jdn_to_ethiopian(jdn):
+    """Converts a Julian Day Number to an Ethiopian (year, month, day) tuple."""
+    # Count from the start of year 0 so that each 4-year cycle ends with its leap year.
+    cycle, r = divmod(jdn - ETHIOPIAN_EPOCH_JDN + 365, 1461)
+    n = r % 365 + 365 * (r // 1460)
+    return 4 * cycle + r // 365 - r // 1460, n // 30 + 1, n % 30 + 1
+
+def gregorian_to_jdn(year, month, day):
+    """Converts a proleptic Gregorian date to its Julian Day Number."""
+    a = (14 - month) // 12
+    y = year + 4800 - a
+    m = month + 12 * a - 3
+    return day + (153 * m + 2) // 5 + 365 * y + y // 4 - y // 100 + y // 400 - 32045
+
+def jdn_to_gregorian(jdn):
+    """Converts a Julian Day Number to a proleptic Gregorian (year, month, day) tuple."""
+    a = jdn + 32044
+    b = (4 * a + 3) // 146097
+    c = a - 146097 * b // 4
+    d = (4 * c + 3) // 1461
+    e = c - 1461 * d // 4
+    m = (5 * e + 2) // 153
+    return 100 * b + d - 4800 + m // 10, m + 3 - 12 * (m // 10), e - (153 * m + 2) // 5 + 1
+
+def jdn_to_weekday(jdn):
+    """Returns the weekday (0=Sunday, 6=Saturday) of a Julian Day Number."""
+    return (jdn + 1) % 7
\ No newline at end of file